@@ -48,6 +48,8 @@ export default async function handler(req, res) {
     // 요청 헤더 준비
     const requestHeaders = {
       'User-Agent': 'Vercel-Proxy',
+      // 백엔드 → 프록시 구간도 압축 응답을 받음
+      'Accept-Encoding': 'br, gzip',
     };
     
     // Content-Type 헤더 복사
@@ -98,10 +100,14 @@ export default async function handler(req, res) {
     }
     
     // 응답 헤더 복사
+    // fetch가 gzip/br 본문을 자동으로 풀기 때문에 인코딩/길이 헤더는 복사하지 않음
+    // (복사하면 브라우저가 이미 풀린 본문을 다시 풀려다 실패)
+    const SKIP_HEADERS = ['content-encoding', 'content-length', 'transfer-encoding', 'connection'];
     const responseHeaders = {};
     response.headers.forEach((value, key) => {
+      const lowerKey = key.toLowerCase();
       // CORS 헤더는 제외 (우리가 직접 설정)
-      if (!key.toLowerCase().startsWith('access-control-')) {
+      if (!lowerKey.startsWith('access-control-') && !SKIP_HEADERS.includes(lowerKey)) {
         responseHeaders[key] = value;
       }
     });
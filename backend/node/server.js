@@ -71,6 +71,18 @@ FOREIGN_STOCK_DATA.forEach(stock => {
   }
 });
 
+// 파이썬 응답의 캐시 헤더를 그대로 전달 (브라우저/CDN이 엔드포인트별 정책대로 캐시)
+const FORWARDED_CACHE_HEADERS = ['cache-control', 'expires', 'vary'];
+const sendPythonResponse = (res, response) => {
+  FORWARDED_CACHE_HEADERS.forEach(name => {
+    const value = response.headers && response.headers[name];
+    if (value) {
+      res.setHeader(name, value);
+    }
+  });
+  return res.json(response.data);
+};
+
 // 한국 주식 심볼 코드 패턴 (6자리 숫자로 시작)
 const isKoreanStockSymbol = (query) => {
   return /^\d{6}$/.test(query) || query.includes('.KS') || query.includes('.KQ');
@@ -176,7 +188,7 @@ app.get('/api/stock/:query', async (req, res) => {
     if (isKoreanStockSymbol(query)) {
       // 한국 주식은 Python 서버로 전달
       const response = await axios.get(`${PYTHON_SERVER_URL}/api/kr-stock/${query}`);
-      return res.json(response.data);
+      return sendPythonResponse(res, response);
     } else {
       // 해외 주식 처리
       let symbol;
@@ -309,7 +321,7 @@ app.get('/api/stock/:query/chart', async (req, res) => {
     if (isKoreanStockSymbol(query)) {
       // 한국 주식 차트는 Python 서버로
       const response = await axios.get(`${PYTHON_SERVER_URL}/api/kr-stock/${query}/chart?period=${period}`);
-      return res.json(response.data);
+      return sendPythonResponse(res, response);
     } else {
       // 해외 주식 차트 (Yahoo Finance API 직접 호출)
       try {
@@ -374,7 +386,7 @@ app.get('/api/stock/:query/news', async (req, res) => {
     if (isKoreanStockSymbol(query)) {
       // 한국 주식 뉴스는 Python 서버로
       const response = await axios.get(`${PYTHON_SERVER_URL}/api/kr-stock/${query}/news`);
-      return res.json(response.data);
+      return sendPythonResponse(res, response);
     } else {
       // 해외 주식 심볼 변환 (한글 이름 → 티커)
       const convertedSymbol = convertToForeignSymbol(query);
@@ -409,7 +421,7 @@ app.get('/api/stock/:query/news', async (req, res) => {
       
       // 해외 주식 뉴스는 Python 서버로
       const response = await axios.get(`${PYTHON_SERVER_URL}/api/stock/${symbol}/news`);
-      return res.json(response.data);
+      return sendPythonResponse(res, response);
     }
   } catch (error) {
     console.error('뉴스 조회 오류:', error);
@@ -429,12 +441,12 @@ app.get('/api/stock/:query/financials', async (req, res) => {
     if (isKoreanStockSymbol(query)) {
       // 한국 주식 재무제표는 Python 서버로
       const response = await axios.get(`${PYTHON_SERVER_URL}/api/kr-stock/${query}/financials`);
-      return res.json(response.data);
+      return sendPythonResponse(res, response);
     } else {
       // 해외 주식 재무제표는 Python 서버로
       const symbol = query.toUpperCase();
       const response = await axios.get(`${PYTHON_SERVER_URL}/api/stock/${symbol}/financials`);
-      return res.json(response.data);
+      return sendPythonResponse(res, response);
     }
   } catch (error) {
     console.error('재무제표 조회 오류:', error);
@@ -0,0 +1,194 @@
+"""
+기사 디스크 캐시 (cache/articles).
+
+정규화된 URL의 SHA-256을 키로 추출된 제목/본문/발행일(및 네이버 언론사명)을 저장한다.
+- 신선 기간(ARTICLE_CACHE_FRESH_SEC) 안에는 네트워크 요청 없이 그대로 사용
+- 신선 기간이 지나면 ETag / Last-Modified 조건부 요청으로 재검증 (304면 재사용)
+- 전체 용량이 ARTICLE_CACHE_MAX_BYTES를 넘으면 오래된 항목부터 삭제
+여러 워커 프로세스가 같은 디렉토리를 공유하므로 파일 쓰기는 임시 파일 + os.replace로 원자적으로 수행한다.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+CACHE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'cache')
+ARTICLE_CACHE_DIR = os.getenv("ARTICLE_CACHE_DIR", os.path.join(CACHE_ROOT, 'articles'))
+ARTICLE_CACHE_FRESH_SEC = int(os.getenv("ARTICLE_CACHE_FRESH_SEC", str(24 * 3600)))
+ARTICLE_CACHE_MAX_AGE_SEC = int(os.getenv("ARTICLE_CACHE_MAX_AGE_SEC", str(7 * 24 * 3600)))
+ARTICLE_CACHE_MAX_BYTES = int(os.getenv("ARTICLE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# URL 정규화 시 제거할 추적용 파라미터
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "cmpid", "ncid", "ito", "spm", "from", "rss",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+
+def canonical_url(url: str) -> str:
+    """캐시/중복 판단용 URL 정규화 (스킴·호스트 소문자, 프래그먼트·추적 파라미터 제거, 파라미터 정렬)"""
+    if not url:
+        return ""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if host.endswith(":80") or host.endswith(":443"):
+        host = host.rsplit(":", 1)[0]
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/")
+    return urlunsplit(("https" if parts.scheme in ("http", "https") else parts.scheme.lower(), host, path, urlencode(query), ""))
+
+
+class ArticleCache:
+    """URL 단위 기사 캐시 (JSON 파일 1개 = 기사 1건)"""
+
+    def __init__(self, directory: str = ARTICLE_CACHE_DIR, max_bytes: int = ARTICLE_CACHE_MAX_BYTES,
+                 fresh_sec: int = ARTICLE_CACHE_FRESH_SEC, max_age_sec: int = ARTICLE_CACHE_MAX_AGE_SEC):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.fresh_sec = fresh_sec
+        self.max_age_sec = max_age_sec
+        self._lock = threading.Lock()
+        self._approx_bytes: Optional[int] = None
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        return hashlib.sha256(canonical_url(url).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """캐시 항목 반환 (없거나 최대 보관 기간이 지났으면 None)"""
+        path = self._path(self.key_for(url))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - float(entry.get("fetched_at") or 0) > self.max_age_sec:
+            return None
+        return entry
+
+    def is_fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        if not entry:
+            return False
+        return time.time() - float(entry.get("fetched_at") or 0) <= self.fresh_sec
+
+    def put(self, url: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """항목 저장. 기존 항목이 있으면 필드를 병합하고 fetched_at을 갱신"""
+        key = self.key_for(url)
+        path = self._path(key)
+        entry = self.get(url) or {}
+        entry.update({k: v for k, v in fields.items() if v is not None})
+        entry["url"] = entry.get("url") or url
+        entry["canonical_url"] = canonical_url(url)
+        entry["fetched_at"] = time.time()
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            print(f"[WARN] 기사 캐시 저장 실패: {exc}")
+            return entry
+        # 덮어쓰기 / touch는 기존 파일 크기만큼 빼서 차이만 반영
+        self._account(len(data) - old_size)
+        return entry
+
+    def touch(self, url: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """304 재검증 성공 시 신선 기간 연장"""
+        return self.put(url, {k: v for k, v in entry.items() if k != "fetched_at"})
+
+    def _account(self, delta: int) -> None:
+        with self._lock:
+            if self._approx_bytes is None:
+                # 첫 계산은 디스크 스캔 (방금 쓴 파일 포함)
+                self._approx_bytes = self._scan_size()
+            else:
+                self._approx_bytes = max(0, self._approx_bytes + delta)
+            over = self._approx_bytes > self.max_bytes
+        if over:
+            self.evict()
+
+    def _scan_size(self) -> int:
+        total = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    continue
+        return total
+
+    def evict(self, target_ratio: float = 0.8) -> int:
+        """용량 초과 시 수정 시각이 오래된 항목부터 삭제하여 max_bytes * target_ratio 이하로 축소"""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * target_ratio)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        with self._lock:
+            self._approx_bytes = total
+        if removed:
+            print(f"[INFO] 기사 캐시 정리: {removed}개 삭제 (현재 {total / 1024 / 1024:.1f}MB)")
+        return removed
+
+
+def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """캐시 항목의 ETag / Last-Modified로 조건부 요청 헤더 생성"""
+    headers: Dict[str, str] = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+article_cache = ArticleCache()
+
+
+__all__ = [
+    "ArticleCache",
+    "article_cache",
+    "canonical_url",
+    "conditional_headers",
+]
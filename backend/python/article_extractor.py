@@ -0,0 +1,263 @@
+"""
+뉴스 HTML 본문 추출 엔진 (프로세스 풀).
+
+lxml 파싱과 대용량 HTML 정규식 검색은 GIL을 잡는 CPU 작업이므로 별도 프로세스에서 수행해
+같은 Flask 워커의 시세/차트 요청이 지연되지 않도록 한다.
+
+- 빠른 경로: lxml로 문단(<p>) 텍스트 밀도가 가장 높은 블록을 본문으로 선택
+- 느린 경로: 빠른 경로 결과가 부족할 때만 newspaper3k로 파싱
+- 반환값: {title, text, published, method} 형태의 작은 dict
+"""
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import lxml.html
+
+ARTICLE_EXTRACT_MODE = os.getenv("ARTICLE_EXTRACT_MODE", "process").strip().lower()  # process | inline
+ARTICLE_EXTRACT_WORKERS = int(os.getenv("ARTICLE_EXTRACT_WORKERS", str(min(2, os.cpu_count() or 1))))
+ARTICLE_EXTRACT_TIMEOUT = float(os.getenv("ARTICLE_EXTRACT_TIMEOUT", "8"))
+ARTICLE_EXTRACT_START_METHOD = os.getenv(
+    "ARTICLE_EXTRACT_START_METHOD",
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn",
+)
+
+MIN_ARTICLE_TEXT = 200
+MAX_PRESS_HTML = 200000
+
+# 언론사 추정 패턴 (네이버 기사 페이지 메타). 앞의 PRESS_AUTHORITATIVE_PATTERNS개는 언론사 전용 메타,
+# 나머지(aria-label 등)는 다른 요소와 겹칠 수 있는 약한 단서
+PRESS_AUTHORITATIVE_PATTERNS = 2
+PRESS_META_PATTERNS = [
+    re.compile(r'property=["\']og:article:author["\']\s+content=["\']([^"\']{2,20})["\']', re.I),
+    re.compile(r'data-office-name=["\']([^"\']{2,20})["\']', re.I),
+    re.compile(r'aria-label=["\']([^"\']{2,20})["\']', re.I),
+    re.compile(r'"press_logo"[^>]*alt=["\']([^"\']{2,20})["\']', re.I),
+]
+
+_BOILERPLATE_TAGS = (
+    "script", "style", "noscript", "nav", "header", "footer", "aside",
+    "form", "iframe", "button", "svg", "figure", "figcaption",
+)
+_MIN_PARAGRAPH = 25
+_MAX_LINK_DENSITY = 0.5
+_PUBLISHED_META = (
+    "article:published_time",
+    "og:article:published_time",
+    "og:regDate",
+    "pubdate",
+    "publishdate",
+    "date",
+)
+_WS = re.compile(r"[ \t\r\f\v]+")
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_pool_disabled = ARTICLE_EXTRACT_MODE != "process"
+_pool_failures = 0
+_MAX_POOL_FAILURES = 3
+
+
+# ---------------------------------------------------------------------------
+# 추출 로직 (워커 프로세스에서 실행, 모듈 최상위 함수여야 pickle 가능)
+# ---------------------------------------------------------------------------
+
+def _parse_document(html: str):
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # 인코딩 선언이 포함된 문자열은 bytes로 넘겨야 파싱됨
+        return lxml.html.document_fromstring(html.encode("utf-8", "ignore"))
+
+
+def _meta_content(doc, *names: str) -> Optional[str]:
+    for name in names:
+        for attr in ("property", "name", "itemprop"):
+            values = doc.xpath(f'//meta[@{attr}=$n]/@content', n=name)
+            if values and values[0].strip():
+                return values[0].strip()
+    return None
+
+
+def _clean_text(text: str) -> str:
+    return _WS.sub(" ", text or "").strip()
+
+
+def _paragraph_score(el) -> int:
+    """문단 텍스트 길이에서 링크 텍스트를 뺀 점수 (짧거나 링크 위주면 0)"""
+    text = _clean_text(el.text_content())
+    if len(text) < _MIN_PARAGRAPH:
+        return 0
+    link_len = sum(len(_clean_text(a.text_content())) for a in el.iter("a"))
+    if link_len > len(text) * _MAX_LINK_DENSITY:
+        return 0
+    return len(text) - link_len
+
+
+def _fast_extract(html: str) -> Dict[str, Any]:
+    doc = _parse_document(html)
+    title = _meta_content(doc, "og:title", "twitter:title") or _clean_text(doc.findtext(".//title") or "")
+    published = _meta_content(doc, *_PUBLISHED_META)
+    if not published:
+        times = doc.xpath("//time/@datetime")
+        published = times[0].strip() if times else None
+
+    for el in list(doc.iter(*_BOILERPLATE_TAGS)):
+        if el.getparent() is not None:
+            el.drop_tree()
+
+    # 문단 점수를 부모(전체)와 조부모(절반)에 누적하여 본문 블록 선택
+    block_scores: Dict[Any, float] = {}
+    for p in doc.iter("p"):
+        score = _paragraph_score(p)
+        if not score:
+            continue
+        parent = p.getparent()
+        if parent is None:
+            continue
+        block_scores[parent] = block_scores.get(parent, 0) + score
+        grand = parent.getparent()
+        if grand is not None:
+            block_scores[grand] = block_scores.get(grand, 0) + score / 2
+
+    text = ""
+    if block_scores:
+        best = max(block_scores, key=block_scores.get)
+        paragraphs = [_clean_text(p.text_content()) for p in best.iter("p") if _paragraph_score(p)]
+        text = "\n\n".join(paragraphs)
+    else:
+        # <p> 없이 <br>로 문단을 나누는 사이트: 텍스트가 가장 긴 div
+        best_div, best_len = None, 0
+        for div in doc.iter("div", "article", "section"):
+            own = _clean_text(" ".join(t for t in div.xpath("./text()")))
+            if len(own) > best_len:
+                best_div, best_len = div, len(own)
+        if best_div is not None:
+            text = "\n".join(
+                line for line in (_clean_text(t) for t in best_div.xpath("./text()")) if line
+            )
+
+    return {"title": title or "", "text": text, "published": published, "method": "lxml"}
+
+
+def _newspaper_extract(html: str, url: str) -> Dict[str, Any]:
+    from newspaper import Article
+
+    article = Article(url)
+    article.set_html(html)
+    article.parse()
+    published = article.publish_date.isoformat() if article.publish_date else None
+    return {"title": article.title or "", "text": article.text or "", "published": published, "method": "newspaper"}
+
+
+def extract_article_record(html: str, url: str) -> Dict[str, Any]:
+    """HTML에서 기사 레코드 추출 (빠른 경로 실패 시 newspaper 폴백)"""
+    record: Dict[str, Any] = {"title": "", "text": "", "published": None, "method": "lxml"}
+    try:
+        record = _fast_extract(html)
+    except Exception:
+        pass
+    if len(record.get("text") or "") >= MIN_ARTICLE_TEXT:
+        return record
+    try:
+        fallback = _newspaper_extract(html, url)
+    except Exception:
+        return record
+    if not fallback.get("title"):
+        fallback["title"] = record.get("title") or ""
+    if not fallback.get("published"):
+        fallback["published"] = record.get("published")
+    return fallback
+
+
+def extract_press_match(html: str) -> Tuple[Optional[str], bool]:
+    """네이버 기사 HTML에서 (언론사명, 언론사 전용 메타에서 찾았는지)"""
+    text = (html or "")[:MAX_PRESS_HTML]
+    for index, pat in enumerate(PRESS_META_PATTERNS):
+        m = pat.search(text)
+        if m:
+            return re.sub(r"[\s\u200b]+", "", m.group(1).strip()), index < PRESS_AUTHORITATIVE_PATTERNS
+    return None, False
+
+
+def extract_press_name(html: str) -> Optional[str]:
+    """네이버 기사 HTML에서 언론사명 추출"""
+    return extract_press_match(html)[0]
+
+
+# ---------------------------------------------------------------------------
+# 프로세스 풀 실행
+# ---------------------------------------------------------------------------
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool, _pool_disabled
+    if _pool_disabled:
+        return None
+    with _pool_lock:
+        if _pool is None and not _pool_disabled:
+            try:
+                ctx = multiprocessing.get_context(ARTICLE_EXTRACT_START_METHOD)
+                _pool = ProcessPoolExecutor(max_workers=max(1, ARTICLE_EXTRACT_WORKERS), mp_context=ctx)
+                print(f'[OK] 기사 추출 프로세스 풀 생성 (workers={ARTICLE_EXTRACT_WORKERS}, {ARTICLE_EXTRACT_START_METHOD})')
+            except Exception as exc:
+                # 서버리스 등 프로세스 생성이 불가능한 환경에서는 인라인 처리
+                print(f'[WARN] 기사 추출 프로세스 풀 생성 실패, 인라인 처리로 전환: {exc}')
+                _pool_disabled = True
+        return _pool
+
+
+def _reset_pool() -> None:
+    """손상된 풀 폐기. 반복 실패 시 인라인 처리로 전환"""
+    global _pool, _pool_failures, _pool_disabled
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_failures += 1
+        if _pool_failures >= _MAX_POOL_FAILURES:
+            print(f'[WARN] 기사 추출 프로세스 풀 {_pool_failures}회 손상, 인라인 처리로 전환')
+            _pool_disabled = True
+
+
+def _run(fn: Callable[..., Any], *args: Any, timeout: float = ARTICLE_EXTRACT_TIMEOUT, default: Any = None) -> Any:
+    """프로세스 풀에서 실행. 시간 초과 시 추출 실패와 같이 default 반환"""
+    pool = _get_pool()
+    if pool is None:
+        return fn(*args)
+    future = pool.submit(fn, *args)
+    try:
+        return future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        # 이미 실행 중인 작업은 중단할 수 없으므로 결과만 버림 (대기 중이면 취소)
+        future.cancel()
+        print(f'[WARN] 기사 추출 시간 초과 ({timeout:g}초): {fn.__name__}')
+        return default
+    except BrokenProcessPool as exc:
+        print(f'[WARN] 기사 추출 프로세스 풀 손상: {exc}')
+        _reset_pool()
+        return fn(*args)
+
+
+def extract_article(html: str, url: str, timeout: float = ARTICLE_EXTRACT_TIMEOUT) -> Dict[str, Any]:
+    """기사 레코드 추출 (프로세스 풀 사용)"""
+    empty = {"title": "", "text": "", "published": None, "method": "timeout"}
+    return _run(extract_article_record, html, url, timeout=timeout, default=empty)
+
+
+def extract_press(html: str, timeout: float = ARTICLE_EXTRACT_TIMEOUT) -> Optional[str]:
+    """언론사명 추출 (프로세스 풀 사용)"""
+    return _run(extract_press_name, (html or "")[:MAX_PRESS_HTML], timeout=timeout)
+
+
+__all__ = [
+    "PRESS_META_PATTERNS",
+    "extract_article",
+    "extract_article_record",
+    "extract_press",
+    "extract_press_match",
+    "extract_press_name",
+]
@@ -0,0 +1,185 @@
+"""
+뉴스 기사 본문 병렬 수집기.
+
+기사 URL 목록을 스레드 풀로 동시에 내려받고 파싱한다.
+- 호스트별 동시 연결 수 제한 (한 언론사에 요청이 몰리지 않도록)
+- 전체 마감 시간(deadline): 느린 언론사가 있어도 전체 지연은 deadline을 넘지 않음
+- 파싱은 article_extractor 프로세스 풀에서 수행하고, 결과는 작은 dict로 반환
+- article_cache에 신선한 항목이 있으면 다운로드하지 않음
+- USE_ASYNC_PIPELINES=1이면 다운로드를 asyncio(httpx)로 수행 (async_pipelines)
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+try:
+    from .article_extractor import extract_article
+    from .article_cache import article_cache, conditional_headers
+    from .http_client import http_session
+    from .async_pipelines import async_enabled, iter_async, iter_pages_async
+except ImportError:
+    from article_extractor import extract_article  # type: ignore
+    from article_cache import article_cache, conditional_headers  # type: ignore
+    from http_client import http_session  # type: ignore
+    from async_pipelines import async_enabled, iter_async, iter_pages_async  # type: ignore
+
+ARTICLE_FETCH_WORKERS = int(os.getenv("ARTICLE_FETCH_WORKERS", "10"))
+ARTICLE_FETCH_PER_HOST = int(os.getenv("ARTICLE_FETCH_PER_HOST", "2"))
+ARTICLE_FETCH_TIMEOUT = float(os.getenv("ARTICLE_FETCH_TIMEOUT", "10"))
+ARTICLE_FETCH_DEADLINE_SEC = float(os.getenv("ARTICLE_FETCH_DEADLINE_SEC", "12"))
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7'
+}
+
+
+class _HostLimiter:
+    """호스트별 동시 요청 수 제한"""
+
+    def __init__(self, per_host: int):
+        self._per_host = max(1, per_host)
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self._per_host)
+                self._semaphores[host] = sem
+            return sem
+
+
+def fetch_article(url: str, headers: Optional[Dict[str, str]] = None, timeout: float = ARTICLE_FETCH_TIMEOUT) -> Dict[str, Any]:
+    """기사 1건을 {url, title, text, published} 레코드로 반환 (캐시 우선, 실패 시 예외)"""
+    cached = article_cache.get(url)
+    if cached and cached.get('text') and article_cache.is_fresh(cached):
+        return _to_record(url, cached)
+
+    r = http_session.get(url, headers=_request_headers(cached, headers), timeout=timeout)
+    return _response_to_record(url, cached, r)
+
+
+def _request_headers(cached: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    req_headers = dict(headers or DEFAULT_HEADERS)
+    if cached and cached.get('text'):
+        req_headers.update(conditional_headers(cached))
+    return req_headers
+
+
+def _response_to_record(url: str, cached: Optional[Dict[str, Any]], r: Any) -> Dict[str, Any]:
+    """응답(requests / httpx) → 레코드 (304면 캐시 갱신, 새 본문이면 캐시에 저장)"""
+    if r.status_code == 304 and cached and cached.get('text'):
+        return _to_record(url, article_cache.touch(url, cached))
+    r.raise_for_status()
+    # 파싱은 프로세스 풀에서 수행 (이 스레드는 결과만 기다리며 GIL을 놓음)
+    record = extract_article(r.text, url)
+    if record.get('text'):
+        article_cache.put(url, {
+            'title': record.get('title') or '',
+            'text': record.get('text') or '',
+            'published': record.get('published'),
+            'etag': r.headers.get('ETag'),
+            'last_modified': r.headers.get('Last-Modified'),
+        })
+    return _to_record(url, record)
+
+
+def _to_record(url: str, source: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'url': url,
+        'title': source.get('title') or '',
+        'text': source.get('text') or '',
+        'published': source.get('published'),
+    }
+
+
+def iter_fetched_articles(
+    items: Iterable[Dict[str, Any]],
+    url_key: str = 'url',
+    headers: Optional[Dict[str, str]] = None,
+    max_workers: int = ARTICLE_FETCH_WORKERS,
+    per_host: int = ARTICLE_FETCH_PER_HOST,
+    deadline_sec: float = ARTICLE_FETCH_DEADLINE_SEC,
+) -> Iterator[Tuple[int, Dict[str, Any], Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    기사 목록을 병렬로 수집하여 완료되는 순서대로 반환.
+
+    Yields:
+        (원본 인덱스, 원본 item, 레코드 또는 None, 예외 또는 None)
+    deadline_sec 안에 끝나지 않은 기사는 건너뛴다.
+    """
+    indexed = [(idx, item) for idx, item in enumerate(items) if item.get(url_key)]
+    if not indexed:
+        return
+
+    if async_enabled():
+        yield from _iter_fetched_articles_async(indexed, url_key, headers, per_host, deadline_sec)
+        return
+
+    limiter = _HostLimiter(per_host)
+    started = time.monotonic()
+
+    def _task(url: str) -> Dict[str, Any]:
+        with limiter.get(url):
+            # 호스트 대기 중에 마감 시간이 지났으면 요청하지 않음
+            remaining = deadline_sec - (time.monotonic() - started)
+            if remaining <= 0:
+                raise TimeoutError("article fetch deadline exceeded")
+            return fetch_article(url, headers=headers, timeout=min(ARTICLE_FETCH_TIMEOUT, remaining))
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(indexed))))
+    try:
+        futures = {executor.submit(_task, item[url_key]): (idx, item) for idx, item in indexed}
+        try:
+            for future in as_completed(futures, timeout=deadline_sec):
+                idx, item = futures[future]
+                try:
+                    yield idx, item, future.result(), None
+                except Exception as exc:
+                    yield idx, item, None, exc
+        except FuturesTimeoutError:
+            pending = sum(1 for f in futures if not f.done())
+            print(f"[WARN] 기사 수집 마감 시간({deadline_sec:.0f}초) 초과, 미완료 {pending}개 건너뜀")
+    finally:
+        # 남은 작업은 기다리지 않음 (실행 중인 요청은 각자의 timeout으로 종료)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+
+def _iter_fetched_articles_async(indexed, url_key, headers, per_host, deadline_sec):
+    """iter_fetched_articles의 asyncio 경로 (다운로드는 이벤트 루프, 파싱은 호출 스레드)"""
+    pending = []
+    for idx, item in indexed:
+        url = item[url_key]
+        cached = article_cache.get(url)
+        if cached and cached.get('text') and article_cache.is_fresh(cached):
+            yield idx, item, _to_record(url, cached), None
+        else:
+            pending.append((idx, item, cached))
+    if not pending:
+        return
+
+    by_idx = {idx: (item, cached) for idx, item, cached in pending}
+    requests_list = [(idx, item[url_key], _request_headers(cached, headers)) for idx, item, cached in pending]
+    for idx, resp, exc in iter_async(iter_pages_async(requests_list, per_host, deadline_sec)):
+        item, cached = by_idx[idx]
+        if exc is not None:
+            yield idx, item, None, exc
+            continue
+        try:
+            yield idx, item, _response_to_record(item[url_key], cached, resp), None
+        except Exception as e:
+            yield idx, item, None, e
+
+
+__all__ = [
+    "DEFAULT_HEADERS",
+    "fetch_article",
+    "iter_fetched_articles",
+]
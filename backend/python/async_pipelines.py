@@ -0,0 +1,302 @@
+"""
+팬아웃 작업용 asyncio 실행 경로 (httpx.AsyncClient, 가능하면 HTTP/2).
+
+DART 분기 조회(최대 16건), 네이버 검색 페이지, 기사 본문 다운로드처럼 느린 외부 요청을
+동시에 많이 보내는 작업을 스레드 대신 이벤트 루프 하나에서 처리한다.
+- 필요한 개수가 모이면 남은 요청을 실제로 취소 (ThreadPoolExecutor의 future.cancel()은
+  이미 실행 중인 작업을 멈추지 못함)
+- 동기 Flask 뷰: run_async(coro) / iter_async(async_gen)로 프로세스 공용 백그라운드 루프에서 실행
+- async 뷰 / ASGI 어댑터: 코루틴을 그대로 await
+
+USE_ASYNC_PIPELINES=1이고 httpx가 설치된 경우에만 사용된다 (pip install -r requirements-async.txt).
+"""
+import asyncio
+import concurrent.futures
+import inspect
+import os
+import queue
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+from urllib.parse import urlparse
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:  # 선택 의존성
+    httpx = None  # type: ignore
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (httpx HTTP/2 지원 여부 확인용)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    from .rate_limiter import RateLimiter
+except ImportError:
+    from rate_limiter import RateLimiter  # type: ignore
+
+USE_ASYNC_PIPELINES = os.getenv("USE_ASYNC_PIPELINES", "0").lower() in ("1", "true", "yes")
+ASYNC_MAX_CONNECTIONS = int(os.getenv("ASYNC_MAX_CONNECTIONS", "100"))
+ASYNC_MAX_KEEPALIVE = int(os.getenv("ASYNC_MAX_KEEPALIVE", "20"))
+ASYNC_CONNECT_TIMEOUT = float(os.getenv("ASYNC_CONNECT_TIMEOUT", "3.05"))
+ASYNC_READ_TIMEOUT = float(os.getenv("ASYNC_READ_TIMEOUT", "15"))
+
+DART_FINANCIALS_URL = "https://opendart.fss.or.kr/api/fnlttSinglAcnt.json"
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_client: Optional["httpx.AsyncClient"] = None
+
+
+def async_enabled() -> bool:
+    return USE_ASYNC_PIPELINES and HTTPX_AVAILABLE
+
+
+# ---------------------------------------------------------------------------
+# 이벤트 루프 / 클라이언트
+# ---------------------------------------------------------------------------
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """프로세스 공용 백그라운드 이벤트 루프 (최초 호출 시 데몬 스레드에서 시작)"""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="async-pipelines", daemon=True)
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+def get_async_client() -> "httpx.AsyncClient":
+    """공용 AsyncClient (루프 스레드 안에서만 사용)"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=ASYNC_MAX_CONNECTIONS, max_keepalive_connections=ASYNC_MAX_KEEPALIVE),
+            timeout=httpx.Timeout(ASYNC_READ_TIMEOUT, connect=ASYNC_CONNECT_TIMEOUT),
+            follow_redirects=True,
+        )
+    return _client
+
+
+def run_async(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """동기 코드에서 코루틴 실행 (timeout 초과 시 코루틴을 취소하고 TimeoutError)"""
+    future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    try:
+        return future.result(timeout=timeout)
+    except Exception:
+        future.cancel()
+        raise
+
+
+def submit_async(coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+    """코루틴을 백그라운드 루프에 제출하고 concurrent.futures.Future 반환 (cancel() 시 실행 중인 요청도 취소)"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop())
+
+
+def iter_async(agen: AsyncIterator[T]) -> Iterator[T]:
+    """비동기 제너레이터를 동기 이터레이터로 변환 (소비를 중단하면 생성 측 작업도 취소)"""
+    q: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+
+    async def _pump() -> None:
+        try:
+            async for item in agen:
+                q.put(("item", item))
+        except Exception as exc:
+            q.put(("error", exc))
+        finally:
+            q.put(("done", None))
+
+    future = asyncio.run_coroutine_threadsafe(_pump(), _get_loop())
+    try:
+        while True:
+            kind, value = q.get()
+            if kind == "item":
+                yield value
+            elif kind == "error":
+                raise value
+            else:
+                return
+    finally:
+        future.cancel()
+
+
+async def acquire_async(limiter: RateLimiter) -> None:
+    """스레드용 토큰 버킷을 이벤트 루프를 막지 않고 대기"""
+    while not limiter.acquire(timeout=0):
+        await asyncio.sleep(1.0 / limiter.rate)
+
+
+# ---------------------------------------------------------------------------
+# 공용 팬아웃 도구
+# ---------------------------------------------------------------------------
+
+async def gather_until(
+    coros: Iterable[Awaitable[Optional[T]]],
+    enough: Callable[[List[T]], bool],
+    concurrency: int = 16,
+) -> List[T]:
+    """
+    코루틴을 동시에 실행하며 완료 순서대로 None이 아닌 결과를 모으고,
+    enough(결과 목록)가 True가 되면 나머지 요청을 취소한다.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _bounded(coro: Awaitable[Optional[T]]) -> Optional[T]:
+        async with semaphore:
+            return await coro
+
+    coros = list(coros)
+    tasks = [asyncio.ensure_future(_bounded(c)) for c in coros]
+    results: List[T] = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                result = await next_done
+            except Exception:
+                continue
+            if result is not None:
+                results.append(result)
+                if enough(results):
+                    break
+    finally:
+        pending = [t for t in tasks if not t.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        # 시작도 못 하고 취소된 코루틴 정리 (never awaited 경고 방지)
+        for coro in coros:
+            if inspect.iscoroutine(coro) and inspect.getcoroutinestate(coro) == inspect.CORO_CREATED:
+                coro.close()
+    return results
+
+
+async def get_json_async(url: str, params: Optional[Dict[str, Any]] = None,
+                         headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> Any:
+    resp = await get_async_client().get(url, params=params, headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    return resp.json()
+
+
+# ---------------------------------------------------------------------------
+# 파이프라인
+# ---------------------------------------------------------------------------
+
+async def fetch_dart_quarters_async(
+    api_key: str,
+    corp_code: str,
+    tasks: Iterable[Tuple[int, str, int, str]],
+    parse: Callable[[Dict[str, Any], int, str, int, str], Optional[Dict[str, Any]]],
+    need: int = 4,
+    exclude: Iterable[Tuple[int, int]] = (),
+) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """
+    DART 분기 재무 조회를 동시에 실행하여 서로 다른 (연도, 분기) need개가 모이면 나머지를 취소.
+
+    tasks: (연도, 보고서 코드, 분기, CFS/OFS) 목록
+    parse: DART 응답 JSON → 분기 데이터 dict (없으면 None)
+    """
+    excluded = set(exclude)
+
+    async def _one(year: int, reprt_code: str, quarter: int, fs_div: str) -> Optional[Dict[str, Any]]:
+        params = {
+            'crtfc_key': api_key,
+            'corp_code': corp_code,
+            'bsns_year': str(year),
+            'reprt_code': reprt_code,
+            'fs_div': fs_div,
+        }
+        try:
+            data = await get_json_async(DART_FINANCIALS_URL, params=params)
+        except Exception:
+            return None
+        result = parse(data, year, reprt_code, quarter, fs_div)
+        if result is None or (result['year'], result['quarter']) in excluded:
+            return None
+        return result
+
+    def _enough(results: List[Dict[str, Any]]) -> bool:
+        return len({(r['year'], r['quarter']) for r in results}) >= need
+
+    results = await gather_until([_one(*task) for task in tasks], _enough)
+    collected: Dict[Tuple[int, int], Dict[str, Any]] = {}
+    for result in results:
+        collected.setdefault((result['year'], result['quarter']), result)
+    return collected
+
+
+async def fetch_naver_page_async(
+    url: str,
+    params: Dict[str, Any],
+    headers: Dict[str, str],
+    limiter: Optional[RateLimiter] = None,
+) -> List[Dict[str, Any]]:
+    """네이버 검색 API 1페이지 요청 (실패 시 [])"""
+    if limiter is not None:
+        await acquire_async(limiter)
+    try:
+        resp = await get_async_client().get(url, params=params, headers=headers, timeout=10)
+        if resp.status_code == 429:
+            print("[WARN] 네이버 API 호출 제한 도달 (429)")
+            return []
+        resp.raise_for_status()
+        return resp.json().get("items", [])
+    except Exception as exc:
+        print(f"[ERROR] 네이버 API 호출 실패: {exc}")
+        return []
+
+
+async def iter_pages_async(
+    requests_list: List[Tuple[int, str, Dict[str, str]]],
+    per_host: int,
+    deadline_sec: float,
+) -> AsyncIterator[Tuple[int, Any, Optional[Exception]]]:
+    """
+    기사 페이지를 동시에 내려받아 완료 순서대로 (인덱스, 응답, 예외)를 반환.
+    호스트별 동시 연결 수를 제한하고, deadline_sec이 지나면 남은 다운로드를 취소한다.
+    """
+    host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def _one(idx: int, url: str, headers: Dict[str, str]) -> Tuple[int, Any, Optional[Exception]]:
+        host = urlparse(url).netloc.lower()
+        semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(max(1, per_host)))
+        async with semaphore:
+            try:
+                return idx, await get_async_client().get(url, headers=headers), None
+            except Exception as exc:
+                return idx, None, exc
+
+    tasks = [asyncio.ensure_future(_one(*req)) for req in requests_list]
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=deadline_sec):
+            yield await next_done
+    except asyncio.TimeoutError:
+        pending = sum(1 for t in tasks if not t.done())
+        print(f"[WARN] 기사 수집 마감 시간({deadline_sec:.0f}초) 초과, 미완료 {pending}개 취소")
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+__all__ = [
+    "HTTP2_AVAILABLE",
+    "HTTPX_AVAILABLE",
+    "USE_ASYNC_PIPELINES",
+    "async_enabled",
+    "fetch_dart_quarters_async",
+    "fetch_naver_page_async",
+    "gather_until",
+    "get_async_client",
+    "iter_async",
+    "iter_pages_async",
+    "run_async",
+    "submit_async",
+]
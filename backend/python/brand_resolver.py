@@ -0,0 +1,378 @@
+"""
+Vision 로고 / OCR 텍스트 → 상장사 로컬 매칭 (Gemini 식별 호출 생략).
+
+Vision 요약(_summarize_vision_response)의 로고와 OCR 토큰이 상장사 이름이나 알려진 브랜드와
+정확히 일치하면 Gemini에 묻지 않고 회사 / 거래소 / 티커를 바로 채운다.
+확실하지 않은 OCR 일치는 힌트로만 돌려주고 Gemini가 제품과의 관련 여부를 판단한다.
+- 색인: 브랜드 별칭(영문명·대표 브랜드 → 법인, BRAND_ALIASES_PATH JSON으로 추가) + 상장사 목록(KRX 등)
+  상장사 목록은 register_listing_provider로 등록한 함수에서 가져와 BRAND_INDEX_REFRESH_SEC마다
+  백그라운드에서 다시 만든다 (조회는 네트워크를 기다리지 않음)
+- 로고: Vision 점수 BRAND_MIN_LOGO_SCORE 이상이고 이름 전체가 일치할 때
+- OCR: 1~3개 연속 토큰이 이름 전체와 일치할 때 (부분 문자열 매칭은 하지 않음).
+  일반 단어와 겹치는 이름("사용 대상 연령", "남성 전용", "APPLE JUICE")이 많아 다음 경우만 확정한다
+  · 일반 단어가 아닌 브랜드 별칭 (apple, amazon, kia 등 LOGO_ONLY_BRANDS는 로고로만 확정)
+  · 정규화 후 BRAND_OCR_MIN_NAME_LEN자 이상인 상장사명, 또는 "(주)" 등 법인 표기가 붙은 상장사명
+  그 밖의 일치는 confident=False 힌트. 확정 후보가 여러 회사면 Gemini에 넘긴다
+- 같은 이름을 여러 회사가 쓰는 경우(예: LG, 현대)는 모호한 이름으로 보고 Gemini에 넘긴다
+"""
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+try:
+    from .company_matcher import company_name_variants, has_corporate_marker, normalize_company_text
+except ImportError:
+    from company_matcher import company_name_variants, has_corporate_marker, normalize_company_text  # type: ignore
+
+BRAND_RESOLVER_ENABLED = os.getenv("BRAND_RESOLVER_ENABLED", "1").lower() in ("1", "true", "yes")
+BRAND_MIN_LOGO_SCORE = float(os.getenv("BRAND_MIN_LOGO_SCORE", "0.5"))
+# OCR 토큰만으로 상장사를 확정할 최소 이름 길이 (정규화 후 글자 수, 법인 표기가 있으면 길이 무관)
+BRAND_OCR_MIN_NAME_LEN = int(os.getenv("BRAND_OCR_MIN_NAME_LEN", "4"))
+BRAND_INDEX_REFRESH_SEC = float(os.getenv("BRAND_INDEX_REFRESH_SEC", "3600"))
+BRAND_INDEX_RETRY_SEC = 60.0
+BRAND_ALIASES_PATH = os.getenv(
+    "BRAND_ALIASES_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "brand_aliases.json"),
+)
+_OCR_MAX_NGRAM = 3
+_OCR_MAX_TOKENS = 80
+# 이보다 짧은 상장사명은 OCR 힌트로도 쓰지 않음
+_OCR_HINT_MIN_NAME_LEN = 2
+# 영문 상장사명(예: KT, GS)은 일반 단어와 겹치기 쉬워 OCR 매칭 시 더 긴 이름만 사용
+_OCR_MIN_ASCII_NAME_LEN = 4
+
+# 그룹명처럼 여러 상장 계열사가 쓰는 이름 → 로컬에서 정하지 않고 Gemini에 넘김
+AMBIGUOUS_BRANDS = {
+    "lg", "sk", "gs", "cj", "ls", "hyundai", "현대", "lotte", "롯데", "hanwha", "한화",
+    "doosan", "두산", "posco", "포스코", "shinsegae", "신세계", "kumho", "금호",
+}
+
+# 일반 단어와 겹치는 브랜드 → 로고로만 확정, OCR에서는 힌트
+# (별칭 파일 항목은 "logo_only": true로 지정)
+LOGO_ONLY_BRANDS = {
+    "apple", "amazon", "orion", "dell", "kia", "intel", "nike", "oreo", "pepsi", "sony", "disney",
+    "colgate", "gillette", "tesla", "coway", "emart", "naver", "kakao", "jinro", "google", "xbox",
+}
+
+# 브랜드/영문명 → 법인 (Vision 로고 이름은 대부분 영문)
+BUILTIN_BRAND_ALIASES: Dict[str, Dict[str, str]] = {
+    "samsung": {"company": "삼성전자", "company_market": "KRX", "company_ticker": "005930"},
+    "samsung electronics": {"company": "삼성전자", "company_market": "KRX", "company_ticker": "005930"},
+    "lg electronics": {"company": "LG전자", "company_market": "KRX", "company_ticker": "066570"},
+    "sk hynix": {"company": "SK하이닉스", "company_market": "KRX", "company_ticker": "000660"},
+    "hyundai motor": {"company": "현대차", "company_market": "KRX", "company_ticker": "005380"},
+    "kia": {"company": "기아", "company_market": "KRX", "company_ticker": "000270"},
+    "naver": {"company": "NAVER", "company_market": "KRX", "company_ticker": "035420"},
+    "kakao": {"company": "카카오", "company_market": "KRX", "company_ticker": "035720"},
+    "nongshim": {"company": "농심", "company_market": "KRX", "company_ticker": "004370"},
+    "신라면": {"company": "농심", "company_market": "KRX", "company_ticker": "004370"},
+    "orion": {"company": "오리온", "company_market": "KRX", "company_ticker": "271560"},
+    "ottogi": {"company": "오뚜기", "company_market": "KRX", "company_ticker": "007310"},
+    "binggrae": {"company": "빙그레", "company_market": "KRX", "company_ticker": "005180"},
+    "bibigo": {"company": "CJ제일제당", "company_market": "KRX", "company_ticker": "097950"},
+    "비비고": {"company": "CJ제일제당", "company_market": "KRX", "company_ticker": "097950"},
+    "hite jinro": {"company": "하이트진로", "company_market": "KRX", "company_ticker": "000080"},
+    "jinro": {"company": "하이트진로", "company_market": "KRX", "company_ticker": "000080"},
+    "amorepacific": {"company": "아모레퍼시픽", "company_market": "KRX", "company_ticker": "090430"},
+    "celltrion": {"company": "셀트리온", "company_market": "KRX", "company_ticker": "068270"},
+    "coway": {"company": "코웨이", "company_market": "KRX", "company_ticker": "021240"},
+    "emart": {"company": "이마트", "company_market": "KRX", "company_ticker": "139480"},
+    "apple": {"company": "Apple Inc.", "company_market": "NASDAQ", "company_ticker": "AAPL"},
+    "microsoft": {"company": "Microsoft Corporation", "company_market": "NASDAQ", "company_ticker": "MSFT"},
+    "xbox": {"company": "Microsoft Corporation", "company_market": "NASDAQ", "company_ticker": "MSFT"},
+    "google": {"company": "Alphabet Inc.", "company_market": "NASDAQ", "company_ticker": "GOOGL"},
+    "amazon": {"company": "Amazon.com, Inc.", "company_market": "NASDAQ", "company_ticker": "AMZN"},
+    "nvidia": {"company": "NVIDIA Corporation", "company_market": "NASDAQ", "company_ticker": "NVDA"},
+    "intel": {"company": "Intel Corporation", "company_market": "NASDAQ", "company_ticker": "INTC"},
+    "tesla": {"company": "Tesla, Inc.", "company_market": "NASDAQ", "company_ticker": "TSLA"},
+    "netflix": {"company": "Netflix, Inc.", "company_market": "NASDAQ", "company_ticker": "NFLX"},
+    "starbucks": {"company": "Starbucks Corporation", "company_market": "NASDAQ", "company_ticker": "SBUX"},
+    "pepsi": {"company": "PepsiCo, Inc.", "company_market": "NASDAQ", "company_ticker": "PEP"},
+    "logitech": {"company": "Logitech International S.A.", "company_market": "NASDAQ", "company_ticker": "LOGI"},
+    "oreo": {"company": "Mondelez International, Inc.", "company_market": "NASDAQ", "company_ticker": "MDLZ"},
+    "nike": {"company": "NIKE, Inc.", "company_market": "NYSE", "company_ticker": "NKE"},
+    "coca-cola": {"company": "The Coca-Cola Company", "company_market": "NYSE", "company_ticker": "KO"},
+    "coca cola": {"company": "The Coca-Cola Company", "company_market": "NYSE", "company_ticker": "KO"},
+    "mcdonald's": {"company": "McDonald's Corporation", "company_market": "NYSE", "company_ticker": "MCD"},
+    "disney": {"company": "The Walt Disney Company", "company_market": "NYSE", "company_ticker": "DIS"},
+    "gillette": {"company": "The Procter & Gamble Company", "company_market": "NYSE", "company_ticker": "PG"},
+    "colgate": {"company": "Colgate-Palmolive Company", "company_market": "NYSE", "company_ticker": "CL"},
+    "dell": {"company": "Dell Technologies Inc.", "company_market": "NYSE", "company_ticker": "DELL"},
+    "sony": {"company": "Sony Group Corporation", "company_market": "TSE", "company_ticker": "6758"},
+    "nintendo": {"company": "Nintendo Co., Ltd.", "company_market": "TSE", "company_ticker": "7974"},
+}
+
+_SCORED_ITEM = re.compile(r"\s*(.+?) \((\d+)%\)(?:,|$)")
+_OCR_TOKEN = re.compile(r"[^\s,;:|/·•]+")
+
+
+class BrandMatch:
+    """로컬 매칭 결과"""
+
+    def __init__(self, brand: str, company: str, company_market: Optional[str], company_ticker: Optional[str],
+                 source: str, matched: str, score: Optional[float] = None, confident: bool = True):
+        self.brand = brand
+        self.company = company
+        self.company_market = company_market
+        self.company_ticker = company_ticker
+        self.source = source
+        self.matched = matched
+        self.score = score
+        self.confident = confident
+
+    def identification(self, object_name: Optional[str]) -> Dict[str, Any]:
+        """Gemini 식별 결과(GEMINI_JSON_GUIDE)와 같은 형태"""
+        return {
+            "object": object_name,
+            "brand": self.brand,
+            "company": self.company,
+            "company_market": self.company_market,
+            "company_ticker": self.company_ticker,
+        }
+
+    def info(self) -> Dict[str, Any]:
+        return {"source": self.source, "matched": self.matched, "score": self.score, "confident": self.confident}
+
+    def hint(self) -> str:
+        """확정하지 못한 일치를 Gemini 프롬프트에 넘길 한 줄"""
+        ticker = f"{self.company_market or '?'}:{self.company_ticker or '?'}"
+        return f'OCR 텍스트 "{self.matched}"이(가) {self.company} ({ticker})의 이름과 일치'
+
+
+
+def parse_vision_summary(summary: Optional[str]) -> Dict[str, Any]:
+    """Vision 요약 → {"labels": [(이름, 점수)], "objects": [...], "logos": [...], "ocr": str}"""
+    parsed: Dict[str, Any] = {"labels": [], "objects": [], "logos": [], "ocr": ""}
+    for line in (summary or "").splitlines():
+        prefix, _, rest = line.partition(": ")
+        key = {"Labels": "labels", "Objects": "objects", "Logos": "logos"}.get(prefix)
+        if key:
+            parsed[key] = [(m.group(1), int(m.group(2)) / 100.0) for m in _SCORED_ITEM.finditer(rest)]
+        elif prefix == "OCR Text":
+            parsed["ocr"] = rest
+    return parsed
+
+
+def _ocr_phrases(text: str) -> List[str]:
+    """OCR 텍스트의 1~3개 연속 토큰"""
+    tokens = _OCR_TOKEN.findall(text)[:_OCR_MAX_TOKENS]
+    phrases = []
+    for size in range(1, _OCR_MAX_NGRAM + 1):
+        for start in range(len(tokens) - size + 1):
+            phrases.append(" ".join(tokens[start:start + size]))
+    return phrases
+
+
+class BrandResolver:
+    """브랜드 별칭 + 상장사 목록 색인"""
+
+    def __init__(self, aliases: Optional[Mapping[str, Mapping[str, Any]]] = None):
+        self._lock = threading.Lock()
+        self._aliases: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._listing: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._providers: Dict[str, Callable[[], Mapping[str, str]]] = {}
+        self._listing_expires_at = 0.0
+        self._refreshing = False
+        self._stats = {"resolved": 0, "hinted": 0, "unresolved": 0, "ambiguous": 0}
+        if aliases:
+            self.add_aliases(aliases)
+
+    @staticmethod
+    def _add(index: Dict[str, Optional[Dict[str, Any]]], key: str, entry: Dict[str, Any]) -> None:
+        if not key or key.isdigit():
+            return
+        current = index.get(key, entry)
+        # 같은 이름을 다른 회사가 쓰면 모호한 이름으로 표시 (None)
+        index[key] = entry if current is not None and current.get("company") == entry.get("company") else None
+
+    def add_aliases(self, aliases: Mapping[str, Mapping[str, Any]]) -> None:
+        """브랜드/영문명 → {"company", "company_market", "company_ticker"[, "brand"]} (나중에 넣은 항목이 우선)
+        brand가 없으면 로고/OCR에서 찾은 표기를 브랜드로 사용"""
+        with self._lock:
+            for name, value in aliases.items():
+                key = normalize_company_text(name)
+                if key and value and value.get("company"):
+                    self._aliases[key] = dict(value)
+
+    def load_aliases(self, path: str = BRAND_ALIASES_PATH) -> int:
+        """JSON 파일의 별칭 추가 (파일이 없으면 0)"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as exc:
+            print(f"[WARN] 브랜드 별칭 파일 로드 실패: {exc}")
+            return 0
+        if not isinstance(data, dict):
+            return 0
+        self.add_aliases(data)
+        return len(data)
+
+    def register_listing_provider(self, market: str, provider: Callable[[], Mapping[str, str]]) -> None:
+        """상장사 목록 제공 함수 등록 (티커 → 회사명). 다음 조회 때 색인을 다시 만든다"""
+        with self._lock:
+            self._providers[market] = provider
+            self._listing_expires_at = 0.0
+
+    def _rebuild_listing(self) -> None:
+        with self._lock:
+            providers = dict(self._providers)
+        index: Dict[str, Optional[Dict[str, Any]]] = {}
+        failed = False
+        for market, provider in providers.items():
+            try:
+                companies = provider() or {}
+            except Exception as exc:
+                print(f"[WARN] 브랜드 색인용 {market} 상장사 목록 조회 실패: {exc}")
+                failed = True
+                continue
+            for ticker, name in companies.items():
+                entry = {"company": name, "company_market": market, "company_ticker": str(ticker)}
+                for variant in company_name_variants(name):
+                    self._add(index, variant, entry)
+        with self._lock:
+            if index or not self._listing:
+                self._listing = index
+            self._listing_expires_at = time.time() + (BRAND_INDEX_RETRY_SEC if failed else BRAND_INDEX_REFRESH_SEC)
+            self._refreshing = False
+        print(f"[OK] 브랜드 색인 갱신: 상장사 이름 {len(index)}개")
+
+    def _ensure_listing(self) -> None:
+        """색인이 오래됐으면 백그라운드에서 갱신 (조회는 기존 색인으로 바로 진행)"""
+        with self._lock:
+            if self._refreshing or not self._providers or time.time() < self._listing_expires_at:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._rebuild_listing, name="brand-index", daemon=True).start()
+
+    def _lookup(self, text: str, min_listing_len: int = 0) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """(항목, 모호 여부). 별칭이 상장사 목록보다 우선"""
+        key = normalize_company_text(text)
+        if not key:
+            return None, False
+        if key in AMBIGUOUS_BRANDS:
+            return None, True
+        if key in self._aliases:
+            return self._aliases[key], False
+        if min_listing_len and key.isascii():
+            min_listing_len = max(min_listing_len, _OCR_MIN_ASCII_NAME_LEN)
+        if key in self._listing and len(key) >= min_listing_len:
+            entry = self._listing[key]
+            return entry, entry is None
+        return None, False
+
+    def _ocr_confident(self, phrase: str) -> bool:
+        """OCR 일치만으로 확정해도 되는 이름인지 (_lookup에서 항목을 찾은 phrase 기준)"""
+        key = normalize_company_text(phrase)
+        alias = self._aliases.get(key)
+        if alias is not None:
+            return key not in LOGO_ONLY_BRANDS and not alias.get("logo_only")
+        return len(key) >= BRAND_OCR_MIN_NAME_LEN or has_corporate_marker(phrase)
+
+    def resolve(self, summary: Optional[str]) -> Optional[BrandMatch]:
+        """Vision 요약에서 회사 1개를 찾으면 BrandMatch, 아니면 None.
+        confident=False면 Gemini 식별을 생략하지 말고 힌트로만 사용"""
+        if not BRAND_RESOLVER_ENABLED or not summary:
+            return None
+        self._ensure_listing()
+        parsed = parse_vision_summary(summary)
+        match = self._resolve_logos(parsed["logos"])
+        if match is None and not self._has_ambiguous_logo(parsed["logos"]):
+            match = self._resolve_ocr(parsed["ocr"])
+        if match is None:
+            self._count("unresolved")
+        else:
+            self._count("resolved" if match.confident else "hinted")
+        return match
+
+    def _has_ambiguous_logo(self, logos: List[Tuple[str, float]]) -> bool:
+        return any(score >= BRAND_MIN_LOGO_SCORE and normalize_company_text(description) in AMBIGUOUS_BRANDS
+                   for description, score in logos)
+
+    def _resolve_logos(self, logos: List[Tuple[str, float]]) -> Optional[BrandMatch]:
+        for description, score in sorted(logos, key=lambda item: item[1], reverse=True):
+            if score < BRAND_MIN_LOGO_SCORE:
+                break
+            entry, ambiguous = self._lookup(description)
+            if ambiguous:
+                # 확실한 로고가 여러 회사를 가리키면 OCR로 추측하지 않음
+                self._count("ambiguous")
+                return None
+            if entry:
+                return self._match(entry, "logo", description, score)
+        return None
+
+    def _resolve_ocr(self, text: str) -> Optional[BrandMatch]:
+        if not text:
+            return None
+        found: Dict[str, Tuple[Dict[str, Any], str, bool]] = {}
+        for phrase in _ocr_phrases(text):
+            entry, ambiguous = self._lookup(phrase, _OCR_HINT_MIN_NAME_LEN)
+            if ambiguous:
+                self._count("ambiguous")
+            if entry:
+                confident = self._ocr_confident(phrase)
+                if entry["company"] not in found or (confident and not found[entry["company"]][2]):
+                    found[entry["company"]] = (entry, phrase, confident)
+        # 확정 후보가 한 회사면 채택 (일반 단어와 겹친 힌트 후보는 무시)
+        candidates = [item for item in found.values() if item[2]] or list(found.values())
+        if len(candidates) != 1:
+            if len(candidates) > 1:
+                self._count("ambiguous")
+            return None
+        entry, phrase, confident = candidates[0]
+        return self._match(entry, "ocr", phrase, confident=confident)
+
+    @staticmethod
+    def _match(entry: Dict[str, Any], source: str, matched: str, score: Optional[float] = None,
+               confident: bool = True) -> BrandMatch:
+        return BrandMatch(
+            brand=entry.get("brand") or matched,
+            company=entry["company"],
+            company_market=entry.get("company_market"),
+            company_ticker=entry.get("company_ticker"),
+            source=source,
+            matched=matched,
+            score=score,
+            confident=confident,
+        )
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["aliases"] = len(self._aliases)
+            stats["listing_names"] = len(self._listing)
+        lookups = stats["resolved"] + stats["hinted"] + stats["unresolved"]
+        stats["resolve_rate"] = round(stats["resolved"] / lookups, 4) if lookups else 0.0
+        return stats
+
+
+def object_from_summary(summary: Optional[str]) -> Optional[str]:
+    """Vision 요약의 대표 물체 이름 (객체 인식 → 라벨 순)"""
+    parsed = parse_vision_summary(summary)
+    for key in ("objects", "labels"):
+        if parsed[key]:
+            return parsed[key][0][0]
+    return None
+
+
+brand_resolver = BrandResolver(BUILTIN_BRAND_ALIASES)
+brand_resolver.load_aliases()
+
+
+__all__ = [
+    "BrandMatch",
+    "BrandResolver",
+    "LOGO_ONLY_BRANDS",
+    "brand_resolver",
+    "object_from_summary",
+    "parse_vision_summary",
+]
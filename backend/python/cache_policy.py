@@ -0,0 +1,201 @@
+"""
+엔드포인트별 HTTP 캐시 정책 (Cache-Control / Expires / Vary).
+
+CDN(Vercel 엣지)과 Node 게이트웨이가 파이썬까지 오지 않고 응답할 수 있도록
+after_request에서 엔드포인트 이름으로 정책을 찾아 캐시 헤더를 붙인다.
+- 시세/지수/차트: 장중에는 짧게, 장 마감 후에는 다음 개장까지 길게 (KRX / 미국 정규장 기준, 공휴일은 고려하지 않음)
+- 재무제표/실적: 수 시간, 뉴스: 수 분
+- 모든 정책에 stale-while-revalidate / stale-if-error 포함
+- 정책이 없는 엔드포인트, GET/HEAD가 아닌 요청, 5xx 응답은 no-store
+- 업스트림 실패로 비었거나 축소된 200 응답은 뷰에서 no_store()로 표시 (CDN에 수 시간 고정되지 않도록)
+- 차트는 마지막 봉이 다음 개장에 바뀌는 기간 조회라 immutable 대신 MARKET_CLOSED_MAX_AGE 상한만 둔다
+"""
+import os
+from datetime import datetime, time as dt_time, timedelta, timezone
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+from flask import Flask, Response, request
+
+try:
+    from zoneinfo import ZoneInfo
+    _US_TZ = ZoneInfo("America/New_York")
+except Exception:  # tzdata가 없는 환경: EST 고정 (서머타임 기간에는 1시간 오차)
+    _US_TZ = timezone(timedelta(hours=-5))
+
+CACHE_HEADERS_ENABLED = os.getenv("CACHE_HEADERS", "1").lower() in ("1", "true", "yes")
+# 장 마감 후 max-age 상한 (다음 개장까지 남은 시간이 더 길어도 이 값을 넘지 않음)
+MARKET_CLOSED_MAX_AGE = int(os.getenv("MARKET_CLOSED_MAX_AGE", str(6 * 3600)))
+NOT_FOUND_MAX_AGE = 60
+
+KST = timezone(timedelta(hours=9))
+
+# 시장 → (시간대, 개장, 마감)
+MARKET_HOURS: Dict[str, Tuple[Any, dt_time, dt_time]] = {
+    "KRX": (KST, dt_time(9, 0), dt_time(15, 30)),
+    "US": (_US_TZ, dt_time(9, 30), dt_time(16, 0)),
+}
+
+
+def is_market_open(market: str, now: Optional[datetime] = None) -> bool:
+    tz, open_at, close_at = MARKET_HOURS[market]
+    local = (now or datetime.now(timezone.utc)).astimezone(tz)
+    return local.weekday() < 5 and open_at <= local.time() < close_at
+
+
+def seconds_until_open(market: str, now: Optional[datetime] = None) -> int:
+    """다음 개장까지 남은 초 (장중이면 0)"""
+    tz, open_at, _ = MARKET_HOURS[market]
+    now = now or datetime.now(timezone.utc)
+    if is_market_open(market, now):
+        return 0
+    local = now.astimezone(tz)
+    candidate = local.replace(hour=open_at.hour, minute=open_at.minute, second=0, microsecond=0)
+    if candidate <= local:
+        candidate += timedelta(days=1)
+    while candidate.weekday() >= 5:
+        candidate += timedelta(days=1)
+    return int((candidate - local).total_seconds())
+
+
+class CachePolicy:
+    """고정 캐시 정책"""
+
+    def __init__(self, max_age: int, s_maxage: Optional[int] = None,
+                 stale_while_revalidate: int = 0, stale_if_error: int = 0,
+                 vary: Tuple[str, ...] = ()):
+        self.max_age = max_age
+        self.s_maxage = s_maxage
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.vary = vary
+
+    def resolve(self, view_args: Mapping[str, Any]) -> "CachePolicy":
+        return self
+
+    def header_value(self) -> str:
+        parts = ["public", f"max-age={self.max_age}"]
+        if self.s_maxage is not None:
+            parts.append(f"s-maxage={self.s_maxage}")
+        if self.stale_while_revalidate:
+            parts.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        if self.stale_if_error:
+            parts.append(f"stale-if-error={self.stale_if_error}")
+        return ", ".join(parts)
+
+
+class MarketHoursPolicy(CachePolicy):
+    """장중 정책 / 장 마감 후 정책 (마감 후 max-age는 다음 개장까지)"""
+
+    def __init__(self, market: Union[str, Callable[[Mapping[str, Any]], str]], open_policy: CachePolicy,
+                 closed_stale_if_error: int = 86400):
+        super().__init__(open_policy.max_age, vary=open_policy.vary)
+        self.market = market
+        self.open_policy = open_policy
+        self.closed_stale_if_error = closed_stale_if_error
+
+    def resolve(self, view_args: Mapping[str, Any]) -> CachePolicy:
+        market = self.market(view_args) if callable(self.market) else self.market
+        wait = seconds_until_open(market)
+        if wait <= 0:
+            return self.open_policy
+        # 다음 개장까지 데이터가 바뀌지 않음 → 브라우저/CDN 모두 길게
+        max_age = max(self.open_policy.max_age, min(wait, MARKET_CLOSED_MAX_AGE))
+        return CachePolicy(
+            max_age=max_age,
+            s_maxage=max_age,
+            stale_while_revalidate=min(max_age, 3600),
+            stale_if_error=self.closed_stale_if_error,
+            vary=self.vary,
+        )
+
+
+NO_STORE = "no-store"
+
+
+def no_store(response: Response) -> Response:
+    """빈/축소 응답 표시: apply_cache_headers가 정책 대신 no-store를 유지"""
+    response.headers["Cache-Control"] = NO_STORE
+    return response
+
+
+def is_kr_symbol(symbol: str) -> bool:
+    clean = (symbol or "").upper().replace(".KS", "").replace(".KQ", "")
+    return len(clean) == 6 and clean.isdigit()
+
+
+def _symbol_market(view_args: Mapping[str, Any]) -> str:
+    return "KRX" if is_kr_symbol(view_args.get("symbol", "")) else "US"
+
+
+def _index_market(view_args: Mapping[str, Any]) -> str:
+    return "US" if view_args.get("market") == "us" else "KRX"
+
+
+QUOTE_OPEN = CachePolicy(max_age=15, s_maxage=15, stale_while_revalidate=30, stale_if_error=300)
+CHART_OPEN = CachePolicy(max_age=60, s_maxage=60, stale_while_revalidate=120, stale_if_error=3600)
+NEWS = CachePolicy(max_age=120, s_maxage=300, stale_while_revalidate=600, stale_if_error=3600)
+FINANCIALS = CachePolicy(max_age=3600, s_maxage=6 * 3600, stale_while_revalidate=86400, stale_if_error=7 * 86400)
+SEARCH = CachePolicy(max_age=3600, s_maxage=86400, stale_while_revalidate=86400, stale_if_error=7 * 86400)
+
+# 엔드포인트(뷰 함수 이름) → 정책
+ENDPOINT_CACHE_POLICIES: Dict[str, CachePolicy] = {
+    "search_stock": SEARCH,
+    "get_stock_universal": MarketHoursPolicy(_symbol_market, QUOTE_OPEN),
+    "get_stock": MarketHoursPolicy("KRX", QUOTE_OPEN),
+    "get_market_indices": MarketHoursPolicy(_index_market, QUOTE_OPEN),
+    "get_top_stocks_by_market_cap": MarketHoursPolicy("KRX", CHART_OPEN),
+    "get_stock_chart_universal": MarketHoursPolicy(_symbol_market, CHART_OPEN),
+    "get_stock_chart": MarketHoursPolicy("KRX", CHART_OPEN),
+    "get_stock_news_api": NEWS,
+    "get_kr_stock_news": NEWS,
+    "get_earnings_call": FINANCIALS,
+    "get_stock_financials": FINANCIALS,
+    "get_kr_stock_financials": FINANCIALS,
+}
+
+
+def apply_cache_headers(response: Response) -> Response:
+    if "Cache-Control" in response.headers:
+        return response  # 뷰에서 직접 지정한 경우 존중
+    policy = ENDPOINT_CACHE_POLICIES.get(request.endpoint or "")
+    if (
+        policy is None
+        or request.method not in ("GET", "HEAD")
+        or response.status_code >= 500
+        or response.is_streamed
+    ):
+        response.headers["Cache-Control"] = NO_STORE
+        return response
+
+    if response.status_code >= 400:
+        # 404 등은 짧게만 캐시 (잘못된 심볼 반복 조회 흡수)
+        resolved = CachePolicy(max_age=NOT_FOUND_MAX_AGE, s_maxage=NOT_FOUND_MAX_AGE) \
+            if response.status_code == 404 else None
+    else:
+        resolved = policy.resolve(request.view_args or {})
+    if resolved is None:
+        response.headers["Cache-Control"] = NO_STORE
+        return response
+
+    response.headers["Cache-Control"] = resolved.header_value()
+    response.expires = datetime.now(timezone.utc) + timedelta(seconds=resolved.max_age)
+    for header in resolved.vary:
+        response.vary.add(header)
+    return response
+
+
+def init_cache_policy(app: Flask) -> None:
+    if CACHE_HEADERS_ENABLED:
+        app.after_request(apply_cache_headers)
+
+
+__all__ = [
+    "CachePolicy",
+    "ENDPOINT_CACHE_POLICIES",
+    "MarketHoursPolicy",
+    "apply_cache_headers",
+    "init_cache_policy",
+    "is_market_open",
+    "no_store",
+    "seconds_until_open",
+]
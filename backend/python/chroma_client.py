@@ -3,9 +3,17 @@ import os
 import re
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-import chromadb
-from chromadb.api import ClientAPI
-from chromadb.api.models.Collection import Collection
+try:
+    from .chroma_http import ChromaHttpClient
+    from .news_dedup import dedupe_news
+except ImportError:
+    from chroma_http import ChromaHttpClient  # type: ignore
+    from news_dedup import dedupe_news  # type: ignore
+
+# 클라이언트 구현 선택: "http"(기본, chromadb 패키지 불필요) 또는 "sdk"(chromadb.CloudClient)
+# chromadb 패키지는 sdk 모드에서만 지연 import 한다.
+ClientAPI = Any
+Collection = Any
 
 CHROMADB_API_KEY = os.getenv(
     "CHROMADB_API_KEY",
@@ -31,6 +39,7 @@ KR_NEWS_COLLECTION = os.getenv(
 US_FIN_COLLECTION = os.getenv("CHROMADB_US_FIN_COLLECTION", "USfund_financials")
 KR_FIN_COLLECTION = os.getenv("CHROMADB_KR_FIN_COLLECTION", "KRfund_financials")
 EARNINGS_CALL_COLLECTION = os.getenv("CHROMADB_EARNINGS_CALL_COLLECTION", "earnings_call_summary_ko")
+CHROMADB_CLIENT_MODE = os.getenv("CHROMADB_CLIENT_MODE", "http").strip().lower()
 
 _client: Optional[ClientAPI] = None
 _us_news_collection: Optional[Collection] = None
@@ -41,10 +50,10 @@ _earnings_call_collection: Optional[Collection] = None
 
 
 def get_chroma_client() -> ClientAPI:
-    """지연 초기화된 Chroma CloudClient 반환"""
+    """지연 초기화된 Chroma 클라이언트 반환 (CHROMADB_CLIENT_MODE에 따라 HTTP 또는 SDK)"""
     global _client
     if _client is None:
-        print(f'[DEBUG] ChromaDB 클라이언트 초기화 시작...')
+        print(f'[DEBUG] ChromaDB 클라이언트 초기화 시작... (모드: {CHROMADB_CLIENT_MODE})')
         print(f'[DEBUG] CHROMADB_API_KEY 설정 여부: {bool(CHROMADB_API_KEY)}')
         print(f'[DEBUG] CHROMADB_TENANT 설정 여부: {bool(CHROMADB_TENANT)}')
         print(f'[DEBUG] CHROMADB_DATABASE 설정 여부: {bool(CHROMADB_DATABASE)}')
@@ -57,12 +66,22 @@ def get_chroma_client() -> ClientAPI:
             raise RuntimeError("CHROMADB_DATABASE 환경 변수가 설정되어 있지 않습니다.")
 
         try:
-            print(f'[DEBUG] ChromaDB CloudClient 생성 시도...')
-            _client = chromadb.CloudClient(
-                api_key=CHROMADB_API_KEY,
-                tenant=CHROMADB_TENANT,
-                database=CHROMADB_DATABASE,
-            )
+            if CHROMADB_CLIENT_MODE == "sdk":
+                print(f'[DEBUG] ChromaDB CloudClient 생성 시도...')
+                import chromadb
+
+                _client = chromadb.CloudClient(
+                    api_key=CHROMADB_API_KEY,
+                    tenant=CHROMADB_TENANT,
+                    database=CHROMADB_DATABASE,
+                )
+            else:
+                print(f'[DEBUG] ChromaDB HTTP 클라이언트 생성 시도...')
+                _client = ChromaHttpClient(
+                    api_key=CHROMADB_API_KEY,
+                    tenant=CHROMADB_TENANT,
+                    database=CHROMADB_DATABASE,
+                )
             print(f'[OK] ChromaDB 클라이언트 생성 성공')
         except Exception as e:
             print(f'[ERROR] ChromaDB 클라이언트 생성 실패: {e}')
@@ -240,7 +259,8 @@ def fetch_us_stock_news(symbol: str, limit: int = 3) -> List[Dict[str, Any]]:
         reverse=True,
     )
 
-    return news_items[:limit]
+    # 같은 기사(URL) / 통신사 재전송 기사 제거 후 최신순 limit개
+    return dedupe_news(news_items)[:limit]
 
 
 def fetch_kr_stock_news(symbol: str, limit: int = 3) -> List[Dict[str, Any]]:
@@ -320,7 +340,8 @@ def fetch_kr_stock_news(symbol: str, limit: int = 3) -> List[Dict[str, Any]]:
         reverse=True,
     )
 
-    return news_items[:limit]
+    # 같은 기사(URL) / 통신사 재전송 기사 제거 후 최신순 limit개
+    return dedupe_news(news_items)[:limit]
 
 
 def fetch_earnings_call_summary(symbol: str) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,149 @@
+"""
+chromadb 패키지 없이 Chroma HTTP API(v2)를 직접 호출하는 읽기 전용 클라이언트.
+
+chroma_client.py에서 사용하는 get_collection / list_collections / collection.get
+세 가지 호출만 구현한다. onnx, numpy 등 chromadb 의존성 트리를 import하지 않으므로
+콜드 스타트와 배포 용량이 줄어든다.
+"""
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+import requests
+
+try:
+    from .http_client import build_session
+except ImportError:
+    from http_client import build_session  # type: ignore
+
+CHROMADB_HOST = os.getenv("CHROMADB_HOST", "api.trychroma.com")
+CHROMADB_PORT = int(os.getenv("CHROMADB_PORT", "443"))
+CHROMADB_SSL = os.getenv("CHROMADB_SSL", "1").lower() not in ("0", "false", "no")
+CHROMADB_HTTP_TIMEOUT = float(os.getenv("CHROMADB_HTTP_TIMEOUT", "10"))
+CHROMADB_HTTP_POOL_SIZE = int(os.getenv("CHROMADB_HTTP_POOL_SIZE", "8"))
+
+_DEFAULT_INCLUDE = ["metadatas", "documents"]
+
+
+class ChromaHttpError(RuntimeError):
+    """Chroma HTTP API 호출 실패"""
+
+
+class ChromaHttpCollection:
+    """컬렉션 핸들 (chromadb Collection.get 호환)"""
+
+    def __init__(self, client: "ChromaHttpClient", name: str, collection_id: str, metadata: Optional[Dict[str, Any]] = None):
+        self._client = client
+        self.name = name
+        self.id = collection_id
+        self.metadata = metadata or {}
+
+    def get(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """레코드 조회. 반환 형식은 chromadb GetResult(dict)와 동일"""
+        body: Dict[str, Any] = {
+            "ids": ids,
+            "where": where,
+            "where_document": where_document,
+            "limit": limit,
+            "offset": offset,
+            "include": include or _DEFAULT_INCLUDE,
+        }
+        data = self._client._request("post", f"/collections/{self.id}/get", json=body)
+        return {
+            "ids": data.get("ids") or [],
+            "documents": data.get("documents") or [],
+            "metadatas": data.get("metadatas") or [],
+            "embeddings": data.get("embeddings"),
+            "include": data.get("include") or body["include"],
+        }
+
+    def __repr__(self) -> str:
+        return f"ChromaHttpCollection(name={self.name!r}, id={self.id!r})"
+
+
+class ChromaHttpClient:
+    """Chroma Cloud/서버에 연결하는 최소 HTTP 클라이언트 (커넥션 풀 공유)"""
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        tenant: str,
+        database: str,
+        host: str = CHROMADB_HOST,
+        port: int = CHROMADB_PORT,
+        ssl: bool = CHROMADB_SSL,
+        timeout: float = CHROMADB_HTTP_TIMEOUT,
+        session: Optional[requests.Session] = None,
+    ):
+        scheme = "https" if ssl else "http"
+        default_port = 443 if ssl else 80
+        netloc = host if port == default_port else f"{host}:{port}"
+        self._base_url = f"{scheme}://{netloc}/api/v2/tenants/{tenant}/databases/{database}"
+        self._timeout = timeout
+        self._session = session or self._build_session()
+        self._headers = {"Content-Type": "application/json"}
+        if api_key:
+            self._headers["x-chroma-token"] = api_key
+        self._collections: Dict[str, ChromaHttpCollection] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        # Chroma 전용 세션 (헤더가 다르므로 공용 세션과 분리, 풀/재시도 정책은 동일)
+        return build_session(pool_maxsize=CHROMADB_HTTP_POOL_SIZE)
+
+    def _request(self, method: str, path: str, **kwargs) -> Any:
+        url = f"{self._base_url}{path}"
+        try:
+            resp = self._session.request(method, url, headers=self._headers, timeout=self._timeout, **kwargs)
+        except requests.RequestException as exc:
+            raise ChromaHttpError(f"Chroma HTTP 요청 실패: {method.upper()} {path} - {exc}") from exc
+        if resp.status_code >= 400:
+            raise ChromaHttpError(
+                f"Chroma HTTP 오류 {resp.status_code}: {method.upper()} {path} - {resp.text[:200]}"
+            )
+        try:
+            return resp.json()
+        except ValueError as exc:
+            raise ChromaHttpError(f"Chroma HTTP 응답 파싱 실패: {path}") from exc
+
+    def _to_collection(self, payload: Dict[str, Any]) -> ChromaHttpCollection:
+        return ChromaHttpCollection(
+            self,
+            name=payload.get("name") or "",
+            collection_id=payload.get("id") or "",
+            metadata=payload.get("metadata"),
+        )
+
+    def get_collection(self, name: str) -> ChromaHttpCollection:
+        """이름으로 컬렉션 핸들 조회 (프로세스 내 캐시)"""
+        with self._lock:
+            cached = self._collections.get(name)
+        if cached is not None:
+            return cached
+        collection = self._to_collection(self._request("get", f"/collections/{name}"))
+        if not collection.id:
+            raise ChromaHttpError(f"컬렉션 ID를 찾을 수 없습니다: {name}")
+        with self._lock:
+            self._collections[name] = collection
+        return collection
+
+    def list_collections(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[ChromaHttpCollection]:
+        params = {k: v for k, v in (("limit", limit), ("offset", offset)) if v is not None}
+        data = self._request("get", "/collections", params=params)
+        return [self._to_collection(item) for item in (data or []) if isinstance(item, dict)]
+
+
+__all__ = [
+    "ChromaHttpClient",
+    "ChromaHttpCollection",
+    "ChromaHttpError",
+]
@@ -0,0 +1,117 @@
+"""
+다중 회사명 매칭기 (Aho-Corasick).
+
+회사명 목록(예: KRX 상장사)을 한 번 컴파일해 두고, 텍스트를 한 번 훑는 것으로
+언급된 모든 회사를 찾는다. 텍스트 1건당 회사 수만큼 정규식을 만들던 방식을 대체한다.
+- 정규화: 공백/기호/밑줄 제거 + 소문자 (normalize_company_text)
+- "(주)", "㈜", "주식회사" 표기가 붙은 이름도 같은 회사로 인식
+"""
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+_NON_WORD = re.compile(r"[\s\W_]+")
+_CORP_MARKERS = re.compile(r"\(\s*주\s*\)|㈜|주식회사")
+
+
+def normalize_company_text(s: str) -> str:
+    """매칭용 정규화 (공백·기호 제거, 소문자)"""
+    return _NON_WORD.sub("", s or "").lower()
+
+
+def company_name_variants(name: str) -> Set[str]:
+    """회사명과 법인 표기 변형의 정규화 결과"""
+    base = (name or "").strip()
+    stripped = _CORP_MARKERS.sub("", base).strip()
+    variants = {normalize_company_text(base), normalize_company_text(stripped)}
+    if stripped:
+        variants.add(normalize_company_text(f"(주){stripped}"))
+        variants.add(normalize_company_text(f"{stripped}(주)"))
+    return {v for v in variants if v}
+
+
+def has_corporate_marker(text: str) -> bool:
+    """"(주)", "㈜", "주식회사" 법인 표기 포함 여부"""
+    return bool(_CORP_MARKERS.search(text or ""))
+
+
+class CompanyMatcher:
+    """회사 키 → 회사명 목록으로 만든 Aho-Corasick 오토마톤"""
+
+    def __init__(self, companies: Mapping[str, str]):
+        self.companies: Dict[str, str] = dict(companies)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Set[str]] = [set()]
+        for key, name in self.companies.items():
+            for pattern in company_name_variants(name):
+                self._insert(pattern, key)
+        self._build()
+
+    def _insert(self, pattern: str, key: str) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(set())
+            node = nxt
+        self._out[node].add(key)
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                candidate = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = candidate if candidate != nxt else 0
+                # 실패 링크의 출력도 함께 보고 (짧은 회사명이 긴 회사명 안에 있을 때)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> Set[str]:
+        """텍스트에 언급된 회사 키 집합 (텍스트 길이에 선형)"""
+        found: Set[str] = set()
+        node = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for ch in normalize_company_text(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found |= out[node]
+        return found
+
+    def contains(self, text: str, key: Optional[str] = None) -> bool:
+        """text에 key 회사(생략 시 아무 회사나)가 언급되었는지"""
+        found = self.find(text)
+        return bool(found) if key is None else key in found
+
+    def tag_many(self, texts: Iterable[str]) -> List[List[Tuple[str, str]]]:
+        """여러 텍스트를 한 번에 태깅 → 텍스트별 [(회사 키, 회사명), ...]"""
+        return [
+            sorted((key, self.companies[key]) for key in self.find(text))
+            for text in texts
+        ]
+
+
+@lru_cache(maxsize=256)
+def single_company_matcher(company: str) -> CompanyMatcher:
+    """회사 1개용 매칭기 (회사명별로 캐시)"""
+    return CompanyMatcher({company: company})
+
+
+__all__ = [
+    "CompanyMatcher",
+    "company_name_variants",
+    "has_corporate_marker",
+    "normalize_company_text",
+    "single_company_matcher",
+]
@@ -0,0 +1,100 @@
+"""
+응답 압축 (gzip / brotli).
+
+after_request에서 Accept-Encoding을 보고 COMPRESS_MIN_SIZE 이상의 텍스트 응답을 압축한다.
+- brotli 모듈이 있고 클라이언트가 br을 받으면 brotli, 아니면 gzip
+- 스트리밍 응답(NDJSON/SSE), 이미 인코딩된 응답, 204/304 등은 건드리지 않음
+- Vary: Accept-Encoding 추가 (중간 캐시가 인코딩별로 저장하도록)
+"""
+import gzip
+import os
+from typing import Optional
+
+from flask import Flask, Response, request
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:  # 선택 의존성
+    brotli = None  # type: ignore
+    BROTLI_AVAILABLE = False
+
+COMPRESS_ENABLED = os.getenv("COMPRESS_RESPONSES", "1").lower() in ("1", "true", "yes")
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", "6"))
+COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", "5"))
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/javascript",
+    "text/html",
+    "text/plain",
+    "text/css",
+    "text/csv",
+}
+
+
+def _accepted(header: str, coding: str) -> bool:
+    """Accept-Encoding에 coding이 q>0으로 포함되었는지"""
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() != coding:
+            continue
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    accept_encoding = (accept_encoding or "").lower()
+    if BROTLI_AVAILABLE and _accepted(accept_encoding, "br"):
+        return "br"
+    if _accepted(accept_encoding, "gzip"):
+        return "gzip"
+    return None
+
+
+def compress_response(response: Response) -> Response:
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = choose_encoding(request.headers.get("Accept-Encoding", ""))
+    if encoding is None:
+        return response
+
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    if encoding == "br":
+        compressed = brotli.compress(data, quality=COMPRESS_BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(data, compresslevel=COMPRESS_GZIP_LEVEL)
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def init_compression(app: Flask) -> None:
+    if COMPRESS_ENABLED:
+        app.after_request(compress_response)
+
+
+__all__ = [
+    "BROTLI_AVAILABLE",
+    "choose_encoding",
+    "compress_response",
+    "init_compression",
+]
@@ -0,0 +1,140 @@
+"""
+이미지 분석 보강 결과 영구 캐시 (지주회사 / 밸류체인 / 관련 상장사).
+
+같은 브랜드·제품이 반복 업로드되므로 (종류, 정규화된 브랜드·회사·물체명) 조합으로 Gemini 결과를 저장해
+모든 워커 프로세스가 공유한다.
+- 저장소: ENRICHMENT_CACHE_BACKEND=sqlite(기본, cache/enrichment.sqlite3) | memory, LRU 개수 제한
+- TTL: 결과가 있으면 ENRICHMENT_CACHE_TTL_SEC, 모델이 "해당 없음"으로 답한 빈 결과는 ENRICHMENT_NEGATIVE_TTL_SEC
+  (API 오류로 결과를 받지 못한 경우는 저장하지 않음)
+- 수동 지정(curated): ENRICHMENT_OVERRIDES_PATH JSON 파일의 항목이 LLM 결과보다 우선
+    {"holding": {"오설록": {"holding_company": ..., "holding_market": ..., "holding_ticker": ...}},
+     "value_chain": {"브랜드 또는 물체명": [...]},
+     "related": {"브랜드 또는 물체명": [...]}}
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+try:
+    from .company_matcher import normalize_company_text
+    from .kv_store import open_store
+except ImportError:
+    from company_matcher import normalize_company_text  # type: ignore
+    from kv_store import open_store  # type: ignore
+
+ENRICHMENT_CACHE_BACKEND = os.getenv("ENRICHMENT_CACHE_BACKEND") or None
+ENRICHMENT_CACHE_TTL_SEC = int(os.getenv("ENRICHMENT_CACHE_TTL_SEC", str(30 * 24 * 3600)))
+ENRICHMENT_NEGATIVE_TTL_SEC = int(os.getenv("ENRICHMENT_NEGATIVE_TTL_SEC", str(24 * 3600)))
+ENRICHMENT_CACHE_MAX_ENTRIES = int(os.getenv("ENRICHMENT_CACHE_MAX_ENTRIES", "20000"))
+ENRICHMENT_OVERRIDES_PATH = os.getenv(
+    "ENRICHMENT_OVERRIDES_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "enrichment_overrides.json"),
+)
+# 프롬프트나 결과 형식이 바뀌면 올려서 이전 결과가 재사용되지 않게 한다
+ENRICHMENT_CACHE_VERSION = "v1"
+
+ENRICHMENT_KINDS = ("holding", "value_chain", "related")
+
+
+def _normalize(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple, set)):
+        return ",".join(sorted({_normalize(v) for v in value} - {""}))
+    return normalize_company_text(str(value))
+
+
+class EnrichmentCache:
+    """보강 결과 캐시 + 수동 지정 항목"""
+
+    def __init__(self, store: Any, overrides: Optional[Mapping[str, Mapping[str, Any]]] = None):
+        self._store = store
+        self._lock = threading.Lock()
+        self._overrides: Dict[str, Dict[str, Any]] = {kind: {} for kind in ENRICHMENT_KINDS}
+        self._stats = {"hits": 0, "curated_hits": 0, "misses": 0}
+        for kind, entries in (overrides or {}).items():
+            self.add_overrides(kind, entries)
+
+    def add_overrides(self, kind: str, entries: Mapping[str, Any]) -> None:
+        with self._lock:
+            bucket = self._overrides.setdefault(kind, {})
+            for name, value in entries.items():
+                key = _normalize(name)
+                if key and value:
+                    bucket[key] = value
+
+    def load_overrides(self, path: str = ENRICHMENT_OVERRIDES_PATH) -> int:
+        """JSON 파일의 수동 지정 항목 추가 (파일이 없으면 0)"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as exc:
+            print(f"[WARN] 보강 수동 지정 파일 로드 실패: {exc}")
+            return 0
+        count = 0
+        for kind, entries in (data or {}).items():
+            if isinstance(entries, dict):
+                self.add_overrides(kind, entries)
+                count += len(entries)
+        return count
+
+    def curated(self, kind: str, *names: Optional[str]) -> Optional[Any]:
+        """수동 지정 항목 조회 (names를 순서대로 확인)"""
+        with self._lock:
+            bucket = self._overrides.get(kind) or {}
+            for name in names:
+                value = bucket.get(_normalize(name))
+                if value:
+                    self._stats["curated_hits"] += 1
+                    return value
+        return None
+
+    @staticmethod
+    def key_for(kind: str, parts: Mapping[str, Any]) -> str:
+        raw = "\x1f".join(f"{name}={_normalize(parts[name])}" for name in sorted(parts))
+        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        return f"{ENRICHMENT_CACHE_VERSION}:{kind}:{digest}"
+
+    def lookup(self, kind: str, parts: Mapping[str, Any]) -> Tuple[bool, Any]:
+        """(적중 여부, 값). 빈 결과도 유효기간 안이면 적중"""
+        entry = self._store.get(self.key_for(kind, parts))
+        hit = entry is not None and entry.get("expires_at", 0) > time.time()
+        with self._lock:
+            self._stats["hits" if hit else "misses"] += 1
+        return (True, entry["value"]) if hit else (False, None)
+
+    def put(self, kind: str, parts: Mapping[str, Any], value: Any) -> None:
+        ttl = ENRICHMENT_CACHE_TTL_SEC if value else ENRICHMENT_NEGATIVE_TTL_SEC
+        self._store.set(self.key_for(kind, parts), {"value": value, "expires_at": time.time() + ttl})
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["curated_entries"] = {kind: len(v) for kind, v in self._overrides.items()}
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["entries"] = len(self._store)
+        return stats
+
+
+enrichment_cache = EnrichmentCache(
+    open_store(
+        "enrichment",
+        backend=ENRICHMENT_CACHE_BACKEND,
+        max_entries=ENRICHMENT_CACHE_MAX_ENTRIES,
+        ttl_sec=ENRICHMENT_CACHE_TTL_SEC,
+    )
+)
+enrichment_cache.load_overrides()
+
+
+__all__ = [
+    "ENRICHMENT_KINDS",
+    "EnrichmentCache",
+    "enrichment_cache",
+]
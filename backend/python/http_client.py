@@ -0,0 +1,98 @@
+"""
+공용 외부 HTTP 클라이언트 (requests.Session).
+
+FMP / DART / 네이버 / Gemini / 기사 수집 등 모든 외부 호출이 하나의 세션을 공유해
+호스트별 커넥션 풀에서 keep-alive 연결을 재사용한다 (요청마다 TCP/TLS 핸드셰이크를 하지 않음).
+- 호스트별 풀 크기: HTTP_POOL_MAXSIZE (병렬 수집 스레드 수 이상)
+- 429/5xx 응답과 연결 오류는 지수 백오프 + 무작위 지연(jitter)으로 최대 HTTP_RETRY_TOTAL회 재시도
+  (GET 등 멱등 요청만, Retry-After 헤더 존중. 단 대기 시간은 HTTP_RETRY_AFTER_MAX초 상한)
+- timeout을 주지 않은 호출에는 HTTP_DEFAULT_TIMEOUT 적용
+"""
+import os
+import random
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "32"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "16"))
+HTTP_RETRY_TOTAL = int(os.getenv("HTTP_RETRY_TOTAL", "2"))
+HTTP_RETRY_BACKOFF = float(os.getenv("HTTP_RETRY_BACKOFF", "0.3"))
+HTTP_RETRY_JITTER = float(os.getenv("HTTP_RETRY_JITTER", "0.3"))
+# Retry-After 대기 상한 (긴 값을 그대로 따르면 요청 스레드가 그동안 묶임)
+HTTP_RETRY_AFTER_MAX = float(os.getenv("HTTP_RETRY_AFTER_MAX", "5"))
+HTTP_DEFAULT_TIMEOUT = (
+    float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05")),
+    float(os.getenv("HTTP_READ_TIMEOUT", "15")),
+)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class JitteredRetry(Retry):
+    """지수 백오프에 무작위 지연을 더해 여러 스레드가 동시에 재시도하지 않도록 함"""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return backoff + random.uniform(0, HTTP_RETRY_JITTER)
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, HTTP_RETRY_AFTER_MAX)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """timeout 미지정 요청에 기본 timeout 적용"""
+
+    def __init__(self, *args: Any, timeout: Any = HTTP_DEFAULT_TIMEOUT, **kwargs: Any):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def build_session(
+    pool_maxsize: int = HTTP_POOL_MAXSIZE,
+    retries: int = HTTP_RETRY_TOTAL,
+    timeout: Any = HTTP_DEFAULT_TIMEOUT,
+) -> requests.Session:
+    """커넥션 풀 + 재시도 정책이 설정된 세션 생성"""
+    retry = JitteredRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # 마지막 응답은 그대로 반환 (호출부에서 status 확인)
+    )
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+        timeout=timeout,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# 프로세스 공용 세션
+http_session = build_session()
+
+
+__all__ = [
+    "HTTP_DEFAULT_TIMEOUT",
+    "build_session",
+    "http_session",
+]
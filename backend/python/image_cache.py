@@ -0,0 +1,199 @@
+"""
+이미지 분석 결과 캐시 (이미지 내용 해시 기반).
+
+같은 제품 사진이 반복 업로드되면 Vision / Gemini를 다시 호출하지 않고 저장된 결과를 반환한다.
+- 정확 일치: 정규화 이미지(EXIF 회전 적용·축소 후 RGB 픽셀, image_preprocess)의 SHA-256
+  → 메타데이터만 다른 파일도 같은 키
+  (완전히 같은 파일은 원본 바이트 SHA-256만으로 디코딩 없이 찾음)
+- 유사 일치: 64비트 dHash, 해밍 거리 IMAGE_CACHE_DHASH_MAX_DISTANCE 이하이면 같은 이미지로 간주
+  (재압축·리사이즈된 사본). 서명을 8개 밴드로 나눠 같은 밴드 값을 가진 항목만 비교
+- 저장소: IMAGE_CACHE_BACKEND=sqlite(기본, cache/image_results.sqlite3) | memory, TTL + LRU 개수 제한
+분석 오류나 보강 단계가 마감 시간에 걸린 불완전한 결과는 저장하지 않는다.
+"""
+import hashlib
+import io
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+try:
+    from .kv_store import open_store
+except ImportError:
+    from kv_store import open_store  # type: ignore
+
+IMAGE_CACHE_ENABLED = os.getenv("IMAGE_CACHE_ENABLED", "1").lower() in ("1", "true", "yes")
+IMAGE_CACHE_BACKEND = os.getenv("IMAGE_CACHE_BACKEND") or None
+IMAGE_CACHE_TTL_SEC = int(os.getenv("IMAGE_CACHE_TTL_SEC", str(7 * 24 * 3600)))
+IMAGE_CACHE_MAX_ENTRIES = int(os.getenv("IMAGE_CACHE_MAX_ENTRIES", "5000"))
+IMAGE_CACHE_DHASH_MAX_DISTANCE = int(os.getenv("IMAGE_CACHE_DHASH_MAX_DISTANCE", "4"))
+# 결과 형식이 바뀌면 올려서 이전 결과가 재사용되지 않게 한다
+IMAGE_CACHE_VERSION = "v2"
+
+_DHASH_BANDS = 8
+_BAND_BITS = 64 // _DHASH_BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+_BAND_BUCKET_MAX = 16
+
+
+class ImageFingerprint:
+    """이미지 1장의 SHA-256(정규화 픽셀) + dHash. raw_sha256은 원본 파일 바이트 해시"""
+
+    def __init__(self, sha256: str, dhash: Optional[int], raw_sha256: Optional[str] = None):
+        self.sha256 = sha256
+        self.dhash = dhash
+        self.raw_sha256 = raw_sha256
+
+
+def dhash(image: Image.Image) -> int:
+    """64비트 차이 해시 (9x8 흑백 축소 후 가로 인접 픽셀 비교)"""
+    small = image.convert("L").resize((9, 8), Image.LANCZOS)
+    pixels = list(small.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (1 if left > right else 0)
+    return value
+
+
+def raw_sha256(image_bytes: bytes) -> str:
+    return hashlib.sha256(image_bytes).hexdigest()
+
+
+def fingerprint_pil(img: Image.Image, raw: Optional[str] = None) -> ImageFingerprint:
+    """디코딩(회전 보정·축소)된 이미지의 지문"""
+    rgb = img.convert("RGB")
+    digest = hashlib.sha256()
+    digest.update(f"{rgb.width}x{rgb.height}:".encode("ascii"))
+    digest.update(rgb.tobytes())
+    return ImageFingerprint(digest.hexdigest(), dhash(rgb), raw)
+
+
+def fingerprint_image(image_bytes: bytes) -> ImageFingerprint:
+    """이미지 바이트의 지문 (전체 디코딩). 디코딩할 수 없는 파일은 원본 바이트 해시만 사용"""
+    raw = raw_sha256(image_bytes)
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            return fingerprint_pil(ImageOps.exif_transpose(img), raw)
+    except Exception:
+        return ImageFingerprint(raw, None, raw)
+
+
+def _bands(value: int) -> List[Tuple[int, int]]:
+    return [(band, (value >> (band * _BAND_BITS)) & _BAND_MASK) for band in range(_DHASH_BANDS)]
+
+
+class ImageResultCache:
+    """이미지 지문 → 분석 결과"""
+
+    def __init__(self, store: Any, max_distance: int = IMAGE_CACHE_DHASH_MAX_DISTANCE):
+        self._store = store
+        self.max_distance = min(max_distance, _DHASH_BANDS - 1)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "near_hits": 0, "misses": 0}
+
+    @staticmethod
+    def _result_key(sha256: str) -> str:
+        return f"{IMAGE_CACHE_VERSION}:sha:{sha256}"
+
+    @staticmethod
+    def _raw_key(raw: str) -> str:
+        return f"{IMAGE_CACHE_VERSION}:raw:{raw}"
+
+    @staticmethod
+    def _band_key(band: int, value: int) -> str:
+        return f"{IMAGE_CACHE_VERSION}:dh:{band}:{value}"
+
+    def get_by_raw_sha(self, raw: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """업로드 파일 바이트 해시로 조회 (같은 파일이면 디코딩 없이 적중). 미스는 통계에 넣지 않음"""
+        sha = self._store.get(self._raw_key(raw))
+        if sha:
+            entry = self._store.get(self._result_key(sha))
+            if entry is not None:
+                self._count("hits")
+                return entry["result"], {"hit": True, "match": "exact"}
+        return None
+
+    def get(self, fp: ImageFingerprint) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """(결과, 적중 정보) 또는 None"""
+        entry = self._store.get(self._result_key(fp.sha256))
+        if entry is not None:
+            self._count("hits")
+            return entry["result"], {"hit": True, "match": "exact"}
+        if fp.dhash is not None and self.max_distance >= 0:
+            best: Optional[Tuple[int, str]] = None
+            for band, value in _bands(fp.dhash):
+                for other_hash, other_sha in self._store.get(self._band_key(band, value)) or []:
+                    distance = bin(fp.dhash ^ int(other_hash)).count("1")
+                    if distance <= self.max_distance and (best is None or distance < best[0]):
+                        best = (distance, other_sha)
+            if best is not None:
+                entry = self._store.get(self._result_key(best[1]))
+                if entry is not None:
+                    self._count("near_hits")
+                    return entry["result"], {"hit": True, "match": "perceptual", "distance": best[0]}
+        self._count("misses")
+        return None
+
+    def put(self, fp: ImageFingerprint, result: Dict[str, Any]) -> None:
+        if not is_cacheable_result(result):
+            return
+        self._store.set(self._result_key(fp.sha256), {"result": result})
+        if fp.raw_sha256:
+            self._store.set(self._raw_key(fp.raw_sha256), fp.sha256)
+        if fp.dhash is None:
+            return
+        for band, value in _bands(fp.dhash):
+            key = self._band_key(band, value)
+            bucket = [item for item in (self._store.get(key) or []) if item[1] != fp.sha256]
+            bucket.append([str(fp.dhash), fp.sha256])
+            self._store.set(key, bucket[-_BAND_BUCKET_MAX:])
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["near_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["near_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+
+def is_cacheable_result(result: Dict[str, Any]) -> bool:
+    """식별에 성공했고 보강 단계가 모두 끝난 결과만 저장"""
+    if not result or result.get("enrichment_incomplete"):
+        return False
+    for key in ("primary", "fallback"):
+        part = result.get(key) or {}
+        if not part.get("error") and any(part.get(f) for f in ("object", "brand", "company")):
+            return True
+    return False
+
+
+image_result_cache = ImageResultCache(
+    open_store(
+        "image_results",
+        backend=IMAGE_CACHE_BACKEND,
+        # 결과 1건 + 원본 해시 1건 + dHash 밴드 8건
+        max_entries=IMAGE_CACHE_MAX_ENTRIES * (_DHASH_BANDS + 2),
+        ttl_sec=IMAGE_CACHE_TTL_SEC,
+    )
+)
+
+
+__all__ = [
+    "IMAGE_CACHE_ENABLED",
+    "ImageFingerprint",
+    "ImageResultCache",
+    "dhash",
+    "fingerprint_image",
+    "fingerprint_pil",
+    "image_result_cache",
+    "is_cacheable_result",
+    "raw_sha256",
+]
@@ -0,0 +1,121 @@
+"""
+업로드 이미지 전처리 (Vision / Gemini 호출 전 축소).
+
+휴대폰 원본 사진(3~12MB)을 그대로 보내지 않고 인식 품질에 충분한 크기로 줄여 보낸다.
+- EXIF 회전 정보를 픽셀에 적용 (회전 태그를 무시하는 모델도 바르게 인식)
+- 긴 변을 IMAGE_MAX_SIDE(기본 1600px) 이하로 축소 (확대는 하지 않음)
+- IMAGE_OUTPUT_FORMAT(jpeg|webp), IMAGE_OUTPUT_QUALITY로 재인코딩
+  이미 충분히 작은 JPEG이고 회전 태그가 없으면 원본 바이트를 그대로 사용
+- 업로드는 메모리에 복사하지 않고 스트림에서 바로 해시 계산 / 디코딩
+업로드 크기 제한은 MAX_CONTENT_LENGTH(IMAGE_MAX_UPLOAD_BYTES)로 요청을 받는 단계에서 적용한다
+(배치 분석은 요청 전체에 VISION_BATCH_MAX_UPLOAD_BYTES, 파일마다 IMAGE_MAX_UPLOAD_BYTES).
+"""
+import hashlib
+import io
+import os
+from typing import IO, Tuple
+
+from PIL import Image, ImageOps
+
+IMAGE_MAX_SIDE = int(os.getenv("IMAGE_MAX_SIDE", "1600"))
+IMAGE_OUTPUT_FORMAT = os.getenv("IMAGE_OUTPUT_FORMAT", "jpeg").strip().lower()
+IMAGE_OUTPUT_QUALITY = int(os.getenv("IMAGE_OUTPUT_QUALITY", "85"))
+IMAGE_MAX_UPLOAD_BYTES = int(os.getenv("IMAGE_MAX_UPLOAD_BYTES", str(20 * 1024 * 1024)))
+# 이 크기 이하의 JPEG은 축소가 필요 없으면 재인코딩하지 않음
+IMAGE_PASSTHROUGH_BYTES = 1024 * 1024
+# 압축 폭탄 방지 (약 50MP)
+IMAGE_MAX_PIXELS = int(os.getenv("IMAGE_MAX_PIXELS", str(50_000_000)))
+
+_EXIF_ORIENTATION = 0x0112
+_HASH_CHUNK = 256 * 1024
+
+
+class ImagePreprocessError(Exception):
+    """이미지를 디코딩할 수 없거나 제한을 넘는 경우"""
+
+
+class PreparedImage:
+    """전처리 결과"""
+
+    def __init__(self, content: bytes, image: Image.Image, mime_type: str,
+                 original_bytes: int, original_size: Tuple[int, int]):
+        self.content = content
+        self.image = image
+        self.mime_type = mime_type
+        self.original_bytes = original_bytes
+        self.original_size = original_size
+
+    def info(self) -> dict:
+        return {
+            "original_bytes": self.original_bytes,
+            "original_size": list(self.original_size),
+            "sent_bytes": len(self.content),
+            "sent_size": [self.image.width, self.image.height],
+            "mime_type": self.mime_type,
+        }
+
+
+def hash_stream(stream: IO[bytes]) -> Tuple[str, int]:
+    """스트림 전체의 SHA-256과 크기 (읽은 뒤 처음 위치로 되돌림)"""
+    digest = hashlib.sha256()
+    size = 0
+    stream.seek(0)
+    while True:
+        chunk = stream.read(_HASH_CHUNK)
+        if not chunk:
+            break
+        digest.update(chunk)
+        size += len(chunk)
+    stream.seek(0)
+    return digest.hexdigest(), size
+
+
+def preprocess_image(stream: IO[bytes], original_bytes: int = 0) -> PreparedImage:
+    """업로드 스트림 → 회전 보정 / 축소 / 재인코딩된 이미지"""
+    stream.seek(0)
+    try:
+        img = Image.open(stream)
+        width, height = img.size
+        if width * height > IMAGE_MAX_PIXELS:
+            raise ImagePreprocessError(f"이미지 해상도가 너무 큽니다 ({width}x{height}).")
+        source_format = img.format
+        orientation = img.getexif().get(_EXIF_ORIENTATION, 1)
+        needs_resize = max(width, height) > IMAGE_MAX_SIDE
+
+        if (source_format == "JPEG" and not needs_resize and orientation in (0, 1)
+                and 0 < original_bytes <= IMAGE_PASSTHROUGH_BYTES):
+            stream.seek(0)
+            content = stream.read()
+            img.load()
+            return PreparedImage(content, img.convert("RGB"), "image/jpeg", original_bytes, (width, height))
+
+        if needs_resize and source_format == "JPEG":
+            # JPEG은 디코딩 단계에서 1/2~1/8로 줄여 읽어 메모리/시간 절약
+            img.draft("RGB", (IMAGE_MAX_SIDE, IMAGE_MAX_SIDE))
+        img = ImageOps.exif_transpose(img)
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        if max(img.size) > IMAGE_MAX_SIDE:
+            img.thumbnail((IMAGE_MAX_SIDE, IMAGE_MAX_SIDE), Image.LANCZOS)
+    except ImagePreprocessError:
+        raise
+    except Exception as exc:
+        raise ImagePreprocessError("이미지를 읽을 수 없습니다. JPEG/PNG/WebP 파일을 올려주세요.") from exc
+
+    buffer = io.BytesIO()
+    if IMAGE_OUTPUT_FORMAT == "webp":
+        img.save(buffer, format="WEBP", quality=IMAGE_OUTPUT_QUALITY, method=4)
+        mime_type = "image/webp"
+    else:
+        img.save(buffer, format="JPEG", quality=IMAGE_OUTPUT_QUALITY, optimize=True)
+        mime_type = "image/jpeg"
+    return PreparedImage(buffer.getvalue(), img, mime_type, original_bytes, (width, height))
+
+
+__all__ = [
+    "IMAGE_MAX_UPLOAD_BYTES",
+    "ImagePreprocessError",
+    "PreparedImage",
+    "hash_stream",
+    "preprocess_image",
+]
@@ -0,0 +1,108 @@
+"""
+Flask JSON 프로바이더 (orjson).
+
+jsonify가 중첩 dict를 순수 파이썬으로 순회하던 기본 json 모듈 대신 orjson으로 직렬화한다.
+- NumPy 스칼라/배열, pandas Timestamp/Series를 float()/tolist() 변환 없이 그대로 직렬화
+- NaN/Inf는 null (기본 json은 브라우저가 파싱하지 못하는 NaN을 출력)
+- 한글은 \\uXXXX 이스케이프 없이 UTF-8 그대로 출력 (응답 크기 감소)
+orjson이 없으면 같은 변환 규칙으로 기본 json 모듈을 사용한다.
+"""
+import datetime
+import decimal
+import json
+import math
+import uuid
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # 선택 의존성
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None  # type: ignore
+
+_ORJSON_OPTIONS = (
+    (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC)
+    if ORJSON_AVAILABLE else 0
+)
+
+
+def _to_jsonable(o: Any) -> Any:
+    """orjson / json이 기본으로 처리하지 못하는 값 변환"""
+    if np is not None:
+        if isinstance(o, np.generic):
+            value = o.item()
+            if isinstance(value, float) and not math.isfinite(value):
+                return None
+            return value
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+    if pd is not None:
+        if o is pd.NaT:
+            return None
+        if isinstance(o, pd.Timestamp):
+            return o.isoformat()
+        if isinstance(o, (pd.Series, pd.Index)):
+            return o.tolist()
+        if isinstance(o, pd.DataFrame):
+            return o.to_dict(orient="records")
+    if isinstance(o, decimal.Decimal):
+        return float(o)
+    if isinstance(o, (set, frozenset, tuple)):
+        return list(o)
+    if isinstance(o, (datetime.date, datetime.datetime)):
+        return o.isoformat()
+    if isinstance(o, uuid.UUID):
+        return str(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """객체 → UTF-8 JSON 바이트"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=_to_jsonable, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # 64비트를 넘는 정수 등 orjson이 거부하는 값은 기본 json으로 처리
+            pass
+    return json.dumps(obj, default=_to_jsonable, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """app.json 교체용 프로바이더 (jsonify / request.get_json 모두 적용)"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            kwargs.setdefault("default", _to_jsonable)
+            return json.dumps(obj, **kwargs)
+        return dumps_bytes(obj).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if ORJSON_AVAILABLE and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj) + b"\n", mimetype=self.mimetype)
+
+
+__all__ = [
+    "ORJSONProvider",
+    "ORJSON_AVAILABLE",
+    "dumps_bytes",
+]
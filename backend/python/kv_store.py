@@ -0,0 +1,168 @@
+"""
+간단한 키-값 저장소 (SQLite 영구 저장 / 메모리 대체 구현).
+
+번역·요약 등 결과 캐시에서 공통으로 사용한다.
+- SqliteKVStore: cache/ 아래 SQLite 파일. 같은 서버의 여러 워커 프로세스가 공유 (WAL 모드)
+- MemoryKVStore: 테스트·로컬 실행용 프로세스 내 구현 (동일 인터페이스)
+값은 JSON 직렬화 가능한 객체여야 한다. ttl_sec이 지나면 만료되고, max_entries를 넘으면
+마지막 접근 시각이 오래된 항목부터 삭제(LRU)한다.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+CACHE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'cache')
+
+
+class MemoryKVStore:
+    """프로세스 내 LRU 저장소"""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_sec: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            created_at, value = item
+            if self.ttl_sec is not None and time.time() - created_at > self.ttl_sec:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.time(), value)
+            self._data.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self._data) > self.max_entries:
+                    self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SqliteKVStore:
+    """SQLite 파일 기반 LRU/TTL 저장소"""
+
+    def __init__(self, path: str, max_entries: Optional[int] = None, ttl_sec: Optional[float] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS kv ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS kv_accessed ON kv(accessed_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute("SELECT value, created_at FROM kv WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                if self.ttl_sec is not None and now - row[1] > self.ttl_sec:
+                    conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+                conn.execute("UPDATE kv SET accessed_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as exc:
+            print(f"[WARN] 캐시 조회 실패 ({os.path.basename(self.path)}): {exc}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        try:
+            payload = json.dumps(value, ensure_ascii=False)
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO kv (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, payload, now, now),
+                )
+                conn.commit()
+                self._writes += 1
+                # 매 쓰기마다 COUNT를 하지 않도록 일정 주기로만 정리
+                if self._writes % 50 == 0:
+                    self._evict_locked(conn, now)
+        except (sqlite3.Error, TypeError, ValueError) as exc:
+            print(f"[WARN] 캐시 저장 실패 ({os.path.basename(self.path)}): {exc}")
+
+    def _evict_locked(self, conn: sqlite3.Connection, now: float) -> None:
+        if self.ttl_sec is not None:
+            conn.execute("DELETE FROM kv WHERE created_at < ?", (now - self.ttl_sec,))
+        if self.max_entries is not None:
+            (count,) = conn.execute("SELECT COUNT(*) FROM kv").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                conn.execute(
+                    "DELETE FROM kv WHERE key IN (SELECT key FROM kv ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+        conn.commit()
+
+    def delete(self, key: str) -> None:
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+                conn.commit()
+        except sqlite3.Error as exc:
+            print(f"[WARN] 캐시 삭제 실패 ({os.path.basename(self.path)}): {exc}")
+
+    def __len__(self) -> int:
+        try:
+            with self._lock:
+                (count,) = self._connect().execute("SELECT COUNT(*) FROM kv").fetchone()
+            return int(count)
+        except sqlite3.Error:
+            return 0
+
+
+def open_store(name: str, backend: Optional[str] = None, **kwargs: Any):
+    """이름으로 저장소 생성. backend: "sqlite"(기본) 또는 "memory" """
+    backend = (backend or os.getenv("CACHE_STORE_BACKEND", "sqlite")).strip().lower()
+    if backend == "memory":
+        return MemoryKVStore(**kwargs)
+    return SqliteKVStore(os.path.join(CACHE_ROOT, f"{name}.sqlite3"), **kwargs)
+
+
+__all__ = [
+    "MemoryKVStore",
+    "SqliteKVStore",
+    "open_store",
+]
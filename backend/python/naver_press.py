@@ -0,0 +1,151 @@
+"""
+네이버 뉴스 언론사 추정 (oid → 언론사명 테이블).
+
+네이버 기사 주소에는 언론사 번호(oid)가 들어 있으므로, 한 번 알아낸 언론사명을 oid별로 저장해 두면
+이후에는 URL만으로 언론사를 알 수 있다.
+- 테이블: cache/naver_press.json (알려진 주요 언론사로 초기화, 새로 추정한 결과를 추가)
+- 테이블에 없는 oid만 기사 페이지를 스트리밍으로 받아 앞부분에서 메타 태그를 찾으면 즉시 중단
+  테이블에는 언론사 전용 메타(og:article:author, data-office-name)에서 찾은 이름만 기록하고,
+  aria-label 같은 약한 단서는 해당 기사에만 사용
+"""
+import codecs
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Optional, Tuple
+
+try:
+    from .article_cache import CACHE_ROOT
+    from .article_extractor import MAX_PRESS_HTML, extract_press_match
+    from .news_dedup import naver_article_ids
+    from .http_client import http_session
+except ImportError:
+    from article_cache import CACHE_ROOT  # type: ignore
+    from article_extractor import MAX_PRESS_HTML, extract_press_match  # type: ignore
+    from news_dedup import naver_article_ids  # type: ignore
+    from http_client import http_session  # type: ignore
+
+NAVER_PRESS_TABLE_PATH = os.getenv("NAVER_PRESS_TABLE_PATH", os.path.join(CACHE_ROOT, "naver_press.json"))
+PRESS_FETCH_CHUNK = 16 * 1024
+
+# 네이버 언론사 번호(oid) → 언론사명 (화이트리스트 언론사 + 연합뉴스)
+KNOWN_NAVER_PRESS = {
+    "001": "연합뉴스",
+    "008": "머니투데이",
+    "009": "매일경제",
+    "011": "서울경제",
+    "014": "파이낸셜뉴스",
+    "015": "한국경제",
+    "020": "동아일보",
+    "023": "조선일보",
+    "025": "중앙일보",
+    "028": "한겨레",
+    "032": "경향신문",
+    "277": "아시아경제",
+    "469": "한국일보",
+}
+
+
+class NaverPressTable:
+    """oid → 언론사명 영구 테이블"""
+
+    def __init__(self, path: str = NAVER_PRESS_TABLE_PATH, seed: Optional[Dict[str, str]] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._table: Dict[str, str] = dict(seed or {})
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if isinstance(stored, dict):
+                self._table.update({str(k): str(v) for k, v in stored.items() if v})
+        except (OSError, ValueError):
+            pass
+
+    def get(self, oid: str) -> Optional[str]:
+        with self._lock:
+            return self._table.get(oid)
+
+    def learn(self, oid: str, press: str) -> None:
+        """새로 알아낸 oid를 테이블에 추가하고 파일에 저장"""
+        with self._lock:
+            if not oid or not press or self._table.get(oid) == press:
+                return
+            self._table[oid] = press
+            data = json.dumps(self._table, ensure_ascii=False, indent=0, sort_keys=True)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            print(f"[WARN] 언론사 테이블 저장 실패: {exc}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._table)
+
+
+def fetch_press_streamed(link: str, timeout: float = 2) -> Optional[str]:
+    """기사 페이지를 조금씩 내려받으며 언론사 메타 태그가 나오면 바로 중단"""
+    return _fetch_press_match(link, timeout)[0]
+
+
+def _fetch_press_match(link: str, timeout: float) -> Tuple[Optional[str], bool]:
+    """(언론사명, 언론사 전용 메타 여부). 약한 단서만 찾은 동안은 전용 메타가 나올 때까지 계속 받음"""
+    with http_session.get(link, headers={"User-Agent": "Mozilla/5.0"}, timeout=timeout, stream=True) as r:
+        if r.status_code >= 400:
+            return None, False
+        # Content-Type에 charset이 없으면 requests가 ISO-8859-1로 가정하므로 UTF-8로 처리
+        encoding = r.encoding if r.encoding and r.encoding.lower() != "iso-8859-1" else "utf-8"
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        buffer = ""
+        received = 0
+        for chunk in r.iter_content(chunk_size=PRESS_FETCH_CHUNK):
+            if not chunk:
+                continue
+            received += len(chunk)
+            buffer += decoder.decode(chunk)
+            if received >= MAX_PRESS_HTML:
+                break
+            press, authoritative = extract_press_match(buffer)
+            if authoritative:
+                return press, True
+        return extract_press_match(buffer)
+    return None, False
+
+
+naver_press_table = NaverPressTable(seed=KNOWN_NAVER_PRESS)
+
+
+def press_from_naver_url(link: str) -> Optional[str]:
+    """URL의 oid만으로 언론사명 조회 (네트워크 요청 없음)"""
+    ids = naver_article_ids(link)
+    return naver_press_table.get(ids[0]) if ids else None
+
+
+def infer_naver_press(link: str, timeout: float = 2) -> Optional[str]:
+    """oid 테이블 → 스트리밍 추출 순서로 언론사명 추정하고, 전용 메타에서 알아낸 결과만 테이블에 기록"""
+    ids = naver_article_ids(link)
+    if ids:
+        press = naver_press_table.get(ids[0])
+        if press:
+            return press
+    press, authoritative = _fetch_press_match(link, timeout)
+    if press and authoritative and ids:
+        naver_press_table.learn(ids[0], press)
+    return press
+
+
+__all__ = [
+    "KNOWN_NAVER_PRESS",
+    "NaverPressTable",
+    "fetch_press_streamed",
+    "infer_naver_press",
+    "naver_press_table",
+    "press_from_naver_url",
+]
@@ -0,0 +1,159 @@
+"""
+뉴스 중복 제거 (SimHash + LSH 밴드).
+
+제목과 리드 문단으로 64비트 SimHash 서명을 만들고, 서명을 NEWS_DEDUP_BANDS개 밴드로 나눠
+같은 밴드 값을 가진 기사끼리만 해밍 거리를 비교한다. 해밍 거리가 NEWS_DEDUP_MAX_DISTANCE 이하이면
+중복으로 본다 (밴드 수 > 최대 거리이므로 비둘기집 원리에 따라 후보 누락이 없음).
+기사 1건당 비용이 일정하므로 전체 비용은 기사 수에 선형이다.
+
+URL은 추적 파라미터를 제거하고, 네이버 뉴스는 oid/aid(언론사/기사 번호)로 정규화해
+모바일·PC·구형 주소가 같은 기사로 인식되도록 한다.
+네이버 / FMP / Chroma 뉴스 경로에서 공통으로 사용한다.
+"""
+import hashlib
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    from .article_cache import canonical_url
+except ImportError:
+    from article_cache import canonical_url  # type: ignore
+
+NEWS_DEDUP_MAX_DISTANCE = int(os.getenv("NEWS_DEDUP_MAX_DISTANCE", "7"))
+NEWS_DEDUP_BANDS = 8
+NEWS_DEDUP_LEAD_CHARS = 300
+_SIGNATURE_BITS = 64
+_BAND_BITS = _SIGNATURE_BITS // NEWS_DEDUP_BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+_NAVER_PATH_IDS = re.compile(r"/(?:mnews/)?article/(?:\d+/)?(\d{3})/(\d{10})")
+_NORMALIZE = re.compile(r"[^0-9a-z가-힣]+")
+
+
+def naver_article_ids(url: str) -> Optional[Tuple[str, str]]:
+    """네이버 뉴스 URL → (oid, aid). 네이버 기사 주소가 아니면 None"""
+    if not url:
+        return None
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return None
+    if not parts.netloc.lower().endswith("news.naver.com"):
+        return None
+    m = _NAVER_PATH_IDS.search(parts.path)
+    if m:
+        return m.group(1), m.group(2)
+    query = parse_qs(parts.query)
+    if query.get("oid") and query.get("aid"):
+        return query["oid"][0], query["aid"][0]
+    return None
+
+
+def canonical_news_url(url: str) -> str:
+    """중복 판단용 기사 URL (네이버 뉴스는 naver:oid/aid)"""
+    if not url:
+        return ""
+    ids = naver_article_ids(url)
+    if ids:
+        return f"naver:{ids[0]}/{ids[1]}"
+    return canonical_url(url)
+
+
+def _features(text: str) -> Dict[str, int]:
+    """공백·기호를 제거한 문자 2-gram 빈도 (한글/영문 모두 형태소 분석 없이 동작)"""
+    compact = _NORMALIZE.sub("", (text or "").lower())
+    features: Dict[str, int] = {}
+    if len(compact) < 2:
+        if compact:
+            features[compact] = 1
+        return features
+    for i in range(len(compact) - 1):
+        gram = compact[i:i + 2]
+        features[gram] = features.get(gram, 0) + 1
+    return features
+
+
+def simhash(text: str) -> int:
+    """64비트 SimHash 서명"""
+    weights = [0] * _SIGNATURE_BITS
+    for feature, count in _features(text).items():
+        h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(_SIGNATURE_BITS):
+            weights[bit] += count if (h >> bit) & 1 else -count
+    signature = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            signature |= 1 << bit
+    return signature
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class NewsDeduplicator:
+    """기사를 하나씩 넣으면서 이미 본 기사(URL 또는 유사 내용)인지 판단"""
+
+    def __init__(self, max_distance: int = NEWS_DEDUP_MAX_DISTANCE):
+        self.max_distance = min(max_distance, NEWS_DEDUP_BANDS - 1)
+        self._urls: set = set()
+        self._buckets: Dict[Tuple[int, int], List[Tuple[int, str]]] = {}
+
+    @staticmethod
+    def signature_text(title: str, text: str = "") -> str:
+        return f"{title or ''} {(text or '')[:NEWS_DEDUP_LEAD_CHARS]}"
+
+    def _lookup(self, signature: int, key: str) -> Optional[Tuple[str, int]]:
+        if key and key in self._urls:
+            return ("url", 0)
+        for band in range(NEWS_DEDUP_BANDS):
+            value = (signature >> (band * _BAND_BITS)) & _BAND_MASK
+            for other, other_title in self._buckets.get((band, value), ()):
+                distance = hamming_distance(signature, other)
+                if distance <= self.max_distance:
+                    return (other_title, distance)
+        return None
+
+    def find_duplicate(self, title: str, text: str = "", url: str = "") -> Optional[Tuple[str, int]]:
+        """중복이면 (기존 제목 또는 "url", 해밍 거리), 아니면 None. 등록은 하지 않음"""
+        return self._lookup(simhash(self.signature_text(title, text)), canonical_news_url(url))
+
+    def add(self, title: str, text: str = "", url: str = "") -> bool:
+        """새 기사면 등록 후 True, 중복이면 False"""
+        key = canonical_news_url(url)
+        signature = simhash(self.signature_text(title, text))
+        if self._lookup(signature, key) is not None:
+            return False
+        if key:
+            self._urls.add(key)
+        for band in range(NEWS_DEDUP_BANDS):
+            value = (signature >> (band * _BAND_BITS)) & _BAND_MASK
+            self._buckets.setdefault((band, value), []).append((signature, title or ""))
+        return True
+
+
+def dedupe_news(
+    items: Iterable[Dict[str, Any]],
+    title_key: str = "title",
+    text_key: str = "summary",
+    url_key: str = "url",
+    deduplicator: Optional[NewsDeduplicator] = None,
+) -> List[Dict[str, Any]]:
+    """순서를 유지하며 중복 기사 제거 (앞선 기사를 남김)"""
+    dedup = deduplicator or NewsDeduplicator()
+    return [
+        item for item in items
+        if dedup.add(item.get(title_key) or "", item.get(text_key) or "", item.get(url_key) or "")
+    ]
+
+
+__all__ = [
+    "NewsDeduplicator",
+    "canonical_news_url",
+    "dedupe_news",
+    "hamming_distance",
+    "naver_article_ids",
+    "simhash",
+]
@@ -0,0 +1,56 @@
+"""
+스레드 안전 토큰 버킷 레이트 리미터.
+
+고정 sleep 대신 여러 스레드가 하나의 버킷을 공유하여 외부 API 호출 속도를 제한한다.
+"""
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """초당 rate개의 토큰을 채우고 최대 burst개까지 쌓아두는 토큰 버킷"""
+
+    def __init__(self, rate_per_sec: float, burst: Optional[int] = None):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        self.rate = float(rate_per_sec)
+        # 용량이 1 미만이면 acquire()가 토큰 1개를 영원히 얻지 못함 (예: rate 0.5 → int() 0)
+        self.capacity = float(max(1, burst if burst is not None else int(rate_per_sec)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """토큰을 얻을 때까지 대기. timeout 안에 얻지 못하면 False"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+__all__ = ["RateLimiter"]
@@ -1,19 +1,19 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Request, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
 import FinanceDataReader as fdr
 from datetime import datetime, timedelta, timezone
 import pandas as pd
 import requests
 import time
 import re
-import difflib
+import heapq
 import os
 import json
+import threading
 from urllib.parse import urlencode, urlparse
 from typing import List, Dict, Optional, Union, Any, Tuple
-from deep_translator import GoogleTranslator
 from openai import OpenAI
-from newspaper import Article, ArticleException
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 from pathlib import Path
@@ -21,65 +21,30 @@ from pathlib import Path
 # 환경 변수 로드를 먼저 수행 (chroma_client.py가 모듈 임포트 시 환경 변수를 읽으므로)
 load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
-# ChromaDB 관련 함수 - optional (Vercel에서는 크기 제한으로 인해 제외)
-print('[INFO] ChromaDB 모듈 로드 시도 중...')
+# ChromaDB 관련 함수 - optional
+# chroma_client는 기본적으로 HTTP 모드(chroma_http)로 동작하므로 chromadb 패키지 없이도 로드된다.
+# CHROMADB_CLIENT_MODE=sdk 인 경우에만 chromadb가 첫 조회 시점에 지연 import 된다.
 CHROMADB_AVAILABLE = False
 try:
-    import sys
-    import os
-    
-    # 현재 파일의 디렉토리 경로
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    print(f'[DEBUG] server.py 위치: {current_dir}')
-    
-    # 직접 import를 먼저 시도 (AWS EB에서 가장 확실한 방법)
     try:
-        print('[DEBUG] ChromaDB 직접 import 시도: from chroma_client import ...')
-        # 현재 디렉토리를 sys.path에 추가
-        if current_dir not in sys.path:
-            sys.path.insert(0, current_dir)
-        from chroma_client import (
+        from .chroma_client import (
             fetch_us_stock_news,
             fetch_kr_stock_news,
             fetch_us_financials_from_chroma,
             fetch_kr_financials_from_chroma,
             fetch_earnings_call_summary,
         )
-        CHROMADB_AVAILABLE = True
-        print('[OK] ChromaDB 모듈 로드 성공 (직접 import)')
-    except ImportError as e3:
-        print(f'[DEBUG] ChromaDB 직접 import 실패: {e3}')
-        # 상대 import 시도
-        try:
-            print('[DEBUG] ChromaDB 상대 import 시도: from .chroma_client import ...')
-            from .chroma_client import (
-                fetch_us_stock_news,
-                fetch_kr_stock_news,
-                fetch_us_financials_from_chroma,
-                fetch_kr_financials_from_chroma,
-                fetch_earnings_call_summary,
-            )
-            CHROMADB_AVAILABLE = True
-            print('[OK] ChromaDB 모듈 로드 성공 (상대 import)')
-        except ImportError as e1:
-            print(f'[DEBUG] ChromaDB 상대 import 실패: {e1}')
-            # 절대 import 시도
-            try:
-                print('[DEBUG] ChromaDB 절대 import 시도: from backend.python.chroma_client import ...')
-                from backend.python.chroma_client import (
-                    fetch_us_stock_news,
-                    fetch_kr_stock_news,
-                    fetch_us_financials_from_chroma,
-                    fetch_kr_financials_from_chroma,
-                    fetch_earnings_call_summary,
-                )
-                CHROMADB_AVAILABLE = True
-                print('[OK] ChromaDB 모듈 로드 성공 (절대 import)')
-            except ImportError as e2:
-                print(f'[WARN] ChromaDB 모듈 로드 실패 - 직접: {e3}, 상대: {e1}, 절대: {e2}')
-                raise e2
+    except ImportError:
+        from chroma_client import (  # type: ignore
+            fetch_us_stock_news,
+            fetch_kr_stock_news,
+            fetch_us_financials_from_chroma,
+            fetch_kr_financials_from_chroma,
+            fetch_earnings_call_summary,
+        )
+    CHROMADB_AVAILABLE = True
 except Exception as e:
-    # ChromaDB가 설치되지 않은 경우 또는 다른 오류 (예: Vercel 배포 시)
+    # 모듈 로드 실패 시 더미 함수로 대체
     CHROMADB_AVAILABLE = False
     print(f'[WARN] ChromaDB 사용 불가능: {e}')
     import traceback
@@ -99,14 +64,58 @@ except Exception as e:
 print(f'[INFO] ChromaDB 사용 가능 여부: {CHROMADB_AVAILABLE}')
 
 try:
-    from .vision_bridge import analyze_product_from_image
+    from .vision_bridge import analyze_product_from_image, analyze_products_from_images
+except ImportError:
+    from vision_bridge import analyze_product_from_image, analyze_products_from_images  # type: ignore
+
+try:
+    from .article_fetcher import iter_fetched_articles
+    from .naver_press import infer_naver_press, press_from_naver_url
+    from .article_cache import article_cache
+    from .translation import translate_many
+    from .summary_cache import summary_cache
+    from .news_dedup import NewsDeduplicator
+    from .rate_limiter import RateLimiter
+    from .company_matcher import CompanyMatcher, normalize_company_text, single_company_matcher
+    from .http_client import http_session
+    from .json_provider import ORJSONProvider
+    from .compression import init_compression
+    from .cache_policy import init_cache_policy, no_store
+    from .image_cache import IMAGE_CACHE_ENABLED, fingerprint_pil, image_result_cache
+    from .brand_resolver import brand_resolver
+    from .enrichment_cache import enrichment_cache
+    from .vision_jobs import JobQueueFull, VISION_JOB_POLL_AFTER_SEC, vision_jobs
+    from .image_preprocess import IMAGE_MAX_UPLOAD_BYTES, ImagePreprocessError, hash_stream, preprocess_image
+    from .async_pipelines import async_enabled, fetch_dart_quarters_async, fetch_naver_page_async, run_async, submit_async
 except ImportError:
-    from vision_bridge import analyze_product_from_image  # type: ignore
+    from article_fetcher import iter_fetched_articles  # type: ignore
+    from naver_press import infer_naver_press, press_from_naver_url  # type: ignore
+    from article_cache import article_cache  # type: ignore
+    from translation import translate_many  # type: ignore
+    from summary_cache import summary_cache  # type: ignore
+    from news_dedup import NewsDeduplicator  # type: ignore
+    from rate_limiter import RateLimiter  # type: ignore
+    from company_matcher import CompanyMatcher, normalize_company_text, single_company_matcher  # type: ignore
+    from http_client import http_session  # type: ignore
+    from json_provider import ORJSONProvider  # type: ignore
+    from compression import init_compression  # type: ignore
+    from cache_policy import init_cache_policy, no_store  # type: ignore
+    from image_cache import IMAGE_CACHE_ENABLED, fingerprint_pil, image_result_cache  # type: ignore
+    from brand_resolver import brand_resolver  # type: ignore
+    from enrichment_cache import enrichment_cache  # type: ignore
+    from vision_jobs import JobQueueFull, VISION_JOB_POLL_AFTER_SEC, vision_jobs  # type: ignore
+    from image_preprocess import IMAGE_MAX_UPLOAD_BYTES, ImagePreprocessError, hash_stream, preprocess_image  # type: ignore
+    from async_pipelines import async_enabled, fetch_dart_quarters_async, fetch_naver_page_async, run_async, submit_async  # type: ignore
 
 # DART API는 requests로 직접 호출
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+# 업로드 크기 제한 (초과 시 본문을 끝까지 받지 않고 413). 배치 분석은 _UploadRequest에서 장수만큼 허용
+app.config['MAX_CONTENT_LENGTH'] = IMAGE_MAX_UPLOAD_BYTES
 CORS(app)
+init_compression(app)
+init_cache_policy(app)
 
 # FMP API 키 (무료 티어 사용)
 FMP_API_KEY = os.getenv("FMP_API_KEY")
@@ -423,16 +432,16 @@ def get_stock_chart(symbol):
         if df is None or df.empty:
             return jsonify({'error': '차트 데이터를 가져올 수 없습니다.'}), 500
         
-        chart_data = []
-        for idx, row in df.iterrows():
-            chart_data.append({
-                'date': idx.strftime('%Y-%m-%d'),
-                'open': float(row['Open']),
-                'high': float(row['High']),
-                'low': float(row['Low']),
-                'close': float(row['Close']),
-                'volume': int(row['Volume']) if 'Volume' in row else 0
-            })
+        # 행 단위 iterrows 대신 열 단위로 변환 (NumPy 값은 JSON 프로바이더가 그대로 직렬화)
+        chart_df = pd.DataFrame({
+            'date': df.index.strftime('%Y-%m-%d'),
+            'open': df['Open'].astype(float).to_numpy(),
+            'high': df['High'].astype(float).to_numpy(),
+            'low': df['Low'].astype(float).to_numpy(),
+            'close': df['Close'].astype(float).to_numpy(),
+            'volume': df['Volume'].fillna(0).astype('int64').to_numpy() if 'Volume' in df.columns else 0,
+        })
+        chart_data = chart_df.to_dict(orient='records')
         
         return jsonify({
             'symbol': f'{clean_symbol}.KS',
@@ -449,7 +458,10 @@ NAVER_NEWS_TARGET_COUNT = 10
 NAVER_NEWS_RECENT_DAYS = 60
 NAVER_NEWS_PER_PAGE = 100
 NAVER_NEWS_MAX_PAGES = 5
-NAVER_NEWS_SLEEP_SEC = 0.03
+NAVER_API_RATE_PER_SEC = float(os.getenv("NAVER_API_RATE_PER_SEC", "10"))
+NAVER_NEWS_FETCH_WORKERS = int(os.getenv("NAVER_NEWS_FETCH_WORKERS", "8"))
+# 네이버 검색 API 호출 속도 제한 (모든 요청/스레드 공유)
+_naver_rate_limiter = RateLimiter(NAVER_API_RATE_PER_SEC, burst=max(1, int(NAVER_API_RATE_PER_SEC)))
 
 # 화이트리스트(도메인)
 NAVER_WHITELIST = {
@@ -483,14 +495,6 @@ PRESS_TO_DOMAIN = {
     "아시아경제": "asiae.co.kr",
 }
 
-# 언론사 추정 패턴
-PRESS_META_PATTERNS = [
-    re.compile(r'property=["\']og:article:author["\']\s+content=["\']([^"\']{2,20})["\']', re.I),
-    re.compile(r'data-office-name=["\']([^"\']{2,20})["\']', re.I),
-    re.compile(r'aria-label=["\']([^"\']{2,20})["\']', re.I),
-    re.compile(r'"press_logo"[^>]*alt=["\']([^"\']{2,20})["\']', re.I),
-]
-
 # HTML 태그 제거 정규식
 _TAG = re.compile(r"<.*?>")
 _WS = re.compile(r"\s+")
@@ -525,45 +529,91 @@ def netloc_domain_naver(url: str) -> str:
 
 def normalize_korean_naver(s: str) -> str:
     """한글 정규화"""
-    return re.sub(r"[\s\W_]+", "", s or "").lower()
+    return normalize_company_text(s)
 
 def contains_company_naver(text: str, company: str) -> bool:
-    """회사명 포함 여부 확인"""
-    if not text or not company:
+    """회사명 포함 여부 확인 (회사명별로 컴파일된 매칭기 재사용)"""
+    if not text or not company or not company.strip():
         return False
-    base = company.strip()
-    no_space = normalize_korean_naver(base)
-    if re.search(re.escape(base), text, flags=re.IGNORECASE):
-        return True
-    if no_space and no_space in normalize_korean_naver(text):
-        return True
-    if re.search(r"(?:\(\s*주\s*\)\s*)?" + re.escape(base), text, flags=re.IGNORECASE):
-        return True
-    return False
+    return single_company_matcher(company.strip()).contains(text)
+
+_krx_matcher: Optional[CompanyMatcher] = None
+_krx_matcher_source_id: Optional[int] = None
+_krx_matcher_lock = threading.Lock()
+
+def get_krx_company_matcher() -> Optional[CompanyMatcher]:
+    """KRX 전 종목 회사명 매칭기 (KRX 리스트가 갱신되면 다시 생성)"""
+    global _krx_matcher, _krx_matcher_source_id
+    krx_list = get_krx_list_cached()
+    if krx_list is None or krx_list.empty:
+        return None
+    with _krx_matcher_lock:
+        if _krx_matcher is None or _krx_matcher_source_id != id(krx_list):
+            symbol_col = 'Code' if 'Code' in krx_list.columns else ('Symbol' if 'Symbol' in krx_list.columns else None)
+            name_col = 'Name' if 'Name' in krx_list.columns else '종목명'
+            if symbol_col is None or name_col not in krx_list.columns:
+                return None
+            companies = {
+                str(code): str(name)
+                for code, name in zip(krx_list[symbol_col], krx_list[name_col])
+                if code and name
+            }
+            _krx_matcher = CompanyMatcher(companies)
+            _krx_matcher_source_id = id(krx_list)
+            print(f'[OK] KRX 회사명 매칭기 생성: {len(companies)}개 종목')
+        return _krx_matcher
+
+def _krx_listing_names() -> Dict[str, str]:
+    """브랜드 로컬 매칭 색인용 KRX 종목코드 → 회사명"""
+    matcher = get_krx_company_matcher()
+    if matcher is None:
+        raise RuntimeError('KRX 리스트를 가져오지 못했습니다')
+    return matcher.companies
+
+brand_resolver.register_listing_provider('KRX', _krx_listing_names)
+
+def tag_kr_companies(texts: List[str]) -> List[List[Dict[str, str]]]:
+    """대량 수집용: 텍스트별로 언급된 KRX 상장사 [{'code', 'name'}] 목록"""
+    matcher = get_krx_company_matcher()
+    if matcher is None:
+        return [[] for _ in texts]
+    return [
+        [{'code': code, 'name': name} for code, name in tags]
+        for tags in matcher.tag_many(texts)
+    ]
 
 def infer_press_from_naver(link: str, timeout: int = 4) -> Optional[str]:
-    """네이버 링크에서 언론사 추정"""
+    """네이버 링크에서 언론사 추정 (oid 테이블 우선, 없을 때만 페이지 앞부분 조회)"""
     if not link:
         return None
+    press = press_from_naver_url(link)
+    if press:
+        return press
+    cached = article_cache.get(link)
+    if cached and cached.get("press"):
+        return cached["press"]
     try:
-        r = requests.get(link, headers={"User-Agent": "Mozilla/5.0"}, timeout=timeout)
-        if r.status_code >= 400:
-            return None
-        text = r.text[:200000]
-        for pat in PRESS_META_PATTERNS:
-            m = pat.search(text)
-            if m:
-                press = m.group(1).strip()
-                press = re.sub(r"[\s\u200b]+", "", press)
-                return press
+        press = infer_naver_press(link, timeout=timeout)
+        if press:
+            article_cache.put(link, {"press": press})
+        return press
     except Exception:
         return None
-    return None
 
-def summarize_naver_news(title: str, desc: str) -> str:
-    """OpenAI로 뉴스 요약"""
-    if not openai_client:
-        return desc or ""
+NAVER_SUMMARY_MODEL = "gpt-4"
+NAVER_SUMMARY_PROMPT_VERSION = "naver-v1"
+# off(기본) | cached | on — cached/on은 네이버 기사마다 gpt-4 요약 비용이 발생하므로 명시적으로 켤 때만 사용
+NAVER_NEWS_SUMMARY = os.getenv("NAVER_NEWS_SUMMARY", "off").strip().lower()
+NAVER_SUMMARY_WORKERS = int(os.getenv("NAVER_SUMMARY_WORKERS", "4"))
+_naver_summary_executor = ThreadPoolExecutor(max_workers=NAVER_SUMMARY_WORKERS)
+_naver_summary_pending = set()
+_naver_summary_lock = threading.Lock()
+
+def _naver_summary_text(title: str, desc: str) -> str:
+    return f"{title}\n{desc}"
+
+def _request_naver_summary(title: str, desc: str) -> Optional[Tuple[str, int]]:
+    """OpenAI 호출 → (요약문, 사용 토큰). 실패 시 None"""
     prompt = f"""
 아래 정보를 바탕으로 한국어 6~8줄 bullet 요약을 만들어줘.
 - 확인된 사실/숫자/주체 중심, 과장/추측 금지
@@ -574,7 +624,7 @@ def summarize_naver_news(title: str, desc: str) -> str:
 """
     try:
         resp = openai_client.chat.completions.create(
-            model="gpt-4",
+            model=NAVER_SUMMARY_MODEL,
             messages=[
                 {"role": "system", "content": "경제·금융 뉴스를 정확하게 한국어로 요약하는 분석가"},
                 {"role": "user", "content": prompt}
@@ -582,10 +632,65 @@ def summarize_naver_news(title: str, desc: str) -> str:
             temperature=0.2,
             max_tokens=420,
         )
-        return (resp.choices[0].message.content or "").strip()
+        summary = (resp.choices[0].message.content or "").strip()
+        tokens = getattr(resp.usage, "total_tokens", 0) if getattr(resp, "usage", None) else 0
+        return (summary, tokens) if summary else None
     except Exception as e:
         print(f"[WARN] 요약 실패: {e}")
+        return None
+
+def summarize_naver_news(title: str, desc: str, url: Optional[str] = None) -> str:
+    """OpenAI로 뉴스 요약 (요약 캐시 경유)"""
+    if not openai_client:
         return desc or ""
+    summary = summary_cache.get_or_compute(
+        url, _naver_summary_text(title, desc), NAVER_SUMMARY_MODEL, NAVER_SUMMARY_PROMPT_VERSION,
+        lambda: _request_naver_summary(title, desc),
+    )
+    return summary or desc or ""
+
+def _warm_naver_summary(title: str, desc: str, url: Optional[str]) -> None:
+    """백그라운드 요약 생성 (다음 요청부터 캐시 적중)"""
+    text = _naver_summary_text(title, desc)
+    key = summary_cache.key_for(url, text, NAVER_SUMMARY_MODEL, NAVER_SUMMARY_PROMPT_VERSION)
+    try:
+        if summary_cache.peek(url, text, NAVER_SUMMARY_MODEL, NAVER_SUMMARY_PROMPT_VERSION) is None:
+            result = _request_naver_summary(title, desc)
+            if result:
+                summary_cache.put(url, text, NAVER_SUMMARY_MODEL, NAVER_SUMMARY_PROMPT_VERSION, *result)
+    finally:
+        with _naver_summary_lock:
+            _naver_summary_pending.discard(key)
+
+def apply_naver_summaries(rows: List[Dict]) -> List[Dict]:
+    """
+    네이버 뉴스 행의 summary(원문 요약문)를 LLM 요약으로 교체.
+    - on: 캐시에 없으면 병렬로 바로 요약
+    - cached: 캐시에 있는 요약만 사용하고, 없는 기사는 백그라운드에서 미리 요약
+    - off: 원문 요약문 그대로
+    """
+    if NAVER_NEWS_SUMMARY == "off" or not openai_client or not rows:
+        return rows
+    if NAVER_NEWS_SUMMARY == "on":
+        summaries = list(_naver_summary_executor.map(
+            lambda row: summarize_naver_news(row['title'], row['summary'], row['url']), rows
+        ))
+        for row, summary in zip(rows, summaries):
+            row['summary'] = summary
+        return rows
+    for row in rows:
+        text = _naver_summary_text(row['title'], row['summary'])
+        cached = summary_cache.get(row['url'], text, NAVER_SUMMARY_MODEL, NAVER_SUMMARY_PROMPT_VERSION)
+        if cached:
+            row['summary'] = cached
+            continue
+        key = summary_cache.key_for(row['url'], text, NAVER_SUMMARY_MODEL, NAVER_SUMMARY_PROMPT_VERSION)
+        with _naver_summary_lock:
+            if key in _naver_summary_pending:
+                continue
+            _naver_summary_pending.add(key)
+        _naver_summary_executor.submit(_warm_naver_summary, row['title'], row['summary'], row['url'])
+    return rows
 
 def fetch_naver_news_raw(query: str, start: int, display: int, sort: str) -> List[Dict]:
     """네이버 뉴스 API 호출"""
@@ -595,10 +700,10 @@ def fetch_naver_news_raw(query: str, start: int, display: int, sort: str) -> Lis
     params = {"query": query, "display": display, "start": start, "sort": sort}
     url = f"{NAVER_NEWS_API_URL}?{urlencode(params, safe=':/')}"
     try:
-        r = requests.get(url, headers=headers, timeout=10)
+        _naver_rate_limiter.acquire()
+        r = http_session.get(url, headers=headers, timeout=10)
         if r.status_code == 429:
-            print(f"[WARN] 네이버 API 호출 제한 도달 (429), 잠시 대기...")
-            time.sleep(0.5)
+            print(f"[WARN] 네이버 API 호출 제한 도달 (429)")
             return []
         r.raise_for_status()
         data = r.json()
@@ -610,89 +715,137 @@ def fetch_naver_news_raw(query: str, start: int, display: int, sort: str) -> Lis
         print(f"[ERROR] 예상치 못한 오류: {e}")
         return []
 
-def collect_naver_news(company: str, sort: str = "sim") -> List[Dict]:
-    """네이버 뉴스 수집 (최적화: 요약 생략, 언론사 추정 최소화)"""
+def _naver_row_from_item(it: Dict, company: str, cutoff: datetime, dedup: NewsDeduplicator, infer_press: bool) -> Optional[Dict]:
+    """네이버 검색 결과 1건을 필터링하여 뉴스 행으로 변환 (통과하지 못하면 None)"""
+    title = clean_html_naver(it.get("title"))
+    desc = clean_html_naver(it.get("description"))
+    link = it.get("link") or ""
+    origin = it.get("originallink") or ""
+    pubdt = parse_dt_naver(it.get("pubDate"))
+    if pubdt and pubdt < cutoff:
+        return None
+
+    key = origin or link
+    if not key:
+        return None
+
+    # 회사명 필터
+    if not (contains_company_naver(title, company) or contains_company_naver(desc, company)):
+        return None
+
+    # 중복 기사 (같은 URL / 네이버 oid·aid / 통신사 기사 재전송)
+    if dedup.find_duplicate(title, desc, key) is not None:
+        return None
+
+    # 매체 화이트리스트 (빠른 체크)
+    host = netloc_domain_naver(origin)
+    press_name = None
+    domain_ok = False
+
+    # 원본 링크에서 바로 확인
+    if host in NAVER_WHITELIST_KEYS:
+        domain_ok = True
+        press_name = NAVER_WHITELIST[host]
+    elif infer_press:
+        # 네이버 링크인 경우에만 언론사 추정 시도 (느린 작업)
+        naver_host = netloc_domain_naver(link)
+        if naver_host.endswith("naver.com"):
+            press_name = infer_press_from_naver(link, timeout=2)  # 타임아웃 단축
+            if press_name and press_name in PRESS_TO_DOMAIN:
+                mapped = PRESS_TO_DOMAIN[press_name]
+                if mapped in NAVER_WHITELIST_KEYS:
+                    domain_ok = True
+                    host = mapped
+
+    if not domain_ok:
+        return None
+
+    dedup.add(title, desc, key)
+    # LLM 요약은 최종 선택된 기사에만 적용 (apply_naver_summaries)
+    return {
+        'title': title,
+        'summary': desc or "",  # 원본 요약문 사용
+        'url': key,
+        'date': pubdt.strftime("%Y-%m-%d %H:%M") if pubdt else "",
+        'site': press_name or NAVER_WHITELIST.get(host, host)
+    }
+
+def collect_naver_news(company: str, sorts: Tuple[str, ...] = ("sim", "date")) -> List[Dict]:
+    """
+    네이버 뉴스 수집 (정렬 순서 → 페이지 순서, 필요한 만큼만 요청).
+
+    첫 wave는 정렬 기준마다 1페이지씩 동시에 요청한다.
+    이후에는 결과를 처리하고도 목표 개수에 못 미칠 때만 다음 페이지를 요청한다 (일일 호출 한도 보호).
+    이때 한 번에 보내는 요청 수는 부족분을 채우는 데 필요한 페이지 수(부족분 / 페이지당 개수)까지다.
+    페이지가 가득 차지 않았거나 통과 기사가 없으면 그 정렬은 더 보지 않는다.
+    """
     query = f'"{company}"'
     cutoff = datetime.now(KST) - timedelta(days=NAVER_NEWS_RECENT_DAYS)
     rows: List[Dict] = []
-    seen = set()
-    start = 1
-
-    print(f'네이버 뉴스 검색 중: {query} (최대 {NAVER_NEWS_TARGET_COUNT}개)')
+    dedup = NewsDeduplicator()
 
-    for page in range(1, NAVER_NEWS_MAX_PAGES + 1):
-        items = fetch_naver_news_raw(query, start=start, display=NAVER_NEWS_PER_PAGE, sort=sort)
-        if not items:
-            break
+    print(f'네이버 뉴스 검색 중: {query} {list(sorts)} (최대 {NAVER_NEWS_TARGET_COUNT}개)')
 
-        got_this_page = 0
+    def _consume(items: List[Dict]) -> int:
+        got = 0
         for it in items:
-            title = clean_html_naver(it.get("title"))
-            desc = clean_html_naver(it.get("description"))
-            link = it.get("link") or ""
-            origin = it.get("originallink") or ""
-            pubdt = parse_dt_naver(it.get("pubDate"))
-            if pubdt and pubdt < cutoff:
-                continue
-
-            key = origin or link
-            if not key or key in seen:
-                continue
-            seen.add(key)
-
-            # 회사명 필터
-            if not (contains_company_naver(title, company) or contains_company_naver(desc, company)):
+            if len(rows) >= NAVER_NEWS_TARGET_COUNT:
+                break
+            row = _naver_row_from_item(it, company, cutoff, dedup, infer_press=True)
+            if row is None:
                 continue
+            rows.append(row)
+            got += 1
+            print(f"  [{len(rows):02d}] {row['date']} | {row['site']} | {row['title'][:50]}...")
+        return got
 
-            # 매체 화이트리스트 (빠른 체크)
-            host = netloc_domain_naver(origin)
-            press_name = None
-            domain_ok = False
-            
-            # 원본 링크에서 바로 확인
-            if host in NAVER_WHITELIST_KEYS:
-                domain_ok = True
-                press_name = NAVER_WHITELIST[host]
-            else:
-                # 네이버 링크인 경우에만 언론사 추정 시도 (느린 작업)
-                naver_host = netloc_domain_naver(link)
-                if naver_host.endswith("naver.com") and len(rows) < NAVER_NEWS_TARGET_COUNT:
-                    # 최대 10개만 언론사 추정 (느린 작업)
-                    press_name = infer_press_from_naver(link, timeout=2)  # 타임아웃 단축
-                    if press_name and press_name in PRESS_TO_DOMAIN:
-                        mapped = PRESS_TO_DOMAIN[press_name]
-                        if mapped in NAVER_WHITELIST_KEYS:
-                            domain_ok = True
-                            host = mapped
-
-            if not domain_ok:
-                continue
+    def _start(page: int) -> int:
+        return 1 + (page - 1) * NAVER_NEWS_PER_PAGE
 
-            # 요약은 나중에 또는 생략 (속도 우선)
-            # summary = summarize_naver_news(title, desc)  # 느린 작업 - 생략
-            summary = desc or ""  # 원본 요약문 사용
-            date_kst = pubdt.strftime("%Y-%m-%d %H:%M") if pubdt else ""
-
-            rows.append({
-                'title': title,
-                'summary': summary,
-                'url': origin or link,
-                'date': date_kst,
-                'site': press_name or NAVER_WHITELIST.get(host, host)
-            })
-            got_this_page += 1
+    use_async = async_enabled() and bool(NAVER_CLIENT_ID and NAVER_CLIENT_SECRET)
+    executor = ThreadPoolExecutor(max_workers=max(1, min(NAVER_NEWS_FETCH_WORKERS, len(sorts) * NAVER_NEWS_MAX_PAGES)))
 
-            print(f'  [{len(rows):02d}] {date_kst} | {press_name or NAVER_WHITELIST.get(host, host)} | {title[:50]}...')
+    def _submit(page: int, sort: str):
+        if use_async:
+            # 이벤트 루프에서 요청 (cancel() 시 진행 중인 요청도 취소됨)
+            headers = {"X-Naver-Client-Id": NAVER_CLIENT_ID, "X-Naver-Client-Secret": NAVER_CLIENT_SECRET}
+            params = {"query": query, "display": NAVER_NEWS_PER_PAGE, "start": _start(page), "sort": sort}
+            return submit_async(fetch_naver_page_async(NAVER_NEWS_API_URL, params, headers, _naver_rate_limiter))
+        return executor.submit(fetch_naver_news_raw, query, _start(page), NAVER_NEWS_PER_PAGE, sort)
 
-            if len(rows) >= NAVER_NEWS_TARGET_COUNT:
-                print(f'네이버 뉴스 {len(rows)}개 수집 완료')
-                return rows
+    next_page: Dict[str, Optional[int]] = {sort: 1 for sort in sorts}  # None이면 더 요청하지 않음
+    exhausted = set()
 
-        if got_this_page == 0:
-            break
+    def _queue(wave: List, sort: str) -> None:
+        page = next_page[sort]
+        wave.append((sort, _submit(page, sort)))
+        next_page[sort] = page + 1 if page < NAVER_NEWS_MAX_PAGES else None
 
-        start += len(items)
-        time.sleep(NAVER_NEWS_SLEEP_SEC)
+    try:
+        first_wave = True
+        while len(rows) < NAVER_NEWS_TARGET_COUNT:
+            need_pages = -(-(NAVER_NEWS_TARGET_COUNT - len(rows)) // NAVER_NEWS_PER_PAGE)
+            wave = []
+            if first_wave:
+                # 정렬 기준별 1페이지는 처음부터 동시에
+                for sort in sorts:
+                    _queue(wave, sort)
+                first_wave = False
+            for sort in sorts:
+                while len(wave) < need_pages and next_page[sort] is not None:
+                    _queue(wave, sort)
+            if not wave:
+                break
+            for sort, future in wave:
+                if len(rows) >= NAVER_NEWS_TARGET_COUNT or sort in exhausted:
+                    future.cancel()
+                    continue
+                items = future.result()
+                if _consume(items) == 0 or len(items) < NAVER_NEWS_PER_PAGE:
+                    exhausted.add(sort)
+                    next_page[sort] = None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     print(f'네이버 뉴스 {len(rows)}개 수집 완료')
     return rows
@@ -703,7 +856,7 @@ def get_fmp_stock_news(ticker, api_key, limit=20):
     print(f"\n--- [FMP] {ticker} 최신 뉴스 {limit}개 검색 ---")
     url = f"https://financialmodelingprep.com/api/v3/stock_news?tickers={ticker}&limit={limit}&apikey={api_key}"
     try:
-        res = requests.get(url, timeout=10)
+        res = http_session.get(url, timeout=10)
         res.raise_for_status()
         data = res.json()
         if not data:
@@ -714,53 +867,160 @@ def get_fmp_stock_news(ticker, api_key, limit=20):
         print(f"FMP API 오류: {e}")
         return []
 
-# 번역 함수
-def translate_text(text, dest_lang='ko'):
-    """텍스트 번역"""
-    if not text:
-        return ""
-    MAX_CHARS = 4800
-    text = text[:MAX_CHARS] if len(text) > MAX_CHARS else text
-    try:
-        time.sleep(0.5)
-        return GoogleTranslator(source='auto', target=dest_lang).translate(text)
-    except Exception:
-        return "번역 실패"
-
 # ChatGPT 요약 함수
-def summarize_with_chatgpt(text):
-    """ChatGPT로 뉴스 요약 (원본 로직 사용)"""
+CHATGPT_SUMMARY_MODEL = "gpt-4o-mini"
+CHATGPT_SUMMARY_PROMPT_VERSION = "fmp-v1"
+CHATGPT_SUMMARY_SYSTEM_PROMPT = (
+    "당신은 월스트리트의 최고 금융 뉴스 분석가입니다. **최상의 정확성**을 유지해야 합니다.\n"
+    "제공된 한국어 뉴스 기사 본문을 분석하여, 투자자가 알아야 할 **가장 중요하고 정확한 정보**만을 추출하여 **4~5 문장의 정밀한 요약문**을 작성해주세요.\n\n"
+    "**🚨 최우선 주의사항 (치명적 오류 방지):**\n"
+    "**1. 모든 수치, 날짜, 통화($, 원), 제품 이름 등 구체적 근거를 원문과 100% 일치시켜야 합니다. 절대로 추측하거나 틀린 정보를 생성하지 마세요.**\n"
+    "**2. 기사에 명시되지 않은 미래 전망(예: 2025년 3분기)이나 개인적인 의견은 절대 포함하지 말 것.**\n\n"
+    "**반드시 포함해야 할 내용:**\n"
+    "1.  **핵심 사건/주장:** 이 기사의 가장 중요한 메시지나 사건은 무엇인가?\n"
+    "2.  **구체적 근거 (수치/데이터):** 핵심 주장을 뒷받침하는 구체적인 숫자, 비율(%), 금액, 날짜 등이 있다면 **정확하게** 명시하라.\n"
+    "3.  **관련 주체:** 이 사건의 핵심 인물, 회사, 기관은 누구인가?\n"
+    "4.  **언급된 영향/전망:** 이 사건이 해당 회사, 산업, 또는 시장에 미칠 것으로 예상되는 긍정적/부정적 영향이나 향후 전망에 대한 언급이 있다면 포함하라.\n\n"
+    "**출력 지침:** 불필요한 미사여구나 서론/결론은 생략하고 핵심만 간결하게 전달할 것."
+)
+CHATGPT_BATCH_TOKEN_BUDGET = int(os.getenv("CHATGPT_BATCH_TOKEN_BUDGET", "12000"))  # 묶음 1회 입력 토큰 상한 (추정치)
+CHATGPT_BATCH_MAX_ARTICLES = int(os.getenv("CHATGPT_BATCH_MAX_ARTICLES", "6"))
+# 묶음 프롬프트(기본 지침 + JSON 형식)로 만든 요약은 별도 버전으로 캐시
+# 기사별 요청으로 만든 요약은 CHATGPT_SUMMARY_PROMPT_VERSION으로 저장 → 어느 프롬프트를 바꿔도 그 프롬프트의 요약만 무효화
+CHATGPT_BATCH_PROMPT_VERSION = "fmp-batch-v1"
+CHATGPT_BATCH_SYSTEM_SUFFIX = (
+    "\n\n여러 기사가 [id] 표시와 함께 주어집니다. 기사마다 위 지침대로 따로 요약하고, "
+    '반드시 {"summaries": [{"id": 기사 id, "summary": "요약문"}, ...]} 형식의 JSON 객체로만 답하세요.'
+)
+
+def summarize_with_chatgpt(text, url=None):
+    """ChatGPT로 뉴스 요약 (요약 캐시 경유)"""
     if not text or text == "번역 실패":
         return None
     if not openai_client:
         return None
+    return summary_cache.get_or_compute(
+        url, text, CHATGPT_SUMMARY_MODEL, CHATGPT_SUMMARY_PROMPT_VERSION,
+        lambda: _request_chatgpt_summary(text),
+    )
+
+def _request_chatgpt_summary(text):
+    """OpenAI 호출 → (요약문, 사용 토큰). 실패 시 None"""
     try:
-        system_prompt = (
-            "당신은 월스트리트의 최고 금융 뉴스 분석가입니다. **최상의 정확성**을 유지해야 합니다.\n"
-            "제공된 한국어 뉴스 기사 본문을 분석하여, 투자자가 알아야 할 **가장 중요하고 정확한 정보**만을 추출하여 **4~5 문장의 정밀한 요약문**을 작성해주세요.\n\n"
-            "**🚨 최우선 주의사항 (치명적 오류 방지):**\n"
-            "**1. 모든 수치, 날짜, 통화($, 원), 제품 이름 등 구체적 근거를 원문과 100% 일치시켜야 합니다. 절대로 추측하거나 틀린 정보를 생성하지 마세요.**\n"
-            "**2. 기사에 명시되지 않은 미래 전망(예: 2025년 3분기)이나 개인적인 의견은 절대 포함하지 말 것.**\n\n"
-            "**반드시 포함해야 할 내용:**\n"
-            "1.  **핵심 사건/주장:** 이 기사의 가장 중요한 메시지나 사건은 무엇인가?\n"
-            "2.  **구체적 근거 (수치/데이터):** 핵심 주장을 뒷받침하는 구체적인 숫자, 비율(%), 금액, 날짜 등이 있다면 **정확하게** 명시하라.\n"
-            "3.  **관련 주체:** 이 사건의 핵심 인물, 회사, 기관은 누구인가?\n"
-            "4.  **언급된 영향/전망:** 이 사건이 해당 회사, 산업, 또는 시장에 미칠 것으로 예상되는 긍정적/부정적 영향이나 향후 전망에 대한 언급이 있다면 포함하라.\n\n"
-            "**출력 지침:** 불필요한 미사여구나 서론/결론은 생략하고 핵심만 간결하게 전달할 것."
-        )
         response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=CHATGPT_SUMMARY_MODEL,
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": CHATGPT_SUMMARY_SYSTEM_PROMPT},
                 {"role": "user", "content": text}
             ],
             temperature=0.3
         )
-        return response.choices[0].message.content.strip()
+        tokens = getattr(response.usage, "total_tokens", 0) if getattr(response, "usage", None) else 0
+        return response.choices[0].message.content.strip(), tokens
     except Exception as e:
         print(f"[ERROR] ChatGPT 요약 오류: {e}")
         return None
 
+def _estimate_tokens(text):
+    """대략적인 토큰 수 (한글은 글자당 토큰이 많아 보수적으로 2자 = 1토큰)"""
+    return len(text or "") // 2 + 1
+
+def _pack_summary_batches(indices, texts):
+    """토큰 예산과 최대 기사 수 안에서 기사 인덱스를 묶음으로 분할"""
+    batches, current, used = [], [], 0
+    for i in indices:
+        cost = _estimate_tokens(texts[i])
+        if current and (used + cost > CHATGPT_BATCH_TOKEN_BUDGET or len(current) >= CHATGPT_BATCH_MAX_ARTICLES):
+            batches.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+def _request_chatgpt_summary_batch(batch, texts):
+    """기사 여러 개를 한 번에 요약 → {인덱스: 요약문}, 사용 토큰. 파싱 실패 시 ({}, 0)"""
+    if len(batch) == 1:
+        result = _request_chatgpt_summary(texts[batch[0]])
+        return ({batch[0]: result[0]}, result[1]) if result else ({}, 0)
+    user_content = "\n\n".join(f"[{i}]\n{texts[i]}" for i in batch)
+    try:
+        response = openai_client.chat.completions.create(
+            model=CHATGPT_SUMMARY_MODEL,
+            messages=[
+                {"role": "system", "content": CHATGPT_SUMMARY_SYSTEM_PROMPT + CHATGPT_BATCH_SYSTEM_SUFFIX},
+                {"role": "user", "content": user_content}
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        )
+        tokens = getattr(response.usage, "total_tokens", 0) if getattr(response, "usage", None) else 0
+        payload = json.loads(response.choices[0].message.content or "{}")
+        items = payload.get("summaries") if isinstance(payload, dict) else payload
+        results = {}
+        for item in items or []:
+            if not isinstance(item, dict):
+                continue
+            try:
+                idx = int(item.get("id"))
+            except (TypeError, ValueError):
+                continue
+            summary = str(item.get("summary") or "").strip()
+            if idx in batch and summary:
+                results[idx] = summary
+        return results, tokens
+    except Exception as e:
+        print(f"[WARN] ChatGPT 묶음 요약 실패, 기사별 요약으로 전환: {e}")
+        return {}, 0
+
+def summarize_many_with_chatgpt(texts, urls=None):
+    """
+    여러 기사를 묶음 요청으로 요약 (입력 순서대로 요약문 또는 None).
+    캐시 적중 기사는 제외하고, 묶음 응답에서 빠진 기사만 기사별 요청으로 다시 요약한다.
+    캐시는 요약을 만든 프롬프트의 버전으로 저장하고, 조회는 묶음 버전 → 기사별 버전 순서.
+    """
+    urls = list(urls) if urls is not None else [None] * len(texts)
+    results = [None] * len(texts)
+    if not openai_client:
+        return results
+    pending = []
+    for i, text in enumerate(texts):
+        if not text or text == "번역 실패":
+            continue
+        cached = summary_cache.get(urls[i], text, CHATGPT_SUMMARY_MODEL, CHATGPT_BATCH_PROMPT_VERSION)
+        if cached is None:
+            cached = summary_cache.get(urls[i], text, CHATGPT_SUMMARY_MODEL, CHATGPT_SUMMARY_PROMPT_VERSION)
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.append(i)
+    if not pending:
+        return results
+
+    batches = _pack_summary_batches(pending, texts)
+    print(f"[INFO] ChatGPT 묶음 요약: 기사 {len(pending)}개 → 요청 {len(batches)}회")
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        batch_results = list(executor.map(lambda batch: _request_chatgpt_summary_batch(batch, texts), batches))
+    for batch, (summaries, tokens) in zip(batches, batch_results):
+        share = tokens // max(1, len(summaries)) if summaries else 0
+        # 기사 1개짜리 묶음은 기사별 프롬프트로 요청됨
+        version = CHATGPT_BATCH_PROMPT_VERSION if len(batch) > 1 else CHATGPT_SUMMARY_PROMPT_VERSION
+        for i in batch:
+            if i in summaries:
+                results[i] = summaries[i]
+                summary_cache.put(urls[i], texts[i], CHATGPT_SUMMARY_MODEL, version, summaries[i], share)
+
+    missing = [i for i in pending if results[i] is None]
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            fallbacks = list(executor.map(lambda i: _request_chatgpt_summary(texts[i]), missing))
+        for i, result in zip(missing, fallbacks):
+            if result:
+                results[i] = result[0]
+                summary_cache.put(urls[i], texts[i], CHATGPT_SUMMARY_MODEL, CHATGPT_SUMMARY_PROMPT_VERSION, *result)
+    return results
+
 def summarize_korean_text_basic(text, num_sentences=5):
     """기본 요약 함수"""
     sentences = re.split(r'(?<=[.?!])\s*', text)
@@ -794,114 +1054,151 @@ def length_score(text_len):
     else:
         return 1
 
-def find_and_process_high_scoring_articles(news_list, ticker_names):
-    """고점수 기사 찾기 및 처리 (원본 로직)"""
-    print(f"총 {len(news_list)}개 뉴스 중 베스트 기사 선별 중...")
-    HEADERS = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
-        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7'
+NEWS_SCORE_THRESHOLD = 100
+NEWS_FALLBACK_TOP_K = 5  # 기준 점수 이상 기사가 없을 때 반환할 상위 기사 수
+
+def _push_top_k(heap, capacity, entry):
+    """크기가 capacity로 제한된 최소 힙에 후보 추가 (선택될 수 없는 후보는 버림)"""
+    if len(heap) < capacity:
+        heapq.heappush(heap, entry)
+    elif entry[:2] > heap[0][:2]:
+        heapq.heapreplace(heap, entry)
+
+def _select_article_candidates(candidates, log_duplicates=True):
+    """점수순 후보 기사에서 중복(URL/SimHash) 기사 제외"""
+    dedup = NewsDeduplicator()
+    selected = []
+    for candidate in candidates:
+        score = candidate['score']
+        art_meta = candidate['meta']
+        proc_title = art_meta.get('title', '')
+        duplicate = dedup.find_duplicate(proc_title, candidate['text'], art_meta.get('url', ''))
+        if duplicate is not None:
+            if log_duplicates:
+                print(f"     [1차 중복 감지] (점수: {score:.1f}) {proc_title[:50]}... (기존: {duplicate[0][:30]}, 거리: {duplicate[1]})")
+            continue
+        print(f"[OK] (점수: {score:.1f}) 기사 처리 중: {art_meta.get('site')} | {proc_title}")
+        dedup.add(proc_title, candidate['text'], art_meta.get('url', ''))
+        selected.append(candidate)
+    return selected
+
+def _build_processed_article(candidate, title_ko, text_ko, summary_ko):
+    art_meta = candidate['meta']
+    if not summary_ko:
+        summary_ko = summarize_korean_text_basic(text_ko)
+    return {
+        'date': pd.to_datetime(art_meta.get('publishedDate')).strftime('%Y-%m-%d %H:%M') if art_meta.get('publishedDate') else '',
+        'site': art_meta.get('site'),
+        'url': art_meta.get('url'),
+        'title_ko': title_ko,
+        'summary_ko': summary_ko
     }
-    
-    scored_articles = []
-    for i, art in enumerate(news_list[:NEWS_LIMIT]):
-        url = art.get("url")
+
+def _process_article_candidates(candidates, log_duplicates=True):
+    """점수순 후보 기사에 대해 중복(URL/SimHash) 제거 후 번역/요약 수행"""
+    selected = _select_article_candidates(candidates, log_duplicates)
+
+    # 선택된 기사의 본문/제목을 한 번에 번역 (캐시 + 묶음 요청)
+    translations = translate_many([c['text'] for c in selected] + [c['title'] for c in selected])
+    bodies_ko = translations[:len(selected)]
+    titles_ko = translations[len(selected):]
+    # 요약도 묶음 요청 1~2회로 처리
+    summaries_ko = summarize_many_with_chatgpt(bodies_ko, [c['meta'].get('url') for c in selected])
+    return [
+        _build_processed_article(candidate, title_ko, text_ko, summary_ko)
+        for candidate, text_ko, title_ko, summary_ko in zip(selected, bodies_ko, titles_ko, summaries_ko)
+    ]
+
+def _iter_processed_article_candidates(candidates, log_duplicates=True):
+    """_process_article_candidates의 스트리밍 버전: 기사별로 번역/요약이 끝나는 대로 반환"""
+    selected = _select_article_candidates(candidates, log_duplicates)
+    if not selected:
+        return
+
+    def _process(candidate):
+        text_ko, title_ko = translate_many([candidate['text'], candidate['title']])
+        summary_ko = summarize_with_chatgpt(text_ko, url=candidate['meta'].get('url'))
+        return _build_processed_article(candidate, title_ko, text_ko, summary_ko)
+
+    executor = ThreadPoolExecutor(max_workers=min(len(selected), 4))
+    try:
+        futures = [executor.submit(_process, candidate) for candidate in selected]
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                print(f"[WARN] 기사 처리 실패: {e}")
+    finally:
+        # 클라이언트가 연결을 끊으면 남은 기사는 처리하지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _collect_scored_candidates(news_list, ticker_names):
+    """기사 병렬 수집 후 (기준 이상 후보, 기준 미달 상위 후보)를 점수순으로 반환"""
+    print(f"총 {len(news_list)}개 뉴스 중 베스트 기사 선별 중...")
+
+    # 기준 점수 이상 후보와, 기준 미달 시 대체로 쓸 상위 후보만 힙으로 유지
+    above_heap = []
+    below_heap = []
+    for i, art, record, error in iter_fetched_articles(news_list[:NEWS_LIMIT]):
         site = art.get("site", "")
         current_title = art.get("title", "")
-        art_meta = art
-        try:
-            r = requests.get(url, headers=HEADERS, timeout=10)
-            r.raise_for_status()
-            article = Article(url)
-            article.set_html(r.text)
-            article.parse()
-            article_text = article.text
-            if len(article_text) < 200:
-                continue
-            rel_score = 0
-            if current_title:
-                current_title_lower = current_title.lower()
-                for k in ticker_names:
-                    if k.lower() in current_title_lower:
-                        rel_score += 1
-            score = (source_score(site) * 3 + length_score(len(article_text)) * 1.5 + rel_score * 2)
-            scored_articles.append({'article_obj': article, 'meta': art, 'score': score})
-            print(f"     [{i+1:02d}] {site:20s} | 점수: {score:4.1f} | 제목: {current_title[:40]}...")
-        except Exception as e:
-            print(f"     [ERROR] {site} 기사 로드 실패: {e}")
-    
-    if not scored_articles:
+        if error is not None:
+            print(f"     [ERROR] {site} 기사 로드 실패: {error}")
+            continue
+        article_text = record['text']
+        if len(article_text) < 200:
+            continue
+        rel_score = 0
+        if current_title:
+            current_title_lower = current_title.lower()
+            for k in ticker_names:
+                if k.lower() in current_title_lower:
+                    rel_score += 1
+        score = (source_score(site) * 3 + length_score(len(article_text)) * 1.5 + rel_score * 2)
+        candidate = {'meta': art, 'score': score, 'title': record['title'], 'text': article_text}
+        # (점수, 원래 순서) 기준 정렬: 동점이면 앞선 기사 우선
+        entry = (score, -i, candidate)
+        if score >= NEWS_SCORE_THRESHOLD:
+            _push_top_k(above_heap, NEWS_LIMIT, entry)
+        else:
+            _push_top_k(below_heap, NEWS_FALLBACK_TOP_K, entry)
+        print(f"     [{i+1:02d}] {site:20s} | 점수: {score:4.1f} | 제목: {current_title[:40]}...")
+
+    above = [entry[2] for entry in sorted(above_heap, key=lambda e: e[:2], reverse=True)]
+    below = [entry[2] for entry in sorted(below_heap, key=lambda e: e[:2], reverse=True)]
+    return above, below
+
+def find_and_process_high_scoring_articles(news_list, ticker_names):
+    """고점수 기사 찾기 및 처리 (병렬 수집 + 상위 k개만 유지)"""
+    above, below = _collect_scored_candidates(news_list, ticker_names)
+    if not above and not below:
         print("[WARN] 유효한 기사 없음.")
         return []
-    
-    scored_articles.sort(key=lambda x: x['score'], reverse=True)
-    processed_articles = []
-    processed_titles_set = set()
-    SCORE_THRESHOLD = 100
-    SIMILARITY_THRESHOLD = 0.8
-    
-    print(f"\n--- {SCORE_THRESHOLD}점 이상 기사 선별 및 (1차)제목 중복 제거 ---")
-    for article_data in scored_articles:
-        score = article_data['score']
-        art_meta = article_data['meta']
-        article_obj = article_data['article_obj']
-        proc_title = art_meta.get('title', '')
-        if score < SCORE_THRESHOLD:
-            continue
-        is_duplicate = False
-        for processed_title in processed_titles_set:
-            similarity = difflib.SequenceMatcher(None, proc_title, processed_title).ratio()
-            if similarity > SIMILARITY_THRESHOLD:
-                is_duplicate = True
-                print(f"     [1차 중복 감지] (점수: {score:.1f}) {proc_title[:50]}... (유사도: {similarity*100:.0f}%)")
-                break
-        if not is_duplicate:
-            print(f"[OK] (점수: {score:.1f}) 기사 처리 중: {art_meta.get('site')} | {proc_title}")
-            processed_titles_set.add(proc_title)
-            text_ko = translate_text(article_obj.text)
-            summary_ko = summarize_with_chatgpt(text_ko)
-            if not summary_ko:
-                summary_ko = summarize_korean_text_basic(text_ko)
-            processed_articles.append({
-                'date': pd.to_datetime(art_meta.get('publishedDate')).strftime('%Y-%m-%d %H:%M') if art_meta.get('publishedDate') else '',
-                'site': art_meta.get('site'),
-                'url': art_meta.get('url'),
-                'title_ko': translate_text(article_obj.title),
-                'summary_ko': summary_ko
-            })
-    
+
+    print(f"\n--- {NEWS_SCORE_THRESHOLD}점 이상 기사 선별 및 (1차)제목 중복 제거 ---")
+    processed_articles = _process_article_candidates(above)
+
     # 100점 이상 기사가 없으면 점수 상관없이 상위 기사 반환 (테스트 단계)
     if not processed_articles:
         print("[WARN] 100점 이상인 유효한 기사가 없습니다. 점수 상관없이 상위 기사 반환 중...")
-        processed_titles_set = set()
-        for article_data in scored_articles[:5]:  # 상위 5개만
-            score = article_data['score']
-            art_meta = article_data['meta']
-            article_obj = article_data['article_obj']
-            proc_title = art_meta.get('title', '')
-            
-            is_duplicate = False
-            for processed_title in processed_titles_set:
-                similarity = difflib.SequenceMatcher(None, proc_title, processed_title).ratio()
-                if similarity > SIMILARITY_THRESHOLD:
-                    is_duplicate = True
-                    break
-            if not is_duplicate:
-                print(f"[OK] (점수: {score:.1f}) 기사 처리 중: {art_meta.get('site')} | {proc_title}")
-                processed_titles_set.add(proc_title)
-                text_ko = translate_text(article_obj.text)
-                summary_ko = summarize_with_chatgpt(text_ko)
-                if not summary_ko:
-                    summary_ko = summarize_korean_text_basic(text_ko)
-                processed_articles.append({
-                    'date': pd.to_datetime(art_meta.get('publishedDate')).strftime('%Y-%m-%d %H:%M') if art_meta.get('publishedDate') else '',
-                    'site': art_meta.get('site'),
-                    'url': art_meta.get('url'),
-                    'title_ko': translate_text(article_obj.title),
-                    'summary_ko': summary_ko
-                })
-    
+        processed_articles = _process_article_candidates(below, log_duplicates=False)
+
     return processed_articles
 
+def iter_high_scoring_articles(news_list, ticker_names):
+    """find_and_process_high_scoring_articles의 스트리밍 버전 (처리 완료 순서로 반환)"""
+    above, below = _collect_scored_candidates(news_list, ticker_names)
+    if not above and not below:
+        print("[WARN] 유효한 기사 없음.")
+        return
+    produced = 0
+    for article in _iter_processed_article_candidates(above):
+        produced += 1
+        yield article
+    if not produced:
+        print("[WARN] 100점 이상인 유효한 기사가 없습니다. 점수 상관없이 상위 기사 반환 중...")
+        yield from _iter_processed_article_candidates(below, log_duplicates=False)
+
 # 뉴스 API 엔드포인트
 @app.route('/api/stock/<symbol>/news', methods=['GET'])
 def get_stock_news_api(symbol):
@@ -988,7 +1285,7 @@ def get_stock_news_api(symbol):
         
         if not news_list:
             print(f"[WARN] {clean_symbol}에 대한 FMP 뉴스가 없습니다.")
-            return jsonify({'news': []})
+            return no_store(jsonify({'news': []}))
         
         print(f"[INFO] FMP에서 {len(news_list)}개 뉴스 수집 완료")
         
@@ -1028,7 +1325,7 @@ def get_stock_news_api(symbol):
                 print(f"[OK] 원본 뉴스 {len(processed_news)}개 반환")
                 return jsonify({'news': processed_news})
             else:
-                return jsonify({'news': []})
+                return no_store(jsonify({'news': []}))
         
         # 최대 10개 반환 (기존 5개에서 증가)
         processed_news = []
@@ -1045,7 +1342,20 @@ def get_stock_news_api(symbol):
         return jsonify({'news': processed_news})
     except Exception as e:
         print(f'뉴스 API 오류: {e}')
-        return jsonify({'news': []})
+        return no_store(jsonify({'news': []}))
+
+def _kr_company_name(clean_symbol):
+    """6자리 종목코드 → 회사명 (KRX 목록 캐시 사용, 없으면 코드 그대로)"""
+    krx_list = get_krx_list_cached()
+    company_name = clean_symbol
+    if krx_list is not None and not krx_list.empty:
+        symbol_col = 'Code' if 'Code' in krx_list.columns else ('Symbol' if 'Symbol' in krx_list.columns else None)
+        name_col = 'Name' if 'Name' in krx_list.columns else '종목명'
+        if symbol_col:
+            company_info = krx_list[krx_list[symbol_col] == clean_symbol]
+            if not company_info.empty:
+                company_name = company_info.iloc[0][name_col]
+    return company_name
 
 # 한국 주식 뉴스 API 엔드포인트
 @app.route('/api/kr-stock/<symbol>/news', methods=['GET'])
@@ -1081,39 +1391,23 @@ def get_kr_stock_news(symbol):
             return jsonify({'news': response_items})
         
         # 회사명 가져오기 (캐시 사용)
-        krx_list = get_krx_list_cached()
-        company_name = clean_symbol
-        if krx_list is not None and not krx_list.empty:
-            symbol_col = 'Code' if 'Code' in krx_list.columns else ('Symbol' if 'Symbol' in krx_list.columns else None)
-            name_col = 'Name' if 'Name' in krx_list.columns else '종목명'
-            if symbol_col:
-                company_info = krx_list[krx_list[symbol_col] == clean_symbol]
-                if not company_info.empty:
-                    company_name = company_info.iloc[0][name_col]
+        company_name = _kr_company_name(clean_symbol)
         
-        # 뉴스 정보 가져오기
+        # 뉴스 정보 가져오기 (네이버/FMP 간 중복 제거 공유)
         news = []
+        news_dedup = NewsDeduplicator()
         
         # 1. 네이버 뉴스 우선 시도
         if NAVER_CLIENT_ID and NAVER_CLIENT_SECRET:
             try:
                 print(f'\n--- [INFO] {company_name} ({clean_symbol}) 네이버 뉴스 수집 시작 ---')
-                # 정확도 우선
-                naver_news = collect_naver_news(company_name, sort="sim")
-                
-                # 부족하면 최신순 보충
-                if len(naver_news) < NAVER_NEWS_TARGET_COUNT:
-                    print(f'[INFO] 네이버 뉴스 {len(naver_news)}개 찾음, 최신순 보충 중...')
-                    extra_news = collect_naver_news(company_name, sort="date")
-                    existed_urls = set(n['url'] for n in naver_news)
-                    for n in extra_news:
-                        if n['url'] not in existed_urls:
-                            naver_news.append(n)
-                        if len(naver_news) >= NAVER_NEWS_TARGET_COUNT:
-                            break
+                # 정확도순 우선, 부족하면 최신순으로 보충 (두 정렬을 병렬로 한 번에 수집)
+                naver_news = collect_naver_news(company_name, sorts=("sim", "date"))
                 
                 if naver_news:
-                    news = naver_news[:NAVER_NEWS_TARGET_COUNT]
+                    news = apply_naver_summaries(naver_news[:NAVER_NEWS_TARGET_COUNT])
+                    for n in news:
+                        news_dedup.add(n['title'], n['summary'], n['url'])
                     print(f'[OK] 네이버 뉴스 {len(news)}개 수집 완료')
                 else:
                     print(f'[WARN] 네이버 뉴스 0개 수집됨')
@@ -1139,10 +1433,9 @@ def get_kr_stock_news(symbol):
                     
                     if best_articles:
                         print(f'[INFO] FMP 뉴스 필터링 후 {len(best_articles)}개 기사')
-                        existed_urls = set(n.get('url', '') for n in news)
                         for article in best_articles:
                             article_url = article.get('url', '')
-                            if article_url and article_url not in existed_urls:
+                            if article_url and news_dedup.add(article.get('title_ko', ''), article.get('summary_ko', ''), article_url):
                                 news.append({
                                     'title': article.get('title_ko', ''),
                                     'summary': article.get('summary_ko', ''),
@@ -1162,12 +1455,137 @@ def get_kr_stock_news(symbol):
                 traceback.print_exc()
         
         print(f'[INFO] 최종 뉴스 개수: {len(news)}개')
+        if not news:
+            return no_store(jsonify({'news': []}))
         return jsonify({'news': news[:10]})  # 최대 10개 반환
     except Exception as e:
         print(f'[ERROR] 한국 주식 뉴스 API 오류: {e}')
         import traceback
         traceback.print_exc()
-        return jsonify({'news': []})
+        return no_store(jsonify({'news': []}))
+
+# ============ 뉴스 스트리밍 API ============
+NEWS_STREAM_MIN_COUNT = 5  # 이 개수 미만이면 다음 소스로 보충
+NEWS_STREAM_MAX_COUNT = 10
+
+def _format_chroma_news_item(item):
+    """Chroma 뉴스 → 응답 항목 (date_int는 YYYY-MM-DD로 변환)"""
+    date_str = item.get('date') or item.get('published_at') or ''
+    date_int_str = str(item.get('date_int') or '')
+    if not date_str and len(date_int_str) == 8:
+        date_str = f"{date_int_str[:4]}-{date_int_str[4:6]}-{date_int_str[6:8]}"
+    return {
+        'title': item.get('title') or '',
+        'summary': item.get('summary') or '',
+        'url': item.get('url') or '',
+        'date': date_str,
+        'site': item.get('source') or item.get('site') or '',
+    }
+
+def _format_processed_article(article):
+    return {
+        'title': article.get('title_ko', ''),
+        'summary': article.get('summary_ko', ''),
+        'url': article.get('url', ''),
+        'date': article.get('date', ''),
+        'site': article.get('site', '')
+    }
+
+def _iter_stock_news_events(clean_symbol, is_kr):
+    """
+    뉴스 스트리밍 이벤트 생성: Chroma → (한국) 네이버 → FMP 순서로 준비되는 기사부터 반환.
+    앞 소스에서 NEWS_STREAM_MIN_COUNT개 이상 모이면 다음 소스는 조회하지 않는다.
+    """
+    started = time.monotonic()
+    dedup = NewsDeduplicator()
+    counts = {'chroma': 0, 'naver': 0, 'fmp': 0}
+
+    def _article_event(source, item):
+        counts[source] += 1
+        return {'type': 'article', 'source': source, 'item': item}
+
+    def _total():
+        return sum(counts.values())
+
+    # 1. Chroma (미리 정리된 뉴스)
+    try:
+        chroma_news = fetch_kr_stock_news(clean_symbol, limit=5) if is_kr else fetch_us_stock_news(clean_symbol, limit=5)
+    except Exception as chroma_error:
+        print(f"[WARN] Chroma 뉴스 조회 실패 (stream): {chroma_error}")
+        chroma_news = []
+    for item in chroma_news:
+        formatted = _format_chroma_news_item(item)
+        if dedup.add(formatted['title'], formatted['summary'], formatted['url']):
+            yield _article_event('chroma', formatted)
+
+    company_name = clean_symbol
+    if is_kr and _total() < NEWS_STREAM_MIN_COUNT and not chroma_news:
+        company_name = _kr_company_name(clean_symbol)
+        # 2. 네이버 뉴스
+        if NAVER_CLIENT_ID and NAVER_CLIENT_SECRET:
+            try:
+                naver_news = collect_naver_news(company_name, sorts=("sim", "date"))
+                for row in apply_naver_summaries(naver_news[:NAVER_NEWS_TARGET_COUNT]):
+                    if dedup.add(row['title'], row['summary'], row['url']):
+                        yield _article_event('naver', row)
+            except Exception as e:
+                print(f'[ERROR] 네이버 뉴스 스트리밍 오류: {e}')
+
+    # 3. FMP (기사 수집 → 번역 → 요약이 끝나는 순서대로)
+    if _total() < NEWS_STREAM_MIN_COUNT and not chroma_news:
+        fmp_symbol = f"{clean_symbol}.KS" if is_kr else clean_symbol
+        ticker_names = [company_name, clean_symbol] if is_kr else [clean_symbol]
+        try:
+            news_list = get_fmp_stock_news(fmp_symbol, FMP_API_KEY, limit=NEWS_LIMIT)
+            if news_list:
+                for article in iter_high_scoring_articles(news_list, ticker_names):
+                    if _total() >= NEWS_STREAM_MAX_COUNT:
+                        break
+                    formatted = _format_processed_article(article)
+                    if formatted['url'] and dedup.add(formatted['title'], formatted['summary'], formatted['url']):
+                        yield _article_event('fmp', formatted)
+        except Exception as e:
+            print(f'[ERROR] FMP 뉴스 스트리밍 오류: {e}')
+
+    yield {
+        'type': 'done',
+        'count': _total(),
+        'sources': counts,
+        'elapsed_ms': int((time.monotonic() - started) * 1000),
+    }
+
+def _news_stream_response(events):
+    """이벤트를 NDJSON(기본) 또는 SSE(?format=sse / Accept: text/event-stream)로 전송"""
+    use_sse = request.args.get('format') == 'sse' or 'text/event-stream' in (request.headers.get('Accept') or '')
+
+    def _generate():
+        for event in events:
+            payload = json.dumps(event, ensure_ascii=False)
+            if use_sse:
+                yield f"event: {event['type']}\ndata: {payload}\n\n"
+            else:
+                yield payload + "\n"
+
+    mimetype = 'text/event-stream' if use_sse else 'application/x-ndjson'
+    response = Response(stream_with_context(_generate()), mimetype=mimetype)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # 프록시 버퍼링 비활성화
+    return response
+
+@app.route('/api/stock/<symbol>/news/stream', methods=['GET'])
+def stream_stock_news(symbol):
+    """주식 뉴스 스트리밍 API (준비된 기사부터 한 줄씩 전송)"""
+    clean_symbol = symbol.replace('.KS', '').replace('.KQ', '').upper()
+    is_kr = len(clean_symbol) == 6 and clean_symbol.isdigit()
+    return _news_stream_response(_iter_stock_news_events(clean_symbol, is_kr))
+
+@app.route('/api/kr-stock/<symbol>/news/stream', methods=['GET'])
+def stream_kr_stock_news(symbol):
+    """한국 주식 뉴스 스트리밍 API"""
+    clean_symbol = symbol.replace('.KS', '').replace('.KQ', '')
+    if not clean_symbol.isdigit() or len(clean_symbol) != 6:
+        return jsonify({'error': '올바른 심볼 코드가 아닙니다.'}), 400
+    return _news_stream_response(_iter_stock_news_events(clean_symbol, True))
 
 # ============ 세그먼트 분석 유틸 함수 ============
 def extract_segment_revenue_recursively(
@@ -1264,7 +1682,7 @@ def get_reported_currency(ticker: str) -> str:
     try:
         url = f"https://financialmodelingprep.com/api/v3/income-statement/{ticker}"
         params = {"period": "quarter", "limit": 1, "apikey": FMP_API_KEY}
-        response = requests.get(url, params=params, timeout=5)
+        response = http_session.get(url, params=params, timeout=5)
         if response.status_code == 200:
             data = response.json()
             if data and isinstance(data, list) and len(data) > 0:
@@ -1281,7 +1699,7 @@ def fetch_segment_data(ticker: str) -> Optional[Dict[str, Any]]:
         url = "https://financialmodelingprep.com/api/v4/revenue-product-segmentation"
         params = {"symbol": ticker, "period": "quarter", "apikey": FMP_API_KEY}
         print(f'[INFO] 세그먼트 데이터 요청: {ticker}')
-        response = requests.get(url, params=params, timeout=5)  # 타임아웃 5초로 증가
+        response = http_session.get(url, params=params, timeout=5)  # 타임아웃 5초로 증가
         
         if response.status_code != 200:
             print(f'[ERROR] 세그먼트 API 응답 오류: {response.status_code}')
@@ -1376,7 +1794,7 @@ def get_stock_financials(symbol):
             try:
                 kr_symbol = f"{clean_symbol}.KS"
                 url = f"https://financialmodelingprep.com/api/v3/income-statement/{kr_symbol}?period=quarter&limit=4&apikey={FMP_API_KEY}"
-                response = requests.get(url, timeout=10)
+                response = http_session.get(url, timeout=10)
                 response.raise_for_status()
                 income_statements = response.json()
                 
@@ -1384,12 +1802,12 @@ def get_stock_financials(symbol):
                     raise Exception("FMP API에서 데이터를 찾을 수 없습니다.")
                 
                 if not income_statements or len(income_statements) == 0:
-                    return jsonify({
+                    return no_store(jsonify({
                         'revenue': [],
                         'netIncome': [],
                         'operatingIncome': [],
                         'chartData': []
-                    })
+                    }))
                 
                 # FMP 데이터 파싱
                 chart_data = []
@@ -1463,12 +1881,12 @@ def get_stock_financials(symbol):
                 return jsonify(result)
             except Exception as e:
                 print(f'FMP 폴백 오류: {e}')
-                return jsonify({
+                return no_store(jsonify({
                     'revenue': [],
                     'netIncome': [],
                     'operatingIncome': [],
                     'chartData': []
-                })
+                }))
         
         # 해외 주식 재무제표 가져오기 (FMP API)
         try:
@@ -1482,17 +1900,17 @@ def get_stock_financials(symbol):
         try:
             # 분기별 재무제표 데이터
             url = f"https://financialmodelingprep.com/api/v3/income-statement/{clean_symbol}?period=quarter&limit=4&apikey={FMP_API_KEY}"
-            response = requests.get(url, timeout=10)
+            response = http_session.get(url, timeout=10)
             response.raise_for_status()
             income_statements = response.json()
             
             if not income_statements or len(income_statements) == 0:
-                return jsonify({
+                return no_store(jsonify({
                     'revenue': [],
                     'netIncome': [],
                     'operatingIncome': [],
                     'chartData': []
-                })
+                }))
             
             # 데이터 정리 및 차트용 데이터 생성
             chart_data = []
@@ -1569,22 +1987,79 @@ def get_stock_financials(symbol):
             return jsonify(result)
         except Exception as e:
             print(f'FMP 재무제표 API 오류: {e}')
-            return jsonify({
+            return no_store(jsonify({
                 'revenue': [],
                 'netIncome': [],
                 'operatingIncome': [],
                 'chartData': []
-            })
+            }))
     except Exception as e:
         print(f'재무제표 API 오류: {e}')
-        return jsonify({
+        return no_store(jsonify({
             'revenue': [],
             'netIncome': [],
             'operatingIncome': [],
             'chartData': []
-        })
+        }))
 
 # DART API 단일 조회 함수 (병렬 처리용)
+def parse_dart_quarter_data(data, year, reprt_code, quarter, fs_div):
+    """DART 단일회사 주요계정 응답 → 분기 데이터 (매출액/영업이익/당기순이익, 없으면 None)"""
+    status = data.get('status')
+    if status != '000':
+        return None
+    
+    account_list = data.get('list', [])
+    if not account_list:
+        return None
+    
+    revenue = 0
+    operating_income = 0
+    net_income = 0
+    
+    # 모든 계정에서 매출액, 영업이익, 당기순이익 찾기
+    for account in account_list:
+        account_nm = account.get('account_nm', '')
+        account_id = account.get('account_id', '')
+        thstrm_amount = account.get('thstrm_amount', '0')
+        
+        try:
+            amount_str = thstrm_amount.replace(',', '') if thstrm_amount else '0'
+            amount = float(amount_str) if amount_str else 0
+        except:
+            amount = 0
+        
+        if amount == 0:
+            continue
+        
+        # 매출액 찾기
+        if ('매출액' in account_nm or '매출' in account_nm) and '감가상각비' not in account_nm:
+            if abs(amount) > abs(revenue) or revenue == 0:
+                revenue = amount
+        
+        # 영업이익 찾기
+        elif '영업이익' in account_nm or account_id == 'ifrs-full_OperatingIncomeLoss':
+            if abs(amount) > abs(operating_income) or operating_income == 0:
+                operating_income = amount
+        
+        # 당기순이익 찾기
+        elif ('당기순이익' in account_nm or '순이익' in account_nm) and '종속기업' not in account_nm:
+            if abs(amount) > abs(net_income) or net_income == 0:
+                net_income = amount
+    
+    if revenue != 0 or operating_income != 0 or net_income != 0:
+        return {
+            'year': year,
+            'quarter': quarter,
+            'reprt_code': reprt_code,
+            'fs_div': fs_div,
+            'revenue': revenue,
+            'operating_income': operating_income,
+            'net_income': net_income
+        }
+    
+    return None
+
 def fetch_dart_quarter_data(corp_code, year, reprt_code, quarter, fs_div):
     """단일 분기/타입의 DART 재무제표 데이터 조회"""
     url = "https://opendart.fss.or.kr/api/fnlttSinglAcnt.json"
@@ -1598,66 +2073,105 @@ def fetch_dart_quarter_data(corp_code, year, reprt_code, quarter, fs_div):
             'fs_div': fs_div
         }
         
-        response = requests.get(url, params=params, timeout=15)
+        response = http_session.get(url, params=params, timeout=15)
         response.raise_for_status()
-        data = response.json()
-        
-        status = data.get('status')
-        if status != '000':
-            return None
-        
-        account_list = data.get('list', [])
-        if not account_list:
-            return None
-        
-        revenue = 0
-        operating_income = 0
-        net_income = 0
-        
-        # 모든 계정에서 매출액, 영업이익, 당기순이익 찾기
-        for account in account_list:
-            account_nm = account.get('account_nm', '')
-            account_id = account.get('account_id', '')
-            thstrm_amount = account.get('thstrm_amount', '0')
-            
+        return parse_dart_quarter_data(response.json(), year, reprt_code, quarter, fs_div)
+    except Exception as e:
+        return None
+
+def _dart_missing_quarters(collected_data, current_year, reprt_codes):
+    """CFS에서 찾지 못한 (연도, 보고서 코드, 분기) 목록 (최신 분기부터)"""
+    missing_quarters = []
+    for year_offset in range(2):
+        year = current_year - year_offset
+        for reprt_code, quarter in reversed(reprt_codes):
+            if (year, quarter) not in collected_data:
+                missing_quarters.append((year, reprt_code, quarter))
+    return missing_quarters
+
+def _collect_dart_quarters_threaded(corp_code, tasks_priority, current_year, reprt_codes):
+    """스레드 풀로 DART 분기 데이터 수집 (CFS 우선, 부족하면 OFS)"""
+    collected_data = {}  # (year, quarter)를 키로 사용하여 중복 제거
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # 우선순위 작업부터 제출 (CFS만 먼저)
+        futures_cfs = {}
+        for year, reprt_code, quarter, fs_div, _ in tasks_priority:
+            future = executor.submit(fetch_dart_quarter_data, corp_code, year, reprt_code, quarter, fs_div)
+            futures_cfs[future] = (year, quarter, fs_div)
+        
+        # CFS 결과 처리
+        for future in as_completed(futures_cfs):
+            year, quarter, fs_div = futures_cfs[future]
             try:
-                amount_str = thstrm_amount.replace(',', '') if thstrm_amount else '0'
-                amount = float(amount_str) if amount_str else 0
-            except:
-                amount = 0
-            
-            if amount == 0:
+                result = future.result()
+                if result:
+                    key = (result['year'], result['quarter'])
+                    collected_data[key] = result
+                    print(f'데이터 추출: {result["year"]} Q{result["quarter"]} ({result["fs_div"]}) - 매출액: {result["revenue"]:,.0f}, 영업이익: {result["operating_income"]:,.0f}, 당기순이익: {result["net_income"]:,.0f}')
+                    
+                    # 4개 분기 수집되면 즉시 중단
+                    if len(collected_data) >= 4:
+                        # 남은 CFS 작업 취소
+                        for f in futures_cfs:
+                            if not f.done():
+                                f.cancel()
+                        break
+            except Exception as e:
                 continue
-            
-            # 매출액 찾기
-            if ('매출액' in account_nm or '매출' in account_nm) and '감가상각비' not in account_nm:
-                if abs(amount) > abs(revenue) or revenue == 0:
-                    revenue = amount
-            
-            # 영업이익 찾기
-            elif '영업이익' in account_nm or account_id == 'ifrs-full_OperatingIncomeLoss':
-                if abs(amount) > abs(operating_income) or operating_income == 0:
-                    operating_income = amount
-            
-            # 당기순이익 찾기
-            elif ('당기순이익' in account_nm or '순이익' in account_nm) and '종속기업' not in account_nm:
-                if abs(amount) > abs(net_income) or net_income == 0:
-                    net_income = amount
-        
-        if revenue != 0 or operating_income != 0 or net_income != 0:
-            return {
-                'year': year,
-                'quarter': quarter,
-                'reprt_code': reprt_code,
-                'fs_div': fs_div,
-                'revenue': revenue,
-                'operating_income': operating_income,
-                'net_income': net_income
-            }
         
-        return None
-    except Exception as e:
-        return None
+        # CFS에서 4개를 못 찾았으면 OFS로 보완
+        if len(collected_data) < 4:
+            missing_quarters = _dart_missing_quarters(collected_data, current_year, reprt_codes)
+            
+            if missing_quarters:
+                print(f'CFS에서 {len(collected_data)}개 찾음, OFS로 보완 시도 중...')
+                futures_ofs = {}
+                for year, reprt_code, quarter in missing_quarters[:8]:  # 최대 8개만
+                    future = executor.submit(fetch_dart_quarter_data, corp_code, year, reprt_code, quarter, 'OFS')
+                    futures_ofs[future] = (year, quarter, 'OFS')
+                
+                for future in as_completed(futures_ofs):
+                    year, quarter, fs_div = futures_ofs[future]
+                    try:
+                        result = future.result()
+                        if result:
+                            key = (result['year'], result['quarter'])
+                            if key not in collected_data:  # CFS에 없는 경우만 추가
+                                collected_data[key] = result
+                                print(f'데이터 추출 (OFS): {result["year"]} Q{result["quarter"]} - 매출액: {result["revenue"]:,.0f}, 영업이익: {result["operating_income"]:,.0f}, 당기순이익: {result["net_income"]:,.0f}')
+                                
+                                if len(collected_data) >= 4:
+                                    for f in futures_ofs:
+                                        if not f.done():
+                                            f.cancel()
+                                    break
+                    except Exception as e:
+                        continue
+    
+    return collected_data
+
+def _collect_dart_quarters_async(corp_code, tasks_priority, current_year, reprt_codes):
+    """asyncio로 DART 분기 데이터 수집 (4개 분기가 모이면 남은 요청 취소)"""
+    collected_data = run_async(fetch_dart_quarters_async(
+        DART_API_KEY, corp_code,
+        [(year, reprt_code, quarter, fs_div) for year, reprt_code, quarter, fs_div, _ in tasks_priority],
+        parse_dart_quarter_data,
+    ))
+    if len(collected_data) < 4:
+        missing_quarters = _dart_missing_quarters(collected_data, current_year, reprt_codes)
+        if missing_quarters:
+            print(f'CFS에서 {len(collected_data)}개 찾음, OFS로 보완 시도 중...')
+            collected_data.update(run_async(fetch_dart_quarters_async(
+                DART_API_KEY, corp_code,
+                [(year, reprt_code, quarter, 'OFS') for year, reprt_code, quarter in missing_quarters[:8]],
+                parse_dart_quarter_data,
+                need=4 - len(collected_data),
+                exclude=collected_data.keys(),
+            )))
+    for (year, quarter), result in sorted(collected_data.items(), reverse=True):
+        print(f'데이터 추출: {year} Q{quarter} ({result["fs_div"]}) - 매출액: {result["revenue"]:,.0f}, 영업이익: {result["operating_income"]:,.0f}, 당기순이익: {result["net_income"]:,.0f}')
+    return collected_data
 
 # DART Open API로 한국 주식 재무제표 가져오기 (병렬 처리)
 def get_dart_financials(corp_code, symbol):
@@ -1695,69 +2209,10 @@ def get_dart_financials(corp_code, symbol):
         print(f'빠른 조회 시작: 최신 분기부터 우선순위 조회 (CFS 우선)')
         
         # 병렬 처리로 조회 실행
-        collected_data = {}  # (year, quarter)를 키로 사용하여 중복 제거
-        
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            # 우선순위 작업부터 제출 (CFS만 먼저)
-            futures_cfs = {}
-            for year, reprt_code, quarter, fs_div, _ in tasks_priority:
-                future = executor.submit(fetch_dart_quarter_data, corp_code, year, reprt_code, quarter, fs_div)
-                futures_cfs[future] = (year, quarter, fs_div)
-            
-            # CFS 결과 처리
-            for future in as_completed(futures_cfs):
-                year, quarter, fs_div = futures_cfs[future]
-                try:
-                    result = future.result()
-                    if result:
-                        key = (result['year'], result['quarter'])
-                        collected_data[key] = result
-                        print(f'데이터 추출: {result["year"]} Q{result["quarter"]} ({result["fs_div"]}) - 매출액: {result["revenue"]:,.0f}, 영업이익: {result["operating_income"]:,.0f}, 당기순이익: {result["net_income"]:,.0f}')
-                        
-                        # 4개 분기 수집되면 즉시 중단
-                        if len(collected_data) >= 4:
-                            # 남은 CFS 작업 취소
-                            for f in futures_cfs:
-                                if not f.done():
-                                    f.cancel()
-                            break
-                except Exception as e:
-                    continue
-            
-            # CFS에서 4개를 못 찾았으면 OFS로 보완
-            if len(collected_data) < 4:
-                missing_quarters = []
-                for year_offset in range(2):
-                    year = current_year - year_offset
-                    for reprt_code, quarter in reversed(reprt_codes):
-                        key = (year, quarter)
-                        if key not in collected_data:
-                            missing_quarters.append((year, reprt_code, quarter))
-                
-                if missing_quarters:
-                    print(f'CFS에서 {len(collected_data)}개 찾음, OFS로 보완 시도 중...')
-                    futures_ofs = {}
-                    for year, reprt_code, quarter in missing_quarters[:8]:  # 최대 8개만
-                        future = executor.submit(fetch_dart_quarter_data, corp_code, year, reprt_code, quarter, 'OFS')
-                        futures_ofs[future] = (year, quarter, 'OFS')
-                    
-                    for future in as_completed(futures_ofs):
-                        year, quarter, fs_div = futures_ofs[future]
-                        try:
-                            result = future.result()
-                            if result:
-                                key = (result['year'], result['quarter'])
-                                if key not in collected_data:  # CFS에 없는 경우만 추가
-                                    collected_data[key] = result
-                                    print(f'데이터 추출 (OFS): {result["year"]} Q{result["quarter"]} - 매출액: {result["revenue"]:,.0f}, 영업이익: {result["operating_income"]:,.0f}, 당기순이익: {result["net_income"]:,.0f}')
-                                    
-                                    if len(collected_data) >= 4:
-                                        for f in futures_ofs:
-                                            if not f.done():
-                                                f.cancel()
-                                        break
-                        except Exception as e:
-                            continue
+        if async_enabled():
+            collected_data = _collect_dart_quarters_async(corp_code, tasks_priority, current_year, reprt_codes)
+        else:
+            collected_data = _collect_dart_quarters_threaded(corp_code, tasks_priority, current_year, reprt_codes)
         
         # 수집된 데이터를 시간순으로 정렬
         sorted_data = sorted(collected_data.values(), key=lambda x: (x['year'], x['quarter']), reverse=True)[:4]
@@ -1856,7 +2311,7 @@ def download_dart_corpcode_file():
         }
         
         print('DART 회사코드 ZIP 파일 다운로드 중...')
-        response = requests.get(url, params=params, timeout=30)
+        response = http_session.get(url, params=params, timeout=30)
         response.raise_for_status()
         
         # ZIP 파일 저장
@@ -2012,7 +2467,7 @@ def get_kr_stock_financials(symbol):
             kr_symbol = f"{clean_symbol}.KS"
             url = f"https://financialmodelingprep.com/api/v3/income-statement/{kr_symbol}?period=quarter&limit=4&apikey={FMP_API_KEY}"
             print(f'FMP API 호출: {url[:80]}...')
-            response = requests.get(url, timeout=10)
+            response = http_session.get(url, timeout=10)
             response.raise_for_status()
             income_statements = response.json()
             print(f'FMP API 응답: {len(income_statements) if isinstance(income_statements, list) else "dict"}')
@@ -2021,12 +2476,12 @@ def get_kr_stock_financials(symbol):
                 raise Exception("FMP API에서 데이터를 찾을 수 없습니다.")
             
             if not income_statements or len(income_statements) == 0:
-                return jsonify({
+                return no_store(jsonify({
                     'revenue': [],
                     'netIncome': [],
                     'operatingIncome': [],
                     'chartData': []
-                })
+                }))
             
             # FMP 데이터 파싱
             chart_data = []
@@ -2078,20 +2533,94 @@ def get_kr_stock_financials(symbol):
             print(f'FMP 폴백 오류: {e}')
         
         # 모든 방법 실패
-        return jsonify({
+        return no_store(jsonify({
             'revenue': [],
             'netIncome': [],
             'operatingIncome': [],
             'chartData': []
-        })
+        }))
     except Exception as e:
         print(f'한국 주식 재무제표 API 오류: {e}')
-        return jsonify({
+        return no_store(jsonify({
             'revenue': [],
             'netIncome': [],
             'operatingIncome': [],
             'chartData': []
-        })
+        }))
+
+VISION_BATCH_MAX_IMAGES = 16
+# 배치 분석 요청 전체 크기 제한 (이미지 1장 제한은 _prepare_uploaded_image에서 파일별로 적용)
+VISION_BATCH_MAX_UPLOAD_BYTES = int(os.getenv(
+    "VISION_BATCH_MAX_UPLOAD_BYTES", str(VISION_BATCH_MAX_IMAGES * IMAGE_MAX_UPLOAD_BYTES)))
+
+class _UploadRequest(Request):
+    """MAX_CONTENT_LENGTH는 앱 전체 설정이라 배치 분석 엔드포인트만 요청 크기 제한을 늘림"""
+
+    @property
+    def max_content_length(self):
+        if self.endpoint == 'analyze_image_batch_route':
+            return VISION_BATCH_MAX_UPLOAD_BYTES
+        return super().max_content_length
+
+app.request_class = _UploadRequest
+
+def _upload_limit_mb(limit):
+    return f'{limit / (1024 * 1024):.0f}MB'
+
+@app.errorhandler(RequestEntityTooLarge)
+def handle_request_too_large(e):
+    if request.endpoint == 'analyze_image_batch_route':
+        return jsonify({'error': f'요청 전체 크기 제한({_upload_limit_mb(VISION_BATCH_MAX_UPLOAD_BYTES)})을 초과했습니다. '
+                                 f'이미지 1장은 {_upload_limit_mb(IMAGE_MAX_UPLOAD_BYTES)}까지입니다.'}), 413
+    return jsonify({'error': f'이미지 크기 제한({_upload_limit_mb(IMAGE_MAX_UPLOAD_BYTES)})을 초과했습니다.'}), 413
+
+class _UploadedImage:
+    """업로드 1장의 전처리 / 캐시 조회 결과"""
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.error = None        # 잘못된 이미지 → 오류 메시지
+        self.response = None     # 캐시 적중 시 응답 본문
+        self.prepared = None
+        self.fingerprint = None
+
+def _prepare_uploaded_image(image_file):
+    """업로드 파일 → 해시 / 원본 캐시 조회 → 전처리 → 지문 캐시 조회"""
+    upload = _UploadedImage(image_file.filename)
+    # 업로드는 메모리에 복사하지 않고 (큰 파일은 임시 파일로 받은) 스트림에서 바로 처리
+    raw_sha, raw_size = hash_stream(image_file.stream)
+    if not raw_size:
+        upload.error = '빈 이미지입니다.'
+        return upload
+    if raw_size > IMAGE_MAX_UPLOAD_BYTES:
+        upload.error = f'이미지 크기 제한({_upload_limit_mb(IMAGE_MAX_UPLOAD_BYTES)})을 초과했습니다.'
+        return upload
+
+    if IMAGE_CACHE_ENABLED:
+        cached = image_result_cache.get_by_raw_sha(raw_sha)
+        if cached is not None:
+            result, cache_info = cached
+            upload.response = {**result, 'cache': cache_info}
+            return upload
+
+    try:
+        upload.prepared = preprocess_image(image_file.stream, original_bytes=raw_size)
+    except ImagePreprocessError as e:
+        upload.error = str(e)
+        return upload
+
+    if IMAGE_CACHE_ENABLED:
+        upload.fingerprint = fingerprint_pil(upload.prepared.image, raw_sha)
+        cached = image_result_cache.get(upload.fingerprint)
+        if cached is not None:
+            result, cache_info = cached
+            upload.response = {**result, 'cache': cache_info, 'image': upload.prepared.info()}
+    return upload
+
+def _finish_uploaded_image(upload, result):
+    if upload.fingerprint is not None:
+        image_result_cache.put(upload.fingerprint, result)
+    return {**result, 'image': upload.prepared.info()}
 
 @app.route('/api/vision/analyze-image', methods=['POST'])
 def analyze_image_route():
@@ -2100,18 +2629,99 @@ def analyze_image_route():
         if 'file' not in request.files:
             return jsonify({'error': 'file 필드에 이미지를 첨부해주세요.'}), 400
 
-        image_file = request.files['file']
-        image_bytes = image_file.read()
-
-        if not image_bytes:
-            return jsonify({'error': '빈 이미지입니다.'}), 400
+        upload = _prepare_uploaded_image(request.files['file'])
+        if upload.error:
+            return jsonify({'error': upload.error}), 400
+        if upload.response is not None:
+            return jsonify(upload.response)
 
-        result = analyze_product_from_image(image_bytes)
-        return jsonify(result)
+        result = analyze_product_from_image(upload.prepared.content)
+        return jsonify(_finish_uploaded_image(upload, result))
+    except RequestEntityTooLarge:
+        raise
     except Exception as e:
         print(f'[ERROR] Vision 분석 실패: {e}')
         return jsonify({'error': f'이미지 분석 중 오류가 발생했습니다: {e}'}), 500
 
+@app.route('/api/vision/analyze-batch', methods=['POST'])
+def analyze_image_batch_route():
+    """
+    여러 이미지(files 필드, 최대 16장)를 한 번의 Vision 배치 요청으로 분석.
+    결과는 업로드 순서대로 {'results': [...]}, 잘못된 이미지는 해당 항목에만 error.
+    """
+    try:
+        files = request.files.getlist('files') or request.files.getlist('file')
+        if not files:
+            return jsonify({'error': 'files 필드에 이미지를 첨부해주세요.'}), 400
+        if len(files) > VISION_BATCH_MAX_IMAGES:
+            return jsonify({'error': f'한 번에 최대 {VISION_BATCH_MAX_IMAGES}장까지 분석할 수 있습니다.'}), 400
+
+        uploads = [_prepare_uploaded_image(f) for f in files]
+        pending = [u for u in uploads if not u.error and u.response is None]
+        if pending:
+            results = analyze_products_from_images([u.prepared.content for u in pending])
+            for upload, result in zip(pending, results):
+                if result.get('error') and 'primary' not in result:
+                    upload.error = result['error']
+                else:
+                    upload.response = _finish_uploaded_image(upload, result)
+
+        return jsonify({'results': [
+            {'filename': u.filename, 'error': u.error} if u.error else {'filename': u.filename, **u.response}
+            for u in uploads
+        ]})
+    except RequestEntityTooLarge:
+        raise
+    except Exception as e:
+        print(f'[ERROR] Vision 배치 분석 실패: {e}')
+        return jsonify({'error': f'이미지 분석 중 오류가 발생했습니다: {e}'}), 500
+
+@app.route('/api/vision/jobs', methods=['POST'])
+def submit_image_job_route():
+    """
+    이미지 분석 비동기 제출 (file 필드). 분석은 전용 작업 풀에서 실행하고 바로 202 + 작업 ID 반환.
+    캐시에 결과가 있으면 완료된 작업으로 200 반환. 진행 상태는 GET /api/vision/jobs/<job_id>
+    """
+    try:
+        if 'file' not in request.files:
+            return jsonify({'error': 'file 필드에 이미지를 첨부해주세요.'}), 400
+
+        upload = _prepare_uploaded_image(request.files['file'])
+        if upload.error:
+            return jsonify({'error': upload.error}), 400
+        meta = {'filename': upload.filename}
+        if upload.response is not None:
+            return jsonify(vision_jobs.complete(upload.response, meta))
+
+        def _work(on_progress):
+            result = analyze_product_from_image(upload.prepared.content, on_progress=on_progress)
+            return _finish_uploaded_image(upload, result)
+
+        try:
+            job = vision_jobs.submit(_work, meta)
+        except JobQueueFull as e:
+            response = jsonify({'error': str(e)})
+            response.headers['Retry-After'] = '5'
+            return response, 503
+        response = jsonify({**job, 'poll_after': VISION_JOB_POLL_AFTER_SEC})
+        response.headers['Location'] = f"/api/vision/jobs/{job['job_id']}"
+        return response, 202
+    except RequestEntityTooLarge:
+        raise
+    except Exception as e:
+        print(f'[ERROR] Vision 분석 작업 제출 실패: {e}')
+        return jsonify({'error': f'이미지 분석 작업을 시작하지 못했습니다: {e}'}), 500
+
+@app.route('/api/vision/jobs/<job_id>', methods=['GET'])
+def get_image_job_route(job_id):
+    """분석 작업 상태 (status, 단계별 완료 여부 stages, 지금까지의 result)"""
+    job = vision_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': '작업을 찾을 수 없거나 만료되었습니다.'}), 404
+    if job['status'] in ('queued', 'running'):
+        return jsonify({**job, 'poll_after': VISION_JOB_POLL_AFTER_SEC})
+    return jsonify(job)
+
 @app.route('/api/parse-stock-query', methods=['POST'])
 def parse_stock_query():
     """입력 문장에서 주식 검색 의도와 거래소/티커 추출"""
@@ -2196,7 +2806,7 @@ def parse_stock_query():
                 "responseMimeType": "application/json"
             }
         }
-        ai_response_raw = requests.post(
+        ai_response_raw = http_session.post(
             url,
             headers={"Content-Type": "application/json"},
             json=payload,
@@ -2301,7 +2911,7 @@ def test_chat():
             ]
         }
 
-        ai_response = requests.post(
+        ai_response = http_session.post(
             url,
             headers={"Content-Type": "application/json"},
             json=payload,
@@ -2464,6 +3074,31 @@ def get_top_stocks_by_market_cap():
         print(f'Error in get_top_stocks_by_market_cap: {e}')
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/summary-cache/stats', methods=['GET'])
+def get_summary_cache_stats():
+    """LLM 요약 캐시 적중률 / 절약 토큰 수"""
+    return jsonify(summary_cache.stats())
+
+@app.route('/api/vision/cache/stats', methods=['GET'])
+def get_image_cache_stats():
+    """이미지 분석 결과 캐시 적중률"""
+    return jsonify(image_result_cache.stats())
+
+@app.route('/api/vision/enrichment-cache/stats', methods=['GET'])
+def get_enrichment_cache_stats():
+    """지주회사 / 밸류체인 / 관련 상장사 보강 캐시 적중률"""
+    return jsonify(enrichment_cache.stats())
+
+@app.route('/api/vision/brand-resolver/stats', methods=['GET'])
+def get_brand_resolver_stats():
+    """로고/OCR 로컬 매칭으로 Gemini 식별을 생략한 비율"""
+    return jsonify(brand_resolver.stats())
+
+@app.route('/api/vision/jobs/stats', methods=['GET'])
+def get_image_job_stats():
+    """이미지 분석 작업 풀 상태 (실행/대기 중, 거절 수)"""
+    return jsonify(vision_jobs.stats())
+
 @app.route('/health', methods=['GET'])
 def health():
     return jsonify({'status': 'ok'})
@@ -0,0 +1,108 @@
+"""
+LLM 요약 결과 영구 캐시.
+
+(정규화 URL, 본문 SHA-256, 모델, 프롬프트 버전) 조합을 키로 요약문을 저장해
+같은 기사를 다른 사용자가 다시 요청해도 OpenAI를 호출하지 않도록 한다.
+- 저장소: SUMMARY_CACHE_BACKEND=sqlite(기본, cache/summaries.sqlite3) | memory(테스트·로컬용)
+- 통계: 적중/미스 횟수와 캐시 덕분에 절약한 토큰 수 (stats())
+프롬프트를 바꾸면 prompt_version을 올려 이전 요약이 재사용되지 않게 한다.
+"""
+import hashlib
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    from .article_cache import canonical_url
+    from .kv_store import open_store
+except ImportError:
+    from article_cache import canonical_url  # type: ignore
+    from kv_store import open_store  # type: ignore
+
+SUMMARY_CACHE_BACKEND = os.getenv("SUMMARY_CACHE_BACKEND") or None
+SUMMARY_CACHE_TTL_SEC = int(os.getenv("SUMMARY_CACHE_TTL_SEC", str(30 * 24 * 3600)))
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "20000"))
+
+
+class SummaryCache:
+    """요약 캐시 + 적중률 통계"""
+
+    def __init__(self, store: Any):
+        self._store = store
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "tokens_saved": 0, "tokens_spent": 0}
+
+    @staticmethod
+    def key_for(url: Optional[str], text: str, model: str, prompt_version: str) -> str:
+        text_hash = hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+        raw = "\x1f".join([canonical_url(url or ""), text_hash, model, prompt_version])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, url: Optional[str], text: str, model: str, prompt_version: str) -> Optional[str]:
+        entry = self._store.get(self.key_for(url, text, model, prompt_version))
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._stats["tokens_saved"] += int(entry.get("tokens") or 0)
+        return entry.get("summary")
+
+    def peek(self, url: Optional[str], text: str, model: str, prompt_version: str) -> Optional[str]:
+        """통계에 반영하지 않는 조회"""
+        entry = self._store.get(self.key_for(url, text, model, prompt_version))
+        return entry.get("summary") if entry else None
+
+    def put(self, url: Optional[str], text: str, model: str, prompt_version: str,
+            summary: str, tokens: int = 0) -> None:
+        if not summary:
+            return
+        self._store.set(
+            self.key_for(url, text, model, prompt_version),
+            {"summary": summary, "tokens": int(tokens or 0), "model": model, "prompt_version": prompt_version},
+        )
+        with self._lock:
+            self._stats["tokens_spent"] += int(tokens or 0)
+
+    def get_or_compute(
+        self,
+        url: Optional[str],
+        text: str,
+        model: str,
+        prompt_version: str,
+        compute: Callable[[], Optional[Tuple[str, int]]],
+    ) -> Optional[str]:
+        """캐시에 없으면 compute() → (요약문, 사용 토큰)을 호출하고 저장"""
+        cached = self.get(url, text, model, prompt_version)
+        if cached is not None:
+            return cached
+        result = compute()
+        if not result or not result[0]:
+            return None
+        summary, tokens = result
+        self.put(url, text, model, prompt_version, summary, tokens)
+        return summary
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["entries"] = len(self._store)
+        return stats
+
+
+summary_cache = SummaryCache(
+    open_store(
+        "summaries",
+        backend=SUMMARY_CACHE_BACKEND,
+        max_entries=SUMMARY_CACHE_MAX_ENTRIES,
+        ttl_sec=SUMMARY_CACHE_TTL_SEC,
+    )
+)
+
+
+__all__ = [
+    "SummaryCache",
+    "summary_cache",
+]
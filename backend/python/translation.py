@@ -0,0 +1,172 @@
+"""
+번역 서비스 (Google 번역).
+
+- 영구 캐시: (원문 SHA-256, 대상 언어) 키로 cache/translations.sqlite3에 저장
+- 묶음 번역: 짧은 세그먼트 여러 개를 구분자로 이어 한 번의 요청으로 번역
+- 긴 텍스트: 4,800자 제한에 맞춰 문단/문장 경계에서 나눈 뒤 번역하고 다시 이어붙임
+- 고정 sleep 대신 프로세스 공유 토큰 버킷(TRANSLATE_RATE_PER_SEC)으로 호출 속도 제한
+번역에 실패한 세그먼트는 "번역 실패"로 반환하며 캐시에 저장하지 않는다.
+"""
+import hashlib
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from deep_translator import GoogleTranslator
+
+try:
+    from .kv_store import open_store
+    from .rate_limiter import RateLimiter
+except ImportError:
+    from kv_store import open_store  # type: ignore
+    from rate_limiter import RateLimiter  # type: ignore
+
+TRANSLATE_MAX_CHARS = 4800
+TRANSLATE_RATE_PER_SEC = float(os.getenv("TRANSLATE_RATE_PER_SEC", "4"))
+TRANSLATE_CONCURRENCY = int(os.getenv("TRANSLATE_CONCURRENCY", "4"))
+TRANSLATE_CACHE_MAX_ENTRIES = int(os.getenv("TRANSLATE_CACHE_MAX_ENTRIES", "50000"))
+TRANSLATE_FAILED = "번역 실패"
+
+# 묶음 번역 구분자 (번역기가 건드리지 않는 기호 줄)
+_BATCH_DELIMITER = "\n\n@@@\n\n"
+_BATCH_SPLIT = re.compile(r"\s*@\s*@\s*@\s*")
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+")
+
+_limiter = RateLimiter(TRANSLATE_RATE_PER_SEC, burst=max(1, TRANSLATE_CONCURRENCY))
+_cache = open_store("translations", max_entries=TRANSLATE_CACHE_MAX_ENTRIES)
+
+
+def _cache_key(segment: str, dest_lang: str) -> str:
+    return f"{dest_lang}:{hashlib.sha256(segment.encode('utf-8')).hexdigest()}"
+
+
+def split_for_translation(text: str, max_chars: int = TRANSLATE_MAX_CHARS) -> List[str]:
+    """max_chars 이하 조각으로 분할 (문단 → 문장 → 글자 순서로 경계 선택)"""
+    if len(text) <= max_chars:
+        return [text]
+    chunks: List[str] = []
+    current = ""
+
+    def _emit(piece: str, sep: str) -> None:
+        nonlocal current
+        if not current:
+            current = piece
+        elif len(current) + len(sep) + len(piece) <= max_chars:
+            current = f"{current}{sep}{piece}"
+        else:
+            chunks.append(current)
+            current = piece
+
+    for paragraph in text.split("\n"):
+        if len(paragraph) <= max_chars:
+            _emit(paragraph, "\n")
+            continue
+        for sentence in _SENTENCE_END.split(paragraph):
+            while len(sentence) > max_chars:
+                _emit(sentence[:max_chars], " ")
+                sentence = sentence[max_chars:]
+            _emit(sentence, " ")
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _call_translator(text: str, dest_lang: str) -> Optional[str]:
+    _limiter.acquire()
+    try:
+        result = GoogleTranslator(source='auto', target=dest_lang).translate(text)
+    except Exception as exc:
+        print(f"[WARN] 번역 요청 실패: {exc}")
+        return None
+    return result if isinstance(result, str) else None
+
+
+def _pack_batches(segments: Sequence[str], max_chars: int) -> List[List[int]]:
+    """세그먼트 인덱스를 구분자 포함 max_chars 이하 묶음으로 나눔"""
+    batches: List[List[int]] = []
+    current: List[int] = []
+    size = 0
+    for idx, segment in enumerate(segments):
+        added = len(segment) + (len(_BATCH_DELIMITER) if current else 0)
+        if current and size + added > max_chars:
+            batches.append(current)
+            current, size = [], 0
+            added = len(segment)
+        current.append(idx)
+        size += added
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _translate_batch(segments: List[str], dest_lang: str) -> List[Optional[str]]:
+    if len(segments) == 1:
+        return [_call_translator(segments[0], dest_lang)]
+    joined = _call_translator(_BATCH_DELIMITER.join(segments), dest_lang)
+    if joined is not None:
+        parts = [p.strip() for p in _BATCH_SPLIT.split(joined)]
+        if len(parts) == len(segments):
+            return parts
+    # 구분자가 보존되지 않았으면 세그먼트별로 재시도
+    return [_call_translator(segment, dest_lang) for segment in segments]
+
+
+def translate_many(texts: Iterable[str], dest_lang: str = 'ko') -> List[str]:
+    """여러 텍스트를 캐시 조회 후 남은 세그먼트만 묶어서 번역 (입력 순서 유지)"""
+    texts = [t or "" for t in texts]
+    # 텍스트 → 세그먼트 목록 (긴 텍스트는 분할)
+    plans: List[List[str]] = [split_for_translation(t) if t else [] for t in texts]
+
+    translated: Dict[str, str] = {}
+    missing: List[str] = []
+    for segment in {s for plan in plans for s in plan}:
+        if not segment.strip():
+            translated[segment] = segment
+            continue
+        cached = _cache.get(_cache_key(segment, dest_lang))
+        if cached is not None:
+            translated[segment] = cached
+        else:
+            missing.append(segment)
+
+    if missing:
+        batches = _pack_batches(missing, TRANSLATE_MAX_CHARS)
+        jobs: List[Tuple[List[str], List[Optional[str]]]] = []
+        workers = max(1, min(TRANSLATE_CONCURRENCY, len(batches)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            batch_segments = [[missing[i] for i in batch] for batch in batches]
+            for segs, results in zip(batch_segments, executor.map(lambda s: _translate_batch(s, dest_lang), batch_segments)):
+                jobs.append((segs, results))
+        for segs, results in jobs:
+            for segment, result in zip(segs, results):
+                if result is None:
+                    continue
+                translated[segment] = result
+                _cache.set(_cache_key(segment, dest_lang), result)
+
+    outputs: List[str] = []
+    for text, plan in zip(texts, plans):
+        if not text:
+            outputs.append("")
+            continue
+        if any(segment not in translated for segment in plan):
+            outputs.append(TRANSLATE_FAILED)
+            continue
+        outputs.append("\n".join(translated[segment] for segment in plan))
+    return outputs
+
+
+def translate_text(text: str, dest_lang: str = 'ko') -> str:
+    """텍스트 1건 번역"""
+    if not text:
+        return ""
+    return translate_many([text], dest_lang=dest_lang)[0]
+
+
+__all__ = [
+    "TRANSLATE_FAILED",
+    "split_for_translation",
+    "translate_many",
+    "translate_text",
+]
@@ -3,6 +3,9 @@ import json
 import os
 import re
 import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed, wait
 from typing import Dict, Optional, Tuple, List, Any, Callable
 
 from dotenv import load_dotenv
@@ -15,6 +18,13 @@ try:
 except ImportError:  # pragma: no cover - 설치 누락 시 호출 영역에서 처리
     genai = None
 
+try:
+    from .brand_resolver import brand_resolver, object_from_summary
+    from .enrichment_cache import enrichment_cache
+except ImportError:
+    from brand_resolver import brand_resolver, object_from_summary  # type: ignore
+    from enrichment_cache import enrichment_cache  # type: ignore
+
 # 환경 변수 로드 (프로젝트 루트 .env)
 load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), ".env"))
 
@@ -93,9 +103,39 @@ HOLDING_MAP = {
     },
 }
 
+# HOLDING_MAP은 보강 캐시의 수동 지정 항목으로 등록 (enrichment_overrides.json 항목과 함께 LLM보다 우선)
+enrichment_cache.add_overrides("holding", HOLDING_MAP)
+# 비상장 브랜드도 로컬 매칭으로 식별하고 지주회사는 보강 단계에서 채움
+brand_resolver.add_aliases({
+    name: {"company": name, "company_market": "비상장", "company_ticker": "비상장"} for name in HOLDING_MAP
+})
+
 _ALLOWED_MARKETS = {"KRX", "KOSDAQ", "KOSPI", "NASDAQ", "NYSE", "TSE"}
-_HOLDING_CACHE: Dict[str, Dict[str, Any]] = {}
-_HOLDING_CACHE_MAX = 256
+
+# Gemini 모델 목록 / GenerativeModel 캐시 (프로세스 공용)
+GEMINI_CATALOG_TTL_SEC = float(os.getenv("GEMINI_CATALOG_TTL_SEC", "3600"))
+GEMINI_CATALOG_RETRY_SEC = 60.0
+GEMINI_MODEL_CACHE_MAX = 32
+_gemini_lock = threading.Lock()
+_gemini_catalog: Dict[str, Any] = {"api_key": None, "models": None, "expires_at": 0.0, "refreshing": False}
+_gemini_models: Dict[Tuple[str, str], Any] = {}
+
+# 지주회사 / 밸류체인 / 관련 상장사 보강 단계 (동시 실행, 공용 마감 시간)
+VISION_ENRICH_DEADLINE_SEC = float(os.getenv("VISION_ENRICH_DEADLINE_SEC", "20"))
+VISION_ENRICH_WORKERS = int(os.getenv("VISION_ENRICH_WORKERS", "12"))
+_enrichment_executor = ThreadPoolExecutor(max_workers=VISION_ENRICH_WORKERS, thread_name_prefix="vision-enrich")
+
+# Vision 클라이언트 / 배치 분석
+VISION_BATCH_MAX = 16  # batch_annotate_images 1회 최대 이미지 수
+VISION_BATCH_CONCURRENCY = int(os.getenv("VISION_BATCH_CONCURRENCY", "4"))
+_vision_client = None
+_vision_client_lock = threading.Lock()
+
+# 식별 단계 헤징 정책: off(비용 우선) | delayed(기본) | eager(지연 우선)
+VISION_HEDGE_POLICY = os.getenv("VISION_HEDGE_POLICY", "delayed").strip().lower()
+VISION_HEDGE_DELAY_SEC = float(os.getenv("VISION_HEDGE_DELAY_SEC", "4"))
+_hedge_executor = ThreadPoolExecutor(max_workers=int(os.getenv("VISION_HEDGE_WORKERS", "16")), thread_name_prefix="vision-hedge")
+_NO_VISION_INFO = "Vision API에서 유의미한 정보를 찾지 못했습니다."
 
 
 class VisionGeminiError(Exception):
@@ -129,25 +169,85 @@ def get_candidate_models(selected_model: Optional[str], available_models_clean:
     return model_names
 
 
-def prepare_gemini_client(api_key: Optional[str] = None, selected_model: Optional[str] = None):
-    """Gemini API 클라이언트를 준비하고 사용할 모델 후보를 반환 (pic_me 스타일)"""
+def _list_gemini_models(genai_module) -> Optional[List[str]]:
+    """generateContent를 지원하는 모델 이름 목록 (실패 시 None)"""
     try:
-        import google.generativeai as genai
-    except ImportError:
+        return [m.name.replace('models/', '') for m in genai_module.list_models()
+                if 'generateContent' in m.supported_generation_methods]
+    except Exception as exc:
+        logger.warning("Gemini 모델 목록 조회 실패: %s", exc)
+        return None
+
+
+def _refresh_gemini_catalog(genai_module, api_key: str) -> None:
+    models = _list_gemini_models(genai_module)
+    with _gemini_lock:
+        _gemini_catalog["refreshing"] = False
+        if _gemini_catalog["api_key"] != api_key:
+            return  # 갱신 중에 키가 바뀜
+        if models is not None:
+            _gemini_catalog["models"] = models
+            _gemini_catalog["expires_at"] = time.monotonic() + GEMINI_CATALOG_TTL_SEC
+        else:
+            # 실패 시 기존 목록을 유지하고 잠시 후 다시 시도
+            _gemini_catalog["expires_at"] = time.monotonic() + GEMINI_CATALOG_RETRY_SEC
+
+
+def get_available_gemini_models(genai_module, api_key: str) -> List[str]:
+    """
+    사용 가능한 모델 목록 (프로세스 공용 캐시).
+
+    최초 1회만 동기로 조회하고, TTL이 지나면 기존 목록을 바로 반환하면서 백그라운드에서 갱신한다.
+    """
+    with _gemini_lock:
+        if _gemini_catalog["api_key"] != api_key:
+            # 키가 바뀌면 configure 후 목록을 새로 조회
+            genai_module.configure(api_key=api_key)
+            _gemini_catalog.update(api_key=api_key, models=None, expires_at=0.0, refreshing=False)
+            _gemini_models.clear()
+        models = _gemini_catalog["models"]
+        stale = time.monotonic() >= _gemini_catalog["expires_at"]
+        start_refresh = models is not None and stale and not _gemini_catalog["refreshing"]
+        if start_refresh:
+            _gemini_catalog["refreshing"] = True
+    if models is None:
+        fetched = _list_gemini_models(genai_module)
+        with _gemini_lock:
+            if _gemini_catalog["api_key"] == api_key:
+                _gemini_catalog["models"] = fetched or []
+                ttl = GEMINI_CATALOG_TTL_SEC if fetched is not None else GEMINI_CATALOG_RETRY_SEC
+                _gemini_catalog["expires_at"] = time.monotonic() + ttl
+        return list(fetched or [])
+    if start_refresh:
+        threading.Thread(target=_refresh_gemini_catalog, args=(genai_module, api_key),
+                         name="gemini-catalog-refresh", daemon=True).start()
+    return list(models)
+
+
+def get_generative_model(genai_module, model_name: str, generation_config: Optional[Dict[str, Any]] = None):
+    """GenerativeModel 인스턴스 재사용 (모델명 + 생성 설정별)"""
+    cache_key = (model_name, json.dumps(generation_config or {}, sort_keys=True))
+    with _gemini_lock:
+        model = _gemini_models.get(cache_key)
+        if model is not None:
+            return model
+    model = genai_module.GenerativeModel(model_name, generation_config=generation_config)
+    with _gemini_lock:
+        if len(_gemini_models) >= GEMINI_MODEL_CACHE_MAX:
+            _gemini_models.pop(next(iter(_gemini_models)))
+        return _gemini_models.setdefault(cache_key, model)
+
+
+def prepare_gemini_client(api_key: Optional[str] = None, selected_model: Optional[str] = None):
+    """Gemini API 클라이언트를 준비하고 사용할 모델 후보를 반환 (pic_me 스타일, 모델 목록은 캐시 사용)"""
+    if genai is None:
         return None, None, [], "google-generativeai 패키지가 설치되지 않았습니다."
 
     key_to_use = api_key or os.getenv("GEMINI_API_KEY")
     if not key_to_use:
         return None, None, [], "GEMINI_API_KEY 환경 변수가 설정되지 않았습니다."
 
-    genai.configure(api_key=key_to_use)
-
-    try:
-        available_models = [m.name for m in genai.list_models()
-                            if 'generateContent' in m.supported_generation_methods]
-        available_models_clean = [m.replace('models/', '') for m in available_models]
-    except Exception:
-        available_models_clean = []
+    available_models_clean = get_available_gemini_models(genai, key_to_use)
 
     model_names = get_candidate_models(selected_model, available_models_clean)
     if not model_names:
@@ -186,11 +286,6 @@ def _normalize_exchange_name(name: Optional[str]) -> Optional[str]:
     return n
 
 
-def _normalize_company_name(name: str) -> str:
-    """회사명 정규화 (pic_me 스타일)"""
-    return (name or "").strip().casefold()
-
-
 def resolve_holding_company(
     brand: Optional[str],
     company: Optional[str],
@@ -199,18 +294,37 @@ def resolve_holding_company(
     selected_model: Optional[str] = None,
     min_confidence: float = 0.6,
 ) -> Dict[str, Any]:
-    """비상장 브랜드/회사에 대해 Gemini로 상장 지주회사 정보를 탐색 (pic_me 스타일)"""
+    """비상장 브랜드/회사에 대해 Gemini로 상장 지주회사 정보를 탐색 (pic_me 스타일, 보강 캐시 사용)"""
+    curated = enrichment_cache.curated("holding", company, brand)
+    if curated:
+        return dict(curated)
+    parts = {"brand": brand, "company": company, "candidates": brand_candidates or [], "min_confidence": min_confidence}
+    hit, cached = enrichment_cache.lookup("holding", parts)
+    if hit:
+        return cached
+    resolved = _resolve_holding_company_llm(brand, company, brand_candidates, api_key, selected_model, min_confidence)
+    if resolved is None:
+        return {}
+    enrichment_cache.put("holding", parts, resolved)
+    return resolved
+
+
+def _resolve_holding_company_llm(
+    brand: Optional[str],
+    company: Optional[str],
+    brand_candidates: Optional[List[str]],
+    api_key: Optional[str],
+    selected_model: Optional[str],
+    min_confidence: float,
+) -> Optional[Dict[str, Any]]:
+    """Gemini 호출. 호출/파싱 실패 시 None (캐시하지 않음), 조건 미달이면 {}"""
     brand_norm = (brand or "").strip()
     company_norm = (company or "").strip()
-    cand_key = ",".join(sorted(set(brand_candidates or [])))
-    cache_key = f"{brand_norm}|{company_norm}|{cand_key}".casefold()
-    if cache_key in _HOLDING_CACHE:
-        return _HOLDING_CACHE[cache_key]
 
     genai, selected_model, available_models_clean, error_message = prepare_gemini_client(api_key, selected_model)
     if error_message:
         logger.warning("resolve_holding_company: prepare client error: %s", error_message)
-        return {}
+        return None
 
     model_names = get_candidate_models(selected_model, available_models_clean)
     generation_config = {"temperature": 0.2, "top_p": 0.9, "top_k": 40}
@@ -237,7 +351,7 @@ JSON 스키마:
     used_model = None
     for model_name in model_names:
         try:
-            model = genai.GenerativeModel(model_name, generation_config=generation_config)
+            model = get_generative_model(genai, model_name, generation_config)
             response = model.generate_content(prompt)
             used_model = model_name
             break
@@ -247,12 +361,12 @@ JSON 스키마:
             response = None
 
     if response is None:
-        return {}
+        return None
 
     result, parse_error = extract_json_from_response_text(response.text.strip())
     if parse_error:
         logger.warning("resolve_holding_company: parse error: %s", parse_error)
-        return {}
+        return None
 
     holding_company = (result.get("holding_company") or "").strip()
     holding_market = (result.get("holding_market") or "").strip()
@@ -275,9 +389,6 @@ JSON 스키마:
         "holding_model": used_model,
         "holding_confidence": confidence,
     }
-    if len(_HOLDING_CACHE) >= _HOLDING_CACHE_MAX:
-        _HOLDING_CACHE.pop(next(iter(_HOLDING_CACHE)))
-    _HOLDING_CACHE[cache_key] = resolved
     return resolved
 
 
@@ -299,8 +410,7 @@ def augment_with_holding_info(
     is_private = (market is None) or (str(market).strip().lower() == "비상장")
 
     if company and is_private:
-        key = _normalize_company_name(company)
-        holding = HOLDING_MAP.get(key) or HOLDING_MAP.get(company) or HOLDING_MAP.get(company.strip())
+        holding = enrichment_cache.curated("holding", company)
         if holding:
             result = dict(result)
             result.update({
@@ -346,10 +456,39 @@ def suggest_value_chain_suppliers(
     selected_model: Optional[str] = None,
     top_k: int = 2,
 ) -> List[Dict[str, Any]]:
-    """제품의 핵심 부품(Value Chain) 공급사 정보를 최대 2개까지 제안 (pic_me 스타일)"""
+    """제품의 핵심 부품(Value Chain) 공급사 정보를 최대 2개까지 제안 (pic_me 스타일, 보강 캐시 사용)"""
+    curated = enrichment_cache.curated("value_chain", brand, object_name)
+    if curated:
+        return list(curated)[:top_k]
+    if not object_name and not brand:
+        # 식별 정보가 없으면 text_hint만으로 결과가 달라지므로 캐시하지 않음
+        return _suggest_value_chain_llm(object_name, brand, text_hint, supplier_candidates,
+                                        api_key, selected_model, top_k) or []
+    parts = {"object": object_name, "brand": brand, "supplier_candidates": supplier_candidates or [], "top_k": top_k}
+    hit, cached = enrichment_cache.lookup("value_chain", parts)
+    if hit:
+        return cached
+    suppliers = _suggest_value_chain_llm(object_name, brand, text_hint, supplier_candidates,
+                                         api_key, selected_model, top_k)
+    if suppliers is None:
+        return []
+    enrichment_cache.put("value_chain", parts, suppliers)
+    return suppliers
+
+
+def _suggest_value_chain_llm(
+    object_name: Optional[str],
+    brand: Optional[str],
+    text_hint: Optional[str],
+    supplier_candidates: Optional[List[str]],
+    api_key: Optional[str],
+    selected_model: Optional[str],
+    top_k: int,
+) -> Optional[List[Dict[str, Any]]]:
+    """Gemini 호출. 호출/파싱 실패 시 None (캐시하지 않음)"""
     genai, sel, available, err = prepare_gemini_client(api_key, selected_model)
     if err:
-        return []
+        return None
 
     models = get_candidate_models(sel, available)
 
@@ -380,7 +519,7 @@ def suggest_value_chain_suppliers(
     used = None
     for m in models:
         try:
-            model = genai.GenerativeModel(m, generation_config=gen_cfg)
+            model = get_generative_model(genai, m, gen_cfg)
             r = model.generate_content(prompt)
             if getattr(r, "text", None):
                 resp = r
@@ -390,11 +529,11 @@ def suggest_value_chain_suppliers(
             continue
 
     if resp is None:
-        return []
+        return None
 
     data, perr = extract_json_from_response_text(resp.text.strip())
     if perr or not isinstance(data, dict):
-        return []
+        return None
 
     items = data.get("components") or []
     out: List[Dict[str, Any]] = []
@@ -433,11 +572,33 @@ def suggest_related_public_companies(
     selected_model: Optional[str] = None,
     top_k: int = 3,
 ) -> Dict[str, Any]:
-    """제품 관련 상장사 추천 (pic_me 스타일 - 간소화 버전)"""
+    """제품 관련 상장사 추천 (pic_me 스타일 - 간소화 버전, 보강 캐시 사용)"""
+    curated = enrichment_cache.curated("related", brand, object_name)
+    if curated:
+        return {"companies": list(curated)[:top_k]}
+    parts = {"object": object_name, "brand": brand, "top_k": top_k}
+    hit, cached = enrichment_cache.lookup("related", parts)
+    if hit:
+        return {"companies": cached}
+    companies = _suggest_related_llm(object_name, brand, api_key, selected_model, top_k)
+    if companies is None:
+        return {"companies": []}
+    enrichment_cache.put("related", parts, companies)
+    return {"companies": companies}
+
+
+def _suggest_related_llm(
+    object_name: Optional[str],
+    brand: Optional[str],
+    api_key: Optional[str],
+    selected_model: Optional[str],
+    top_k: int,
+) -> Optional[List[Dict[str, Any]]]:
+    """Gemini 호출. 호출/파싱 실패 시 None (캐시하지 않음)"""
     genai, selected_model, available_models_clean, error_message = prepare_gemini_client(api_key, selected_model)
     if error_message:
         logger.warning("suggest_related_public_companies: prepare client error: %s", error_message)
-        return {"companies": []}
+        return None
 
     model_names = get_candidate_models(selected_model, available_models_clean)
     generation_config = {"temperature": 0.2, "top_p": 0.9, "top_k": 40}
@@ -460,7 +621,7 @@ JSON ONLY:
     used_model = None
     for model_name in model_names:
         try:
-            model = genai.GenerativeModel(model_name, generation_config=generation_config)
+            model = get_generative_model(genai, model_name, generation_config)
             response = model.generate_content(comp_prompt)
             used_model = model_name
             break
@@ -470,12 +631,12 @@ JSON ONLY:
             response = None
 
     if response is None or not getattr(response, "text", None):
-        return {"companies": []}
+        return None
 
     result, parse_error = extract_json_from_response_text(response.text.strip())
     if parse_error or not isinstance(result, dict):
         logger.warning("suggest_related_public_companies: parse error: %s", parse_error)
-        return {"companies": []}
+        return None
 
     items = result.get("companies") or []
     cleaned: List[Dict[str, Any]] = []
@@ -492,7 +653,7 @@ JSON ONLY:
         if len(cleaned) >= top_k:
             break
 
-    return {"companies": cleaned}
+    return cleaned
 
 
 def _summarize_vision_response(response) -> str:
@@ -527,11 +688,13 @@ def _summarize_vision_response(response) -> str:
                 preview = preview[:300] + "..."
             parts.append(f"OCR Text: {preview}")
 
-    return "\n".join(parts) if parts else "Vision API에서 유의미한 정보를 찾지 못했습니다."
+    return "\n".join(parts) if parts else _NO_VISION_INFO
 
 
-def _call_gemini_with_text(summary: str, api_key: Optional[str] = None, selected_model: Optional[str] = None) -> Tuple[Optional[Dict], Optional[str], Optional[str]]:
-    """Vision 분석 요약을 Gemini에 전달하여 object/brand/company 판단 (pic_me 스타일)"""
+def _call_gemini_with_text(summary: str, api_key: Optional[str] = None, selected_model: Optional[str] = None,
+                           local_hint: Optional[str] = None) -> Tuple[Optional[Dict], Optional[str], Optional[str]]:
+    """Vision 분석 요약을 Gemini에 전달하여 object/brand/company 판단 (pic_me 스타일)
+    local_hint: 확정하지 못한 로컬 상장사 매칭 (brand_resolver) — 참고용으로만 프롬프트에 추가"""
     genai, selected_model, available_models_clean, error_message = prepare_gemini_client(api_key, selected_model)
     if error_message:
         return None, None, error_message
@@ -551,6 +714,9 @@ JSON 형식:
 - 브랜드가 확인되면 그 브랜드를 실제로 제조하거나 판매하는 법인명을 정확히 기입하세요(예: 롯데자일리톨 → 롯데웰푸드). 그룹명만 알 수 있을 때는 추가 근거를 찾아보고, 끝까지 확실하지 않으면 company는 null로 두세요.
 - company_market에는 상장 거래소(예: KRX, NASDAQ 등), company_ticker에는 정확한 티커를 기입하세요. 비상장이면 두 필드 모두 "비상장"으로 작성하고, 확실하지 않으면 null로 두세요.
 - 추측하거나 부정확한 정보를 제공하지 마세요."""
+    if local_hint:
+        prompt += f"""
+- 참고: {local_hint}. 일반 단어(예: 대상, 남성, apple)와 우연히 겹쳤을 수 있으니 제품의 브랜드/제조사로 확인될 때만 사용하세요."""
 
     last_error = None
     used_model = None
@@ -564,7 +730,7 @@ JSON 형식:
 
     for model_name in model_names:
         try:
-            model = genai.GenerativeModel(model_name, generation_config=generation_config)
+            model = get_generative_model(genai, model_name, generation_config)
             response = model.generate_content(prompt)
             used_model = model_name
             break
@@ -620,7 +786,7 @@ def _call_gemini_with_image(image_bytes: bytes, api_key: Optional[str] = None, s
 
     for model_name in model_names:
         try:
-            model = genai.GenerativeModel(model_name, generation_config=generation_config)
+            model = get_generative_model(genai, model_name, generation_config)
             response = model.generate_content([prompt, image])
             used_model = model_name
             break
@@ -640,10 +806,139 @@ def _call_gemini_with_image(image_bytes: bytes, api_key: Optional[str] = None, s
     return result, used_model, None
 
 
-def analyze_product_from_image(image_bytes: bytes) -> Dict:
+def _enrich_holding(base_data: Dict[str, Any], summary: str, api_key: Optional[str], selected_model: Optional[str]) -> Dict[str, Any]:
+    """지주회사 정보 보강"""
+    enriched = augment_with_holding_info(
+        base_data,
+        resolver=resolve_holding_company,
+        api_key=api_key,
+        selected_model=selected_model,
+        brand_candidates=None,
+    )
+    if enriched and enriched.get("holding_company"):
+        return {"holding_company": {
+            "holding_company": enriched.get("holding_company"),
+            "holding_market": enriched.get("holding_market"),
+            "holding_ticker": enriched.get("holding_ticker"),
+            "holding_sources": enriched.get("holding_sources", []),
+            "holding_confidence": enriched.get("holding_confidence"),
+        }}
+    return {}
+
+
+def _enrich_value_chain(base_data: Dict[str, Any], summary: str, api_key: Optional[str], selected_model: Optional[str]) -> Dict[str, Any]:
+    """밸류체인 공급사 제안 (최대 2개)"""
+    vc = suggest_value_chain_suppliers(
+        object_name=base_data.get("object"),
+        brand=base_data.get("brand"),
+        text_hint=summary[:500] if summary else None,
+        supplier_candidates=None,
+        api_key=api_key,
+        selected_model=selected_model,
+        top_k=2,
+    )
+    return {"value_chain": vc} if vc else {}
+
+
+def _enrich_related(base_data: Dict[str, Any], summary: str, api_key: Optional[str], selected_model: Optional[str]) -> Dict[str, Any]:
+    """관련 상장사 제안 (최대 3개)"""
+    def _is_null(v):
+        return (v is None) or (str(v).strip() == "") or (str(v).lower() == "null")
+    if _is_null(base_data.get('object')) and _is_null(base_data.get('brand')) and _is_null(base_data.get('company')):
+        return {}
+    related = suggest_related_public_companies(
+        object_name=base_data.get("object"),
+        brand=base_data.get("brand"),
+        api_key=api_key,
+        selected_model=selected_model,
+        top_k=3,
+    )
+    if related and related.get("companies"):
+        return {"related_public_companies": related.get("companies")}
+    return {}
+
+
+# (이름, 함수, 실패 로그) - 서로 독립적인 Gemini 호출
+_ENRICHMENT_STEPS = (
+    ("holding_company", _enrich_holding, "지주회사 보강 실패"),
+    ("value_chain", _enrich_value_chain, "밸류체인 제안 실패"),
+    ("related_public_companies", _enrich_related, "관련 상장사 제안 실패"),
+)
+
+
+def _run_enrichment(base_data: Dict[str, Any], summary: str, api_key: Optional[str], selected_model: Optional[str],
+                    on_progress: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    보강 단계를 동시에 실행하고 VISION_ENRICH_DEADLINE_SEC 안에 끝난 결과만 반환.
+    마감까지 끝나지 않은 단계는 enrichment_incomplete에 이름을 남긴다.
+    on_progress가 있으면 단계가 끝날 때마다 (단계 이름, 결과)로 호출한다.
+    """
+    futures = {
+        _enrichment_executor.submit(fn, base_data, summary, api_key, selected_model): (name, log_message)
+        for name, fn, log_message in _ENRICHMENT_STEPS
+    }
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        for future in as_completed(futures, timeout=VISION_ENRICH_DEADLINE_SEC):
+            name, log_message = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.warning("%s: %s", log_message, str(e))
+                results[name] = {}
+            if on_progress:
+                on_progress(name, results[name])
+    except FuturesTimeoutError:
+        pass
+    merged: Dict[str, Any] = {}
+    for name, _, _ in _ENRICHMENT_STEPS:  # 단계 순서대로 병합
+        merged.update(results.get(name) or {})
+    pending = [name for name, _, _ in _ENRICHMENT_STEPS if name not in results]
+    if pending:
+        logger.warning("보강 단계 마감 시간(%.0f초) 초과: %s", VISION_ENRICH_DEADLINE_SEC, ", ".join(pending))
+        merged["enrichment_incomplete"] = pending
+    return merged
+
+
+def get_vision_client() -> "vision.ImageAnnotatorClient":
+    """프로세스 공용 Vision 클라이언트 (gRPC 채널·인증을 요청마다 새로 만들지 않음)"""
+    global _vision_client
+    if _vision_client is None:
+        with _vision_client_lock:
+            if _vision_client is None:
+                _vision_client = vision.ImageAnnotatorClient()
+    return _vision_client
+
+
+def _vision_features() -> List[Dict[str, Any]]:
+    return [
+        {"type_": vision_types.Feature.Type.LABEL_DETECTION},
+        {"type_": vision_types.Feature.Type.TEXT_DETECTION},
+        {"type_": vision_types.Feature.Type.LOGO_DETECTION},
+        {"type_": vision_types.Feature.Type.OBJECT_LOCALIZATION},
+    ]
+
+
+def annotate_images(images: List[bytes]) -> List[Any]:
+    """여러 이미지를 batch_annotate_images로 분석 (VISION_BATCH_MAX장씩 한 번의 요청)"""
+    client = get_vision_client()
+    responses: List[Any] = []
+    for start in range(0, len(images), VISION_BATCH_MAX):
+        chunk = images[start:start + VISION_BATCH_MAX]
+        batch = client.batch_annotate_images(requests=[
+            {"image": vision_types.Image(content=content), "features": _vision_features()}
+            for content in chunk
+        ])
+        responses.extend(batch.responses)
+    return responses
+
+
+def analyze_product_from_image(image_bytes: bytes,
+                               on_progress: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict:
     """
     Vision API + Gemini(텍스트) 기반으로 제품/브랜드 정보를 추출한다.
     실패 시 Gemini 직접 이미지 분석 결과를 함께 반환한다.
+    on_progress(단계, 결과)는 식별("identified")과 보강 단계가 끝날 때마다 호출된다 (vision_jobs).
 
     Returns:
         {
@@ -654,68 +949,194 @@ def analyze_product_from_image(image_bytes: bytes) -> Dict:
         }
     """
 
-    client = vision.ImageAnnotatorClient()
-    image = vision_types.Image(content=image_bytes)
-    features = [
-        {"type_": vision_types.Feature.Type.LABEL_DETECTION},
-        {"type_": vision_types.Feature.Type.TEXT_DETECTION},
-        {"type_": vision_types.Feature.Type.LOGO_DETECTION},
-        {"type_": vision_types.Feature.Type.OBJECT_LOCALIZATION},
-    ]
+    def _vision_summary() -> str:
+        image = vision_types.Image(content=image_bytes)
+        vision_response = get_vision_client().annotate_image({"image": image, "features": _vision_features()})
+        return _summarize_vision_response(vision_response)
 
-    vision_response = client.annotate_image({"image": image, "features": features})
-    summary = _summarize_vision_response(vision_response)
+    return _analyze_product(image_bytes, _vision_summary, on_progress)
 
-    # API 키는 환경 변수에서 가져옴
-    api_key = os.getenv("GEMINI_API_KEY")
-    selected_model = None  # 필요시 파라미터로 받을 수 있음
 
-    primary_data, primary_model, primary_error = _call_gemini_with_text(summary, api_key=api_key, selected_model=selected_model)
-    primary_result = {
-        "model": primary_model,
+def analyze_products_from_images(images: List[bytes]) -> List[Dict]:
+    """
+    여러 이미지를 한 번의 Vision 배치 요청으로 분석한 뒤,
+    이미지별 Gemini 단계를 최대 VISION_BATCH_CONCURRENCY개씩 동시에 실행한다. 결과는 입력 순서.
+    """
+    if not images:
+        return []
+    vision_responses = annotate_images(images)
+
+    def _one(image_bytes: bytes, vision_response: Any) -> Dict:
+        error = getattr(getattr(vision_response, "error", None), "message", "")
+        if error:
+            return {"error": f"Vision 분석 실패: {error}"}
+        try:
+            return _analyze_from_vision_response(image_bytes, vision_response)
+        except Exception as e:
+            logger.warning("배치 이미지 분석 실패: %s", str(e))
+            return {"error": f"이미지 분석 중 오류가 발생했습니다: {e}"}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(VISION_BATCH_CONCURRENCY, len(images))),
+                            thread_name_prefix="vision-batch") as executor:
+        return list(executor.map(_one, images, vision_responses))
+
+
+def _analyze_from_vision_response(image_bytes: bytes, vision_response: Any) -> Dict:
+    """Vision 응답 → Gemini 식별 / 직접 분석 폴백 / 보강"""
+    return _analyze_product(image_bytes, lambda: _summarize_vision_response(vision_response))
+
+
+def _identification_result(data: Optional[Dict], model: Optional[str], error: Optional[str]) -> Dict[str, Any]:
+    result = {
+        "model": model,
         "object": None,
         "brand": None,
         "company": None,
         "company_market": None,
         "company_ticker": None,
-        "error": primary_error,
+        "error": error,
     }
-    if primary_data:
-        primary_result.update(
+    if data:
+        result.update(
             {
-                "object": primary_data.get("object"),
-                "brand": primary_data.get("brand"),
-                "company": primary_data.get("company"),
-                "company_market": _normalize_exchange_name(primary_data.get("company_market")),
-                "company_ticker": primary_data.get("company_ticker"),
+                "object": data.get("object"),
+                "brand": data.get("brand"),
+                "company": data.get("company"),
+                "company_market": _normalize_exchange_name(data.get("company_market")),
+                "company_ticker": data.get("company_ticker"),
             }
         )
+    return result
 
-    fallback_result = None
-    used_fallback = False
-
-    if primary_error or not primary_data:
-        fallback_data, fallback_model, fallback_error = _call_gemini_with_image(image_bytes, api_key=api_key, selected_model=selected_model)
-        fallback_result = {
-            "model": fallback_model,
-            "object": None,
-            "brand": None,
-            "company": None,
-            "company_market": None,
-            "company_ticker": None,
-            "error": fallback_error,
-        }
-        if fallback_data:
-            fallback_result.update(
-                {
-                    "object": fallback_data.get("object"),
-                    "brand": fallback_data.get("brand"),
-                    "company": fallback_data.get("company"),
-                    "company_market": _normalize_exchange_name(fallback_data.get("company_market")),
-                    "company_ticker": fallback_data.get("company_ticker"),
-                }
-            )
-        used_fallback = bool(fallback_data and not primary_data)
+
+def is_low_information_summary(summary: Optional[str]) -> bool:
+    """로고·OCR 텍스트·물체가 모두 없는 Vision 요약 (텍스트 경로로 식별될 가능성이 낮음)"""
+    if not summary or summary == _NO_VISION_INFO:
+        return True
+    return not any(summary_line.startswith(prefix)
+                   for summary_line in summary.splitlines()
+                   for prefix in ("Logos:", "OCR Text:", "Objects:"))
+
+
+def _race_identification(
+    image_bytes: bytes,
+    get_summary: Callable[[], str],
+    api_key: Optional[str],
+    selected_model: Optional[str],
+    policy: str,
+) -> Tuple[Optional[str], Optional[Tuple], Optional[Tuple], Dict[str, Any]]:
+    """
+    Vision→Gemini(텍스트) 경로와 Gemini(이미지) 직접 분석을 정책에 따라 실행.
+
+    - off: 텍스트 경로가 실패했을 때만 이미지 분석 (호출 비용 최소)
+    - delayed: VISION_HEDGE_DELAY_SEC 안에 텍스트 경로가 끝나지 않으면 이미지 분석도 시작
+    - eager: 처음부터 두 경로를 동시에 실행 (지연 시간 최소)
+    off가 아니면 Vision 요약의 정보가 부족할 때 지연 없이 바로 이미지 분석을 시작한다.
+    텍스트 경로는 로고/OCR이 상장사와 확실히 일치하면(brand_resolver) Gemini를 호출하지 않고,
+    확실하지 않은 OCR 일치는 프롬프트 힌트로만 넘긴다.
+    먼저 유효한 JSON을 돌려준 경로를 사용하고, 진 쪽은 아직 시작 전이면 취소, 실행 중이면 결과를 버린다.
+
+    Returns: (Vision 요약, 텍스트 경로 결과, 이미지 경로 결과, hedge 정보). 결과는 (data, model, error) 또는 None
+    """
+    wake = threading.Event()
+    state: Dict[str, Any] = {"summary": None, "low_information": False, "local_match": None}
+
+    def _text_path():
+        summary = get_summary()
+        state["summary"] = summary
+        if is_low_information_summary(summary):
+            state["low_information"] = True
+            wake.set()
+        match = brand_resolver.resolve(summary)
+        if match is not None:
+            state["local_match"] = match.info()
+            if match.confident:
+                return match.identification(object_from_summary(summary)), "local", None
+        hint = match.hint() if match is not None else None
+        return _call_gemini_with_text(summary, api_key=api_key, selected_model=selected_model, local_hint=hint)
+
+    def _image_path():
+        return _call_gemini_with_image(image_bytes, api_key=api_key, selected_model=selected_model)
+
+    def _ok(future) -> bool:
+        try:
+            return bool(future.result()[0])
+        except Exception:
+            return False
+
+    def _outcome(future) -> Optional[Tuple]:
+        if future is None or not future.done() or future.cancelled():
+            return None
+        try:
+            return future.result()
+        except Exception as exc:
+            return None, None, str(exc)
+
+    info: Dict[str, Any] = {"policy": policy, "hedged": False, "reason": None, "winner": None}
+    text_future = _hedge_executor.submit(_text_path)
+    text_future.add_done_callback(lambda _: wake.set())
+    image_future = None
+
+    def _start_image(reason: str) -> None:
+        nonlocal image_future
+        if image_future is None:
+            image_future = _hedge_executor.submit(_image_path)
+            info["reason"] = reason
+            info["hedged"] = not text_future.done()
+
+    if policy == "eager":
+        _start_image("eager")
+    elif policy == "delayed":
+        wake.wait(timeout=VISION_HEDGE_DELAY_SEC)
+        if not text_future.done():
+            _start_image("low_information" if state["low_information"] else "delay")
+
+    # 먼저 유효한 결과를 낸 경로 채택
+    while True:
+        futures = [f for f in (text_future, image_future) if f is not None]
+        if any(f.done() and _ok(f) for f in futures):
+            break
+        running = [f for f in futures if not f.done()]
+        if not running:
+            if image_future is None:
+                # 텍스트 경로 실패 → 이미지 직접 분석 (직렬 폴백)
+                _start_image("primary_failed")
+                continue
+            break
+        wait(running, return_when=FIRST_COMPLETED)
+
+    if text_future.done() and _ok(text_future):
+        info["winner"] = "vision_text"
+        if state["local_match"]:
+            info["local_match"] = state["local_match"]
+    elif image_future is not None and image_future.done() and _ok(image_future):
+        info["winner"] = "gemini_image"
+
+    loser = image_future if info["winner"] == "vision_text" else text_future
+    if loser is not None and not loser.done():
+        # 시작 전이면 취소, 이미 실행 중인 SDK 호출은 중단할 수 없으므로 결과만 버림
+        info["loser"] = "cancelled" if loser.cancel() else "abandoned"
+    return state["summary"], _outcome(text_future), _outcome(image_future), info
+
+
+def _analyze_product(image_bytes: bytes, get_summary: Callable[[], str],
+                     on_progress: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict:
+    """제품 식별 (텍스트 경로 / 이미지 직접 분석, VISION_HEDGE_POLICY) + 보강"""
+    # API 키는 환경 변수에서 가져옴
+    api_key = os.getenv("GEMINI_API_KEY")
+    selected_model = None  # 필요시 파라미터로 받을 수 있음
+
+    summary, primary, fallback, hedge = _race_identification(
+        image_bytes, get_summary, api_key, selected_model, VISION_HEDGE_POLICY,
+    )
+    primary_data = primary[0] if primary else None
+    fallback_data = fallback[0] if fallback else None
+    primary_result = _identification_result(*primary) if primary else \
+        _identification_result(None, None, "이미지 직접 분석이 먼저 완료되어 중단됨")
+    fallback_result = _identification_result(*fallback) if fallback else None
+    used_fallback = hedge["winner"] == "gemini_image"
+    if not used_fallback:
+        fallback_data = None
 
     # 기본 결과 구성
     final_result = {
@@ -723,64 +1144,16 @@ def analyze_product_from_image(image_bytes: bytes) -> Dict:
         "primary": primary_result,
         "fallback": fallback_result,
         "used_fallback": used_fallback,
+        "hedge": hedge,
     }
 
     # 보강 정보 추가 (개발 단계에서 확인용)
-    # primary 또는 fallback 중 성공한 결과 사용
-    base_data = primary_data if primary_data else fallback_data
+    # primary 또는 fallback 중 먼저 성공한 결과 사용
+    base_data = fallback_data if used_fallback else primary_data
+    if on_progress:
+        on_progress("identified", dict(final_result))
     if base_data:
-        # 1) 지주회사 정보 보강
-        try:
-            enriched = augment_with_holding_info(
-                base_data,
-                resolver=resolve_holding_company,
-                api_key=api_key,
-                selected_model=selected_model,
-                brand_candidates=None,
-            )
-            if enriched and enriched.get("holding_company"):
-                final_result["holding_company"] = {
-                    "holding_company": enriched.get("holding_company"),
-                    "holding_market": enriched.get("holding_market"),
-                    "holding_ticker": enriched.get("holding_ticker"),
-                    "holding_sources": enriched.get("holding_sources", []),
-                    "holding_confidence": enriched.get("holding_confidence"),
-                }
-        except Exception as e:
-            logger.warning("지주회사 보강 실패: %s", str(e))
-
-        # 2) 밸류체인 공급사 제안 (최대 2개)
-        try:
-            vc = suggest_value_chain_suppliers(
-                object_name=base_data.get("object"),
-                brand=base_data.get("brand"),
-                text_hint=summary[:500] if summary else None,
-                supplier_candidates=None,
-                api_key=api_key,
-                selected_model=selected_model,
-                top_k=2,
-            )
-            if vc:
-                final_result["value_chain"] = vc
-        except Exception as e:
-            logger.warning("밸류체인 제안 실패: %s", str(e))
-
-        # 3) 관련 상장사 제안 (최대 3개)
-        try:
-            def _is_null(v):
-                return (v is None) or (str(v).strip() == "") or (str(v).lower() == "null")
-            if not (_is_null(base_data.get('object')) and _is_null(base_data.get('brand')) and _is_null(base_data.get('company'))):
-                related = suggest_related_public_companies(
-                    object_name=base_data.get("object"),
-                    brand=base_data.get("brand"),
-                    api_key=api_key,
-                    selected_model=selected_model,
-                    top_k=3,
-                )
-                if related and related.get("companies"):
-                    final_result["related_public_companies"] = related.get("companies")
-        except Exception as e:
-            logger.warning("관련 상장사 제안 실패: %s", str(e))
+        final_result.update(_run_enrichment(base_data, summary or "", api_key, selected_model, on_progress))
 
     return final_result
 
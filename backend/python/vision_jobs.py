@@ -0,0 +1,166 @@
+"""
+이미지 분석 비동기 작업 (제출 → 폴링).
+
+Vision + Gemini 분석은 10~30초가 걸려 요청 스레드를 붙잡으면 시세 API가 밀린다.
+제출 요청은 작업 ID만 돌려주고, 분석은 크기가 제한된 전용 스레드 풀에서 실행한다.
+- 동시 실행: VISION_JOB_WORKERS (기본 2), 대기+실행 중 작업이 VISION_JOB_QUEUE_MAX를 넘으면 제출 거절
+- 진행 상태: 식별(identified) → 지주회사 / 밸류체인 / 관련 상장사 단계가 끝날 때마다 result에 누적
+- 저장소: VISION_JOBS_BACKEND=sqlite(기본, cache/vision_jobs.sqlite3) | memory
+  여러 워커 프로세스 중 어느 곳에 폴링해도 조회 가능. 마지막 갱신 후 VISION_JOB_TTL_SEC이 지나면 만료
+작업 상태: queued → running → done | error
+"""
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+try:
+    from .kv_store import open_store
+except ImportError:
+    from kv_store import open_store  # type: ignore
+
+VISION_JOB_WORKERS = int(os.getenv("VISION_JOB_WORKERS", "2"))
+VISION_JOB_QUEUE_MAX = int(os.getenv("VISION_JOB_QUEUE_MAX", "32"))
+VISION_JOB_TTL_SEC = int(os.getenv("VISION_JOB_TTL_SEC", "3600"))
+VISION_JOBS_BACKEND = os.getenv("VISION_JOBS_BACKEND") or None
+VISION_JOB_MAX_ENTRIES = int(os.getenv("VISION_JOB_MAX_ENTRIES", "5000"))
+# 클라이언트 폴링 간격 안내 (초)
+VISION_JOB_POLL_AFTER_SEC = 1.0
+
+# 진행 단계 (vision_bridge.analyze_product_from_image의 on_progress 단계 이름)
+JOB_STAGES = ("identified", "holding_company", "value_chain", "related_public_companies")
+
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+
+class JobQueueFull(Exception):
+    """대기 중인 작업이 VISION_JOB_QUEUE_MAX에 도달"""
+
+
+class VisionJobRunner:
+    """작업 제출 / 진행 상태 저장 / 조회"""
+
+    def __init__(self, store: Any, workers: int = VISION_JOB_WORKERS, queue_max: int = VISION_JOB_QUEUE_MAX):
+        self._store = store
+        self._workers = max(1, workers)
+        self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="vision-job")
+        self._queue_max = queue_max
+        self._lock = threading.Lock()
+        self._active = 0
+        self._stats = {"submitted": 0, "done": 0, "error": 0, "rejected": 0}
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"job:{job_id}"
+
+    def submit(self, work: Callable[[ProgressCallback], Dict[str, Any]],
+               meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """work(on_progress) → 최종 결과. 작업 문서(queued)를 반환"""
+        with self._lock:
+            if self._active >= self._queue_max:
+                self._stats["rejected"] += 1
+                raise JobQueueFull(f"대기 중인 분석 작업이 많습니다 ({self._active}건).")
+            self._active += 1
+            self._stats["submitted"] += 1
+        job = self._new_job(meta)
+        self._store.set(self._key(job["job_id"]), job)
+        try:
+            self._executor.submit(self._run, job["job_id"], work)
+        except Exception:
+            with self._lock:
+                self._active -= 1
+            raise
+        return job
+
+    def complete(self, result: Dict[str, Any], meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """이미 결과가 있는 경우(캐시 적중) 완료 상태 작업으로 저장"""
+        job = self._new_job(meta)
+        job.update({"status": "done", "stages": {stage: True for stage in JOB_STAGES}, "result": result})
+        self._store.set(self._key(job["job_id"]), job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._store.get(self._key(job_id))
+
+    @staticmethod
+    def _new_job(meta: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            "job_id": uuid.uuid4().hex,
+            "status": "queued",
+            "created_at": now,
+            "updated_at": now,
+            "stages": {stage: False for stage in JOB_STAGES},
+            "result": {},
+            "error": None,
+            **(meta or {}),
+        }
+
+    def _update(self, job_id: str, **changes: Any) -> None:
+        # 작업 문서는 실행 중인 프로세스만 갱신하므로 프로세스 내 잠금으로 충분
+        with self._lock:
+            job = self._store.get(self._key(job_id))
+            if job is None or job.get("status") in ("done", "error"):
+                return
+            stage = changes.pop("stage", None)
+            partial = changes.pop("partial", None)
+            if stage:
+                job["stages"][stage] = True
+            if partial:
+                job["result"].update(partial)
+            job.update(changes)
+            job["updated_at"] = time.time()
+            self._store.set(self._key(job_id), job)
+
+    def _run(self, job_id: str, work: Callable[[ProgressCallback], Dict[str, Any]]) -> None:
+        self._update(job_id, status="running", started_at=time.time())
+
+        def _progress(stage: str, partial: Dict[str, Any]) -> None:
+            self._update(job_id, stage=stage, partial=partial)
+
+        try:
+            result = work(_progress)
+            self._update(job_id, status="done", result=result, finished_at=time.time(),
+                         stages={stage: True for stage in JOB_STAGES})
+            self._count("done")
+        except Exception as exc:
+            print(f"[ERROR] 이미지 분석 작업 실패 ({job_id}): {exc}")
+            self._update(job_id, status="error", error=f"이미지 분석 중 오류가 발생했습니다: {exc}",
+                         finished_at=time.time())
+            self._count("error")
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["active"] = self._active
+        stats["workers"] = self._workers
+        stats["queue_max"] = self._queue_max
+        return stats
+
+
+vision_jobs = VisionJobRunner(
+    open_store(
+        "vision_jobs",
+        backend=VISION_JOBS_BACKEND,
+        max_entries=VISION_JOB_MAX_ENTRIES,
+        ttl_sec=VISION_JOB_TTL_SEC,
+    )
+)
+
+
+__all__ = [
+    "JOB_STAGES",
+    "JobQueueFull",
+    "VISION_JOB_POLL_AFTER_SEC",
+    "VisionJobRunner",
+    "vision_jobs",
+]
@@ -149,17 +149,20 @@ function displayImagePreviewMessage(file) {
     reader.readAsDataURL(file);
 }
 
+const VISION_JOB_TIMEOUT_MS = 120000;
+
 async function requestVisionAnalysis(file) {
     const formData = new FormData();
     formData.append('file', file, file.name || 'image.jpg');
     
     const isProduction = window.location.hostname !== 'localhost' && window.location.hostname !== '127.0.0.1';
     // FormData는 프록시를 통과할 수 없으므로, 프로덕션에서는 직접 AWS URL 사용 (CORS 허용 필요)
-    const visionUrl = isProduction 
-        ? 'http://kdafinal-backend-env.eba-spmee7zz.ap-northeast-2.elasticbeanstalk.com/api/vision/analyze-image'
-        : buildApiUrl(PYTHON_API_URL, 'vision/analyze-image');
+    // 분석은 비동기 작업으로 제출하고 완료될 때까지 폴링 (서버 요청 스레드를 오래 붙잡지 않음)
+    const jobsUrl = isProduction 
+        ? 'http://kdafinal-backend-env.eba-spmee7zz.ap-northeast-2.elasticbeanstalk.com/api/vision/jobs'
+        : buildApiUrl(PYTHON_API_URL, 'vision/jobs');
 
-    const response = await fetch(visionUrl, {
+    const response = await fetch(jobsUrl, {
         method: 'POST',
         body: formData
     });
@@ -169,7 +172,28 @@ async function requestVisionAnalysis(file) {
         throw new Error(`이미지 분석 API 오류 (${response.status}): ${errorText}`);
     }
 
-    return response.json();
+    let job = await response.json();
+    const deadline = Date.now() + VISION_JOB_TIMEOUT_MS;
+    while (job.status === 'queued' || job.status === 'running') {
+        if (Date.now() > deadline) {
+            throw new Error('이미지 분석 시간이 초과되었습니다.');
+        }
+        await new Promise(resolve => setTimeout(resolve, (job.poll_after || 1) * 1000));
+        const pollUrl = isProduction
+            ? `${jobsUrl}/${job.job_id}`
+            : buildApiUrl(PYTHON_API_URL, `vision/jobs/${job.job_id}`);
+        const pollResponse = await fetch(pollUrl);
+        if (!pollResponse.ok) {
+            const errorText = await pollResponse.text();
+            throw new Error(`이미지 분석 작업 조회 오류 (${pollResponse.status}): ${errorText}`);
+        }
+        job = await pollResponse.json();
+    }
+
+    if (job.status === 'error') {
+        throw new Error(job.error || '이미지 분석 작업이 실패했습니다.');
+    }
+    return job.result;
 }
 
 function addVisionResultMessage(result) {